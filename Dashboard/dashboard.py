@@ -4,7 +4,9 @@ import sys
 import pygame
 import math
 
-from EightQueensPuzzle.launch_game import launch_eight_queens
+from EightQueensPuzzle.game_host import get_game_host
+from EightQueensPuzzle.launch_game import launch_eight_queens, prewarm_eight_queens
+from EightQueensPuzzle.solution_catalog import MAX_BOARD_SIZE, MIN_BOARD_SIZE
 
 try:
     from Dashboard.name_enter_ui.name_input_popup import NameInputPopup, Colors
@@ -52,6 +54,12 @@ class GameHub:
 
         self.game_buttons = []
 
+        # board size for the next Eight Queens game, changed with left/right
+        self.queens_board_size = 8
+
+        # Eight Queens runs in a long-lived host process, start it now
+        prewarm_eight_queens()
+
     def draw_animated_background(self):
         # Create animated colors
         time_factor = pygame.time.get_ticks() * 0.001
@@ -202,6 +210,16 @@ class GameHub:
         instruction_rect = instruction_surface.get_rect(center=(self.SCREEN_WIDTH // 2, 570))
         self.screen.blit(instruction_surface, instruction_rect)
 
+        size = self.queens_board_size
+        size_text = f"Eight Queens board: {size}x{size}  (Left/Right arrows to change)"
+        size_surface = self.text_font.render(size_text, True, Colors.WHITE)
+        size_rect = size_surface.get_rect(center=(self.SCREEN_WIDTH // 2, 610))
+        self.screen.blit(size_surface, size_rect)
+
+    def change_queens_board_size(self, step):
+        self.queens_board_size = max(MIN_BOARD_SIZE, min(MAX_BOARD_SIZE, self.queens_board_size + step))
+        return self.queens_board_size
+
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -210,6 +228,9 @@ class GameHub:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif not self.show_name_popup and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                    step = 1 if event.key == pygame.K_RIGHT else -1
+                    self.change_queens_board_size(step)
 
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1 and not self.show_name_popup:
@@ -252,6 +273,7 @@ class GameHub:
             self.draw()
             self.clock.tick(self.FPS)
 
+        get_game_host().stop()
         pygame.quit()
 
     def launch_game(self, game_id, game_name):
@@ -259,7 +281,7 @@ class GameHub:
         if (game_id == "eight_queens" or
                 "eight queens" in game_name.lower() or
                 "queens" in game_name.lower()):
-            launch_eight_queens(self)
+            launch_eight_queens(self, self.queens_board_size)
         elif "Coming Soon" in game_name:
             print(f"{game_name} is not yet implemented.")
         else:
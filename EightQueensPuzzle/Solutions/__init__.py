@@ -0,0 +1,2 @@
+# N-Queens solver backends
+from EightQueensPuzzle.Solutions.bitboard import count_solutions, iter_chunks, iter_solutions
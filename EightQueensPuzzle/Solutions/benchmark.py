@@ -0,0 +1,160 @@
+import argparse
+import csv
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+
+from EightQueensPuzzle.Solutions.bitboard import count_solutions, iter_solutions, solve_eight_queens_bitboard
+from EightQueensPuzzle.Solutions.multiprocess import solve_eight_queens_multiprocess
+from EightQueensPuzzle.Solutions.sequential import solve_eight_queens_sequential
+from EightQueensPuzzle.Solutions.symmetry import solve_eight_queens_symmetric
+from EightQueensPuzzle.Solutions.threaded import solve_eight_queens_threaded
+
+# Standalone benchmark for every N-Queens backend. No database is touched:
+# each solver is warmed up, timed over several repetitions with
+# perf_counter_ns, then run once more under tracemalloc for peak memory
+# (a separate run, because tracing slows the solver down a lot). Results
+# go to CSV and JSON with the same columns every time so runs from
+# different commits can be compared.
+
+SOLVERS = {
+    "sequential": solve_eight_queens_sequential,
+    "threaded": solve_eight_queens_threaded,
+    "bitboard": solve_eight_queens_bitboard,
+    "multiprocess": solve_eight_queens_multiprocess,
+    "symmetric": lambda N: solve_eight_queens_symmetric(N, use_cache=False),
+    "stream": lambda N: sum(1 for _ in iter_solutions(N)),
+    "count": count_solutions,
+}
+
+RESULT_FIELDS = ["solver", "N", "solutions", "repeats", "median_ms", "p95_ms", "min_ms", "max_ms", "peak_memory_kib"]
+
+DEFAULT_OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmark_results")
+
+def percentile(values, percent):
+    # nearest-rank percentile
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+def solution_total(result):
+    # solvers return either the solution list or just the count
+    return result if isinstance(result, int) else len(result)
+
+def benchmark_solver(name, N, repeats=5, warmup=1, measure_memory=True):
+    solver = SOLVERS[name]
+
+    for _ in range(warmup):
+        solver(N)
+
+    timings_ns = []
+    solutions = None
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        result = solver(N)
+        timings_ns.append(time.perf_counter_ns() - start)
+        solutions = solution_total(result)
+
+    peak_memory_kib = None
+    if measure_memory:
+        # only this process is traced; pool workers are not included
+        tracemalloc.start()
+        try:
+            solver(N)
+            peak_memory_kib = tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+
+    timings_ms = [t / 1_000_000 for t in timings_ns]
+    return {
+        "solver": name,
+        "N": N,
+        "solutions": solutions,
+        "repeats": repeats,
+        "median_ms": statistics.median(timings_ms),
+        "p95_ms": percentile(timings_ms, 95),
+        "min_ms": min(timings_ms),
+        "max_ms": max(timings_ms),
+        "peak_memory_kib": peak_memory_kib,
+    }
+
+def run_benchmark(solvers=None, sizes=range(4, 11), repeats=5, warmup=1, measure_memory=True):
+    solvers = list(SOLVERS) if solvers is None else list(solvers)
+    unknown = [name for name in solvers if name not in SOLVERS]
+    if unknown:
+        raise ValueError(f"Unknown solver(s): {', '.join(unknown)}")
+
+    print(f"{'solver':<13} {'N':>3} {'solutions':>10} {'median(ms)':>11} {'p95(ms)':>10} {'peak(KiB)':>10}")
+    rows = []
+    for N in sizes:
+        for name in solvers:
+            row = benchmark_solver(name, N, repeats, warmup, measure_memory)
+            rows.append(row)
+            peak = "-" if row["peak_memory_kib"] is None else f"{row['peak_memory_kib']:.1f}"
+            print(f"{name:<13} {N:>3} {row['solutions']:>10} {row['median_ms']:>11.3f} {row['p95_ms']:>10.3f} {peak:>10}")
+    return rows
+
+def environment_info():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+def write_results(rows, output_dir=DEFAULT_OUTPUT_DIR, label=None):
+    os.makedirs(output_dir, exist_ok=True)
+    info = environment_info()
+    label = label or f"{time.strftime('%Y%m%d_%H%M%S')}_{info['commit'] or 'nocommit'}"
+
+    csv_path = os.path.join(output_dir, f"nqueens_benchmark_{label}.csv")
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    json_path = os.path.join(output_dir, f"nqueens_benchmark_{label}.json")
+    with open(json_path, "w") as f:
+        json.dump({"environment": info, "results": rows}, f, indent=2)
+
+    return csv_path, json_path
+
+def parse_sizes(text):
+    # "8" or "4-10"
+    if "-" in text:
+        low, high = text.split("-", 1)
+        return range(int(low), int(high) + 1)
+    return range(int(text), int(text) + 1)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the N-Queens solver backends")
+    parser.add_argument("--solvers", nargs="+", default=list(SOLVERS), choices=list(SOLVERS))
+    parser.add_argument("--sizes", type=parse_sizes, default=range(4, 11), help="board size or range, e.g. 4-10")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    args = parser.parse_args(argv)
+
+    rows = run_benchmark(args.solvers, args.sizes, args.repeats, args.warmup, not args.no_memory)
+    csv_path, json_path = write_results(rows, args.output_dir)
+    print(f"\nResults written to:\n  {csv_path}\n  {json_path}")
+    return rows
+
+if __name__ == "__main__":
+    main()
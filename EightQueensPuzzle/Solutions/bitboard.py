@@ -0,0 +1,261 @@
+import time
+
+# Bitboard backend: columns and both diagonals are kept as integer masks,
+# so checking a square is a single AND instead of a scan over earlier rows.
+# Firestore is only imported inside find_max_solutions_bitboard so the engine
+# stays importable without firebase_admin (benchmarks, worker processes).
+
+# bump when the search changes; cached solver runs are keyed on it
+SOLVER_VERSION = 1
+
+def solve_eight_queens_bitboard(N=8):
+    return solve_from_prefix(N, [])
+
+def solve_from_prefix(N, prefix):
+    # all solutions whose first rows are fixed to prefix
+    full_mask = (1 << N) - 1
+    placement = [0] * N
+    all_solutions = []
+
+    cols = diag_left = diag_right = 0
+    row = 0
+    while row < len(prefix):
+        bit = 1 << prefix[row]
+        if bit & (cols | diag_left | diag_right):
+            return all_solutions      # prefix already attacks itself
+        placement[row] = prefix[row]
+        cols = cols | bit
+        diag_left = ((diag_left | bit) << 1) & full_mask
+        diag_right = (diag_right | bit) >> 1
+        row = row + 1
+
+    def place_queen(row, cols, diag_left, diag_right):
+        if row == N:
+            # copy the placement, it is reused for the next branch
+            all_solutions.append(placement[:])
+            return
+
+        # free squares in this row
+        available = full_mask & ~(cols | diag_left | diag_right)
+        while available:
+            bit = available & -available     # lowest free column first
+            available ^= bit
+            placement[row] = bit.bit_length() - 1
+            place_queen(
+                row + 1,
+                cols | bit,
+                ((diag_left | bit) << 1) & full_mask,
+                (diag_right | bit) >> 1
+            )
+
+    ##starting point
+    place_queen(row, cols, diag_left, diag_right)
+    return all_solutions
+
+def valid_prefixes(N, depth):
+    # every non-attacking placement of the first `depth` rows, in column order
+    full_mask = (1 << N) - 1
+    prefixes = []
+
+    def extend(prefix, cols, diag_left, diag_right):
+        if len(prefix) == depth:
+            prefixes.append(prefix)
+            return
+        available = full_mask & ~(cols | diag_left | diag_right)
+        while available:
+            bit = available & -available
+            available ^= bit
+            extend(
+                prefix + [bit.bit_length() - 1],
+                cols | bit,
+                ((diag_left | bit) << 1) & full_mask,
+                (diag_right | bit) >> 1
+            )
+
+    extend([], 0, 0, 0)
+    return prefixes
+
+def is_valid_solution(solution):
+    # checks one full board directly, no search needed
+    N = len(solution)
+    cols = diag_left = diag_right = 0
+    for row in range(N):
+        col = solution[row]
+        if not 0 <= col < N:
+            return False
+        bit = 1 << col
+        left = 1 << (row + col)            # queens with equal row + col share a diagonal
+        right = 1 << (row - col + N - 1)   # ... and so do equal row - col
+        if cols & bit or diag_left & left or diag_right & right:
+            return False
+        cols |= bit
+        diag_left |= left
+        diag_right |= right
+    return True
+
+def iter_solutions(N=8):
+    # yields solutions one at a time; only the current placement is kept,
+    # so memory does not grow with the number of solutions
+    if N < 1:
+        return
+    full_mask = (1 << N) - 1
+    placement = [0] * N
+    cols = [0] * N
+    diag_left = [0] * N
+    diag_right = [0] * N
+    untried = [0] * N       # columns not yet tried in each row
+    untried[0] = full_mask
+
+    row = 0
+    while row >= 0:
+        available = untried[row]
+        if not available:
+            row = row - 1       # backtrack
+            continue
+
+        bit = available & -available
+        untried[row] = available ^ bit
+        placement[row] = bit.bit_length() - 1
+
+        if row == N - 1:
+            yield placement[:]
+            continue
+
+        cols[row + 1] = cols[row] | bit
+        diag_left[row + 1] = ((diag_left[row] | bit) << 1) & full_mask
+        diag_right[row + 1] = (diag_right[row] | bit) >> 1
+        row = row + 1
+        untried[row] = full_mask & ~(cols[row] | diag_left[row] | diag_right[row])
+
+def count_solutions(N=8):
+    # counts without building any solution lists
+    full_mask = (1 << N) - 1
+
+    def count_from(cols, diag_left, diag_right):
+        if cols == full_mask:
+            return 1
+        total = 0
+        available = full_mask & ~(cols | diag_left | diag_right)
+        while available:
+            bit = available & -available
+            available ^= bit
+            total += count_from(
+                cols | bit,
+                ((diag_left | bit) << 1) & full_mask,
+                (diag_right | bit) >> 1
+            )
+        return total
+
+    return count_from(0, 0, 0)
+
+# search nodes one hint may visit (a few ms), so hints keep up with clicks
+HINT_NODE_LIMIT = 10000
+
+def analyze_partial(N, queens, node_limit=HINT_NODE_LIMIT):
+    # hints for a board with queens in any rows: queens is a set of (row, col)
+    full_mask = (1 << N) - 1
+    fixed = [-1] * N
+    attacked_queens = set()
+
+    for (row, col) in queens:
+        for (other_row, other_col) in queens:
+            if (row, col) == (other_row, other_col):
+                continue
+            if (row == other_row or col == other_col
+                    or abs(row - other_row) == abs(col - other_col)):
+                attacked_queens.add((row, col))
+        fixed[row] = col
+
+    # columns each placed queen attacks in every row
+    attacked = [0] * N
+    for (q_row, q_col) in queens:
+        for row in range(N):
+            distance = abs(row - q_row)
+            attacked[row] |= 1 << q_col
+            if q_col - distance >= 0:
+                attacked[row] |= 1 << (q_col - distance)
+            if q_col + distance < N:
+                attacked[row] |= 1 << (q_col + distance)
+
+    legal_cells = {}
+    for row in range(N):
+        if fixed[row] == -1:
+            free = full_mask & ~attacked[row]
+            legal_cells[row] = [col for col in range(N) if free >> col & 1]
+
+    result = {
+        "attacked_queens": attacked_queens,
+        "legal_cells": legal_cells,
+        "solvable": False,
+        "completions": 0,
+        "exact": True,
+    }
+    # propagation: an attacked queen or an empty row means nothing completes
+    if attacked_queens or any(not cols for cols in legal_cells.values()):
+        return result
+
+    nodes = 0
+
+    def count_from(row, cols, diag_left, diag_right):
+        nonlocal nodes
+        if row == N:
+            return 1
+        nodes += 1
+        if nodes > node_limit:
+            return 0
+        if fixed[row] != -1:
+            bit = 1 << fixed[row]
+            if bit & (cols | diag_left | diag_right):
+                return 0
+            available = bit
+        else:
+            available = full_mask & ~(cols | diag_left | diag_right | attacked[row])
+        total = 0
+        while available:
+            bit = available & -available
+            available ^= bit
+            total += count_from(
+                row + 1,
+                cols | bit,
+                ((diag_left | bit) << 1) & full_mask,
+                (diag_right | bit) >> 1
+            )
+        return total
+
+    completions = count_from(0, 0, 0, 0)
+    result["completions"] = completions
+    result["exact"] = nodes <= node_limit
+    # a cut-off search with no completion yet does not prove there is none
+    result["solvable"] = True if completions else (False if result["exact"] else None)
+    return result
+
+def iter_chunks(solutions, chunk_size=500):
+    # groups any iterable of solutions into lists of at most chunk_size
+    chunk = []
+    for solution in solutions:
+        chunk.append(solution)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def find_max_solutions_bitboard(player_name=None, N=8):
+    from EightQueensPuzzle.eightqueen_dbUtil import save_program_solutions
+
+    start_time = time.time()
+    all_solutions = solve_eight_queens_bitboard(N)
+    end_time = time.time()
+    time_taken = end_time - start_time
+
+    try:
+        save_program_solutions(all_solutions, N=N, program_type = "bitboard", time_took = time_taken, player_name = player_name)
+    except Exception as e:
+        print(f"Error saving solutions to database: {e}")
+
+    print("Total number of solutions:", len(all_solutions))
+
+    i = 0
+    while i < 5 and i < len(all_solutions):
+        print("Solution", i + 1, ":", all_solutions[i])
+        i = i + 1
@@ -0,0 +1,111 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from EightQueensPuzzle.Solutions.bitboard import solve_from_prefix, valid_prefixes
+
+# Process-pool backend. Threads cannot speed up this search because the GIL
+# runs one Python thread at a time, so the tree is split into work units
+# (valid placements of the first 2-3 rows) that separate processes solve.
+# This module must not import Firestore at top level: every pool worker
+# re-imports it on platforms that spawn processes.
+
+def solve_work_unit(work_unit):
+    N, prefix = work_unit
+    return solve_from_prefix(N, prefix)
+
+def solve_eight_queens_multiprocess(N=8, prefix_rows=None, max_workers=None):
+    # deeper split for big boards so there are enough units to balance
+    if prefix_rows is None:
+        prefix_rows = 2 if N < 10 else 3
+    prefix_rows = min(prefix_rows, N)
+
+    work_units = [(N, prefix) for prefix in valid_prefixes(N, prefix_rows)]
+
+    final_solutions = []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        # chunksize=1: an idle worker takes the next unit as soon as it is
+        # free; map() still returns results in submission (column) order
+        for solutions in pool.map(solve_work_unit, work_units, chunksize=1):
+            final_solutions.extend(solutions)
+
+    return final_solutions
+
+# the list-based solver takes ~8s at N=12 and minutes beyond, so the
+# algorithm comparison stops here
+SEQUENTIAL_MAX_N = 11
+
+def report_speedup(sizes=range(8, 15), max_workers=None):
+    # The parallel gain is measured against the same bitboard search in one
+    # process; the list-based sequential solver is shown separately (up to
+    # SEQUENTIAL_MAX_N) for the gain from the algorithm itself
+    from EightQueensPuzzle.Solutions.bitboard import solve_eight_queens_bitboard
+    from EightQueensPuzzle.Solutions.sequential import solve_eight_queens_sequential
+
+    workers = max_workers or os.cpu_count()
+    print(f"Process pool workers: {workers}")
+    print(f"{'N':>3} {'solutions':>10} {'sequential(s)':>14} {'bitboard(s)':>12} "
+          f"{'process pool(s)':>16} {'pool gain':>10} {'vs sequential':>14}")
+
+    rows = []
+    for N in sizes:
+        sequential_time = None
+        if N <= SEQUENTIAL_MAX_N:
+            start_time = time.perf_counter()
+            sequential_solutions = solve_eight_queens_sequential(N)
+            sequential_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        bitboard_solutions = solve_eight_queens_bitboard(N)
+        bitboard_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        pool_solutions = solve_eight_queens_multiprocess(N, max_workers=max_workers)
+        pool_time = time.perf_counter() - start_time
+
+        if pool_solutions != bitboard_solutions:
+            raise RuntimeError(f"Process pool solutions differ from bitboard for N={N}")
+        if sequential_time is not None and pool_solutions != sequential_solutions:
+            raise RuntimeError(f"Process pool solutions differ from sequential for N={N}")
+
+        # pool gain < 1 means process start-up costs more than the search
+        pool_gain = bitboard_time / pool_time if pool_time > 0 else float("inf")
+        speedup = None
+        if sequential_time is not None:
+            speedup = sequential_time / pool_time if pool_time > 0 else float("inf")
+        rows.append({
+            "N": N,
+            "solutions": len(pool_solutions),
+            "sequential_time": sequential_time,
+            "bitboard_time": bitboard_time,
+            "multiprocess_time": pool_time,
+            "pool_gain": pool_gain,
+            "speedup": speedup,
+        })
+        sequential_text = f"{sequential_time:>14.4f}" if sequential_time is not None else f"{'-':>14}"
+        speedup_text = f"{speedup:>13.2f}x" if speedup is not None else f"{'-':>14}"
+        print(f"{N:>3} {len(pool_solutions):>10} {sequential_text} {bitboard_time:>12.4f} "
+              f"{pool_time:>16.4f} {pool_gain:>9.2f}x {speedup_text}")
+
+    return rows
+
+def find_max_solutions_multiprocess(player_name=None, N=8):
+    from EightQueensPuzzle.eightqueen_dbUtil import save_program_solutions
+
+    start_time = time.time()
+    all_solutions = solve_eight_queens_multiprocess(N)
+    end_time = time.time()
+    time_taken = end_time - start_time
+
+    try:
+        save_program_solutions(all_solutions, N=N, program_type = "multiprocess", time_took = time_taken, player_name = player_name)
+    except Exception as e:
+        print(f"Error saving solutions to database: {e}")
+
+    i = 0
+    while i < 5 and i < len(all_solutions):
+        print("Solution", i + 1, ":", all_solutions[i])
+        i = i + 1
+
+if __name__ == "__main__":
+    report_speedup()
@@ -1,7 +1,12 @@
 import time
-from EightQueensPuzzle.eightqueen_dbUtil import save_program_solutions
+
+# bump when the search changes; cached solver runs are keyed on it
+SOLVER_VERSION = 2
 
 def solve_eight_queens_sequential(N=8):
+    return list(iter_solutions_sequential(N))
+
+def iter_solutions_sequential(N=8):
 
     def is_safe(current_solution, row, col):
         r = 0
@@ -18,43 +23,46 @@ def solve_eight_queens_sequential(N=8):
             r = r + 1
         return True
 
-    # recursive function
-    def checkQueenPosition(current_solution, row):
-        if row == N:
-            return [current_solution]
+    # recursive generator: yields each solution instead of collecting lists
+    placement = [0] * N
 
-        all_solutions = []
+    def checkQueenPosition(row):
+        if row == N:
+            yield placement[:]
+            return
 
         for col in range(N):
-            if is_safe(current_solution, row, col):
-                new_solution = current_solution + [col]
-                result = checkQueenPosition(new_solution, row + 1)
-                # add results to all solution
-                temp_index = 0
-                while temp_index < len(result):
-                    all_solutions = all_solutions + [result[temp_index]]
-                    temp_index = temp_index + 1
-
-        return all_solutions
+            if is_safe(placement, row, col):
+                placement[row] = col
+                yield from checkQueenPosition(row + 1)
 
     ##starting point
-    solutions = checkQueenPosition([], 0)
-    return solutions
+    return checkQueenPosition(0)
+
+def find_max_solutions_sequantial(player_name=None, N=8):
+    from EightQueensPuzzle.eightqueen_dbUtil import save_program_solutions
 
-def find_max_solutions_sequantial(player_name=None):
+    # time one full pass over the stream, keeping only what gets printed
+    shown_solutions = []
+    solutions_count = 0
     start_time = time.time()
-    all_solutions = solve_eight_queens_sequential()
+    for solution in iter_solutions_sequential(N):
+        if solutions_count < 92:
+            shown_solutions.append(solution)
+        solutions_count = solutions_count + 1
     end_time = time.time()
     time_taken = end_time - start_time
 
     try:
-        save_program_solutions(all_solutions, N=8, program_type = "sequential", time_took = time_taken, player_name = player_name)
+        # the writer pulls a fresh stream in chunks, only if it needs to store it
+        save_program_solutions(iter_solutions_sequential(N), N=N, program_type = "sequential", time_took = time_taken,
+                               player_name = player_name, solutions_count = solutions_count)
     except Exception as e:
         print(f"Error saving solutions to database: {e}")
 
-    print("Total number of solutions:", len(all_solutions))
+    print("Total number of solutions:", solutions_count)
 
     i = 0
-    while i < 92 and i < len(all_solutions):
-        print("Solution", i+1, ":", all_solutions[i])
-        i = i + 1
\ No newline at end of file
+    while i < len(shown_solutions):
+        print("Solution", i+1, ":", shown_solutions[i])
+        i = i + 1
@@ -0,0 +1,76 @@
+from bisect import bisect_left
+
+from EightQueensPuzzle.Solutions.bitboard import solve_from_prefix
+
+# Symmetry-reduced search. The 8 rotations/reflections of the board (the
+# dihedral group) map solutions to solutions, so only the first half of the
+# columns in row 0 needs searching (plus the middle column for odd N); the
+# rest of the board is covered by mirroring. Solutions that are rotations or
+# reflections of each other form one "family", identified by its fundamental
+# solution (the smallest of the 8 variants).
+
+_fundamentals_cache = {}
+
+def symmetries(solution):
+    # all 8 images of a solution (solution[row] = col)
+    N = len(solution)
+    rot90 = [0] * N
+    rot270 = [0] * N
+    transpose = [0] * N
+    anti_transpose = [0] * N
+    for row in range(N):
+        col = solution[row]
+        rot90[col] = N - 1 - row
+        rot270[N - 1 - col] = row
+        transpose[col] = row
+        anti_transpose[N - 1 - col] = N - 1 - row
+
+    rot180 = [N - 1 - col for col in reversed(solution)]
+    mirror_cols = [N - 1 - col for col in solution]
+    mirror_rows = list(reversed(solution))
+
+    return [list(solution), rot90, rot180, rot270,
+            mirror_cols, mirror_rows, transpose, anti_transpose]
+
+def canonical_form(solution):
+    return min(tuple(image) for image in symmetries(solution))
+
+def solve_fundamental_solutions(N=8, use_cache=True):
+    if use_cache and N in _fundamentals_cache:
+        return [list(sol) for sol in _fundamentals_cache[N]]
+
+    # every family has a member with row 0 in the left half or the middle
+    first_cols = list(range(N // 2))
+    if N % 2 == 1:
+        first_cols.append(N // 2)
+
+    fundamentals = set()
+    for col in first_cols:
+        for solution in solve_from_prefix(N, [col]):
+            fundamentals.add(canonical_form(solution))
+
+    _fundamentals_cache[N] = sorted(fundamentals)
+    return [list(sol) for sol in _fundamentals_cache[N]]
+
+def expand_orbits(fundamentals):
+    # full solution set, in the same order as the other solvers
+    all_solutions = set()
+    for solution in fundamentals:
+        for image in symmetries(solution):
+            all_solutions.add(tuple(image))
+    return [list(sol) for sol in sorted(all_solutions)]
+
+def solve_eight_queens_symmetric(N=8, use_cache=True):
+    return expand_orbits(solve_fundamental_solutions(N, use_cache))
+
+def fundamental_family(solution):
+    # 1-based family number of a solution, or None if it is not a solution
+    N = len(solution)
+    canonical = canonical_form(solution)
+    solve_fundamental_solutions(N)
+    fundamentals = _fundamentals_cache[N]
+
+    index = bisect_left(fundamentals, canonical)
+    if index < len(fundamentals) and fundamentals[index] == canonical:
+        return index + 1
+    return None
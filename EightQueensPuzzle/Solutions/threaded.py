@@ -1,6 +1,8 @@
 import threading
 import time
-from EightQueensPuzzle.eightqueen_dbUtil import save_program_solutions
+
+# bump when the search changes; cached solver runs are keyed on it
+SOLVER_VERSION = 2
 
 def solve_eight_queens_threaded(N=8):
 
@@ -28,27 +30,20 @@ def solve_eight_queens_threaded(N=8):
 
     def backtrack(current_solution, row):
         if row == N:
-            return [current_solution]   # one full solution
+            yield current_solution[:]   # one full solution
+            return
 
-        all_solutions = []
         col = 0
         while col < N:
             if is_safe(current_solution, row, col):
-                new_solution = current_solution + [col]   # concat
-                result = backtrack(new_solution, row + 1)
-
-                i = 0
-                while i < len(result):
-                    all_solutions = all_solutions + [result[i]]
-                    i = i + 1
+                current_solution[row] = col
+                yield from backtrack(current_solution, row + 1)
 
             col = col + 1
 
-        return all_solutions
-
     def worker(start_col):
-        partial_solution = [start_col]
-        sols = backtrack(partial_solution, 1)
+        partial_solution = [start_col] + [0] * (N - 1)
+        sols = list(backtrack(partial_solution, 1))
 
         lock.acquire()
         try:
@@ -75,14 +70,16 @@ def solve_eight_queens_threaded(N=8):
 
     return final_solutions
 
-def find_max_solutions_threaded(player_name=None):
+def find_max_solutions_threaded(player_name=None, N=8):
+    from EightQueensPuzzle.eightqueen_dbUtil import save_program_solutions
+
     start_time = time.time()
-    all_solutions = solve_eight_queens_threaded()
+    all_solutions = solve_eight_queens_threaded(N)
     end_time = time.time() 
     time_taken = end_time - start_time
 
     try:
-        save_program_solutions(all_solutions, N=8, program_type = "threaded", time_took = time_taken, player_name = player_name)
+        save_program_solutions(all_solutions, N=N, program_type = "threaded", time_took = time_taken, player_name = player_name)
     except Exception as e:
         print(f"Error saving solutions to database: {e}")
 
@@ -1,26 +1,40 @@
 from tkinter import messagebox
 import math
+import time
 
+from EightQueensPuzzle.Solutions.bitboard import analyze_partial
 from EightQueensPuzzle.player_solutions import check_solution
-from EightQueensPuzzle.eightqueen_dbUtil import fetch_all_solutions
+from EightQueensPuzzle.solution_catalog import MAX_BOARD_SIZE, MIN_BOARD_SIZE, solution_count
+
+# the board always fills the same area, cells shrink as N grows
+BOARD_PIXELS = 560
 
 
 class EightQueensUI:
-    def __init__(self, root, player_name, tk=None):
+    def __init__(self, root, player_name, tk=None, frame_interval_ms=50, board_size=8):
+        if not MIN_BOARD_SIZE <= board_size <= MAX_BOARD_SIZE:
+            raise ValueError(f"Board size must be between {MIN_BOARD_SIZE} and {MAX_BOARD_SIZE}")
+
         self.root = root
         self.player_name = player_name
-        self.root.title("Eight Queens Puzzle ♕")
+        self.puzzle_name = "Eight Queens Puzzle" if board_size == 8 else f"{board_size} Queens Puzzle"
+        self.puzzle_title = f"{self.puzzle_name} ♕"
+        self.root.title(self.puzzle_title)
         self.root.geometry("1100x750")
         self.root.resizable(False, False)
         
         self.root.configure(bg='#1a1a2e')
 
-        self.board_size = 8
-        self.cell_size = 70
+        self.board_size = board_size
+        self.cell_size = BOARD_PIXELS // board_size
         self.queens = set()
-        self.remaining_queens = 8  # Initialize remaining queens counter
+        self.remaining_queens = board_size  # Initialize remaining queens counter
         
         self.animation_time = 0
+        # delay between background frames; raise it on slow machines
+        self.frame_interval_ms = frame_interval_ms
+        # canvas work per frame, see background_stats()
+        self.frame_stats = {"frames": 0, "items_created": 0, "items_updated": 0, "frame_time": 0.0}
         
         self.bg_canvas = tk.Canvas(
             root,
@@ -44,6 +58,8 @@ class EightQueensUI:
         self.canvas.place(x=self.board_offset_x, y=self.board_offset_y)
         self.canvas.bind("<Button-1>", self.on_click)
         
+        self.build_background()
+        self.update_hint()
         self.animate_background()
 
         style_btn = {
@@ -105,7 +121,8 @@ class EightQueensUI:
     def draw_queen(self, row, col):
         x = col * self.cell_size + self.cell_size // 2
         y = row * self.cell_size + self.cell_size // 2
-        self.canvas.create_text(x, y, text="♕", font=("Arial", 28), fill="#DAA520")
+        font_size = max(10, self.cell_size * 2 // 5)
+        self.canvas.create_text(x, y, text="♕", font=("Arial", font_size), fill="#DAA520")
 
     def on_click(self, event):
         #mouse click
@@ -115,62 +132,63 @@ class EightQueensUI:
         if (row, col) in self.queens:
             self.queens.remove((row, col))
         else:
-            if len(self.queens) < 8:
+            if len(self.queens) < self.board_size:
                 self.queens.add((row, col))
             else:
-                messagebox.showwarning("Limit", "You can only place 8 queens.")
+                messagebox.showwarning("Limit", f"You can only place {self.board_size} queens.")
 
         self.draw_board()
+        self.update_hint()
 
     def clear_board(self):
         self.queens.clear()
         self.draw_board()
+        self.update_hint()
+
+    def update_hint(self):
+        # live hint for the queens placed so far, searched with the bitboard core
+        hint = analyze_partial(self.board_size, self.queens)
+        if hint["attacked_queens"]:
+            text = f"{len(hint['attacked_queens'])} queens are under attack"
+        elif hint["solvable"] is False:
+            text = "No way to finish this board"
+        elif len(self.queens) == self.board_size:
+            text = "Board complete, check your solution"
+        elif hint["solvable"] is None:
+            text = "Too many options to count"
+        elif not hint["exact"]:
+            text = f"{hint['completions']}+ ways to finish"
+        else:
+            text = f"{hint['completions']} ways to finish"
+        self.hint = hint
+        self.bg_canvas.itemconfigure(self.bg_hint_text, text=f"Hint: {text}")
     
     def update_remaining_queens(self):
-        remaining = 8 - len(self.queens)
+        remaining = self.board_size - len(self.queens)
   
         self.remaining_queens = remaining
     
-    def animate_background(self):
-        
-        self.animation_time += 0.02
-        
-        r1 = int(135 + 30 * math.cos(self.animation_time))
-        g1 = int(206 + 20 * math.sin(self.animation_time * 1.2))
-        b1 = int(250 + 5 * math.cos(self.animation_time * 0.8))
-        
-        r2 = int(25 + 15 * math.sin(self.animation_time * 0.7))
-        g2 = int(25 + 10 * math.cos(self.animation_time * 1.1))
-        b2 = int(112 + 20 * math.sin(self.animation_time * 0.9))
-        
-        self.bg_canvas.delete("all")
-        
+    def build_background(self):
+        # create every background item once; frames only recolour/move them
+        created_before = len(self.bg_canvas.find_all())
+
+        self.bg_bands = []
+        self.bg_band_colors = []
         for y in range(0, 750, 5):
-            ratio = y / 750
-            r = int(r1 * (1 - ratio) + r2 * ratio)
-            g = int(g1 * (1 - ratio) + g2 * ratio)
-            b = int(b1 * (1 - ratio) + b2 * ratio)
-            
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            self.bg_canvas.create_rectangle(0, y, 1100, y+5, fill=color, outline=color)
-        
+            band = self.bg_canvas.create_rectangle(0, y, 1100, y+5, fill="", outline="")
+            self.bg_bands.append(band)
+            self.bg_band_colors.append(None)
+
+        self.bg_particles = []
+        self.bg_particle_colors = []
         for i in range(15):
-            x = (i * 60 + math.sin(self.animation_time + i) * 40) % 1100
-            y = (i * 50 + math.cos(self.animation_time * 0.7 + i) * 30) % 750
-            size = 2 + int(2 * math.sin(self.animation_time * 2 + i))
-            
-            alpha_val = int(100 + 50 * math.sin(self.animation_time * 3 + i))
-            if alpha_val > 150:
-                particle_color = "#ffffff"
-            else:
-                particle_color = "#dddddd"
-            
-            self.bg_canvas.create_oval(x-size, y-size, x+size, y+size, 
-                                     fill=particle_color, outline=particle_color)
+            particle = self.bg_canvas.create_oval(0, 0, 0, 0, fill="", outline="")
+            self.bg_particles.append(particle)
+            self.bg_particle_colors.append(None)
         
         self.bg_canvas.create_text(
             550, 30, 
-            text="Eight Queens Puzzle ♕",
+            text=self.puzzle_title,
             font=("Arial", 20, "bold"),
             fill="Black"
         )
@@ -202,15 +220,89 @@ class EightQueensUI:
                 fill="white"
             )
         
-        remaining = getattr(self, 'remaining_queens', 8)
-        self.bg_canvas.create_text(
+        self.bg_remaining_value = getattr(self, 'remaining_queens', self.board_size)
+        self.bg_remaining_text = self.bg_canvas.create_text(
             870, 300,
-            text=f"Remaining Queens: {remaining}",
+            text=f"Remaining Queens: {self.bg_remaining_value}",
             font=("Arial", 11, "bold"),
             fill="white"
         )
+
+        self.bg_hint_text = self.bg_canvas.create_text(
+            870, 330,
+            text="",
+            font=("Arial", 11, "bold"),
+            fill="white"
+        )
+
+        self.frame_stats["items_created"] += len(self.bg_canvas.find_all()) - created_before
+
+    def animate_background(self):
+        frame_start = time.perf_counter()
+        updates = 0
+        
+        self.animation_time += 0.02
+        
+        r1 = int(135 + 30 * math.cos(self.animation_time))
+        g1 = int(206 + 20 * math.sin(self.animation_time * 1.2))
+        b1 = int(250 + 5 * math.cos(self.animation_time * 0.8))
+        
+        r2 = int(25 + 15 * math.sin(self.animation_time * 0.7))
+        g2 = int(25 + 10 * math.cos(self.animation_time * 1.1))
+        b2 = int(112 + 20 * math.sin(self.animation_time * 0.9))
+        
+        for i, y in enumerate(range(0, 750, 5)):
+            ratio = y / 750
+            r = int(r1 * (1 - ratio) + r2 * ratio)
+            g = int(g1 * (1 - ratio) + g2 * ratio)
+            b = int(b1 * (1 - ratio) + b2 * ratio)
+            
+            color = f"#{r:02x}{g:02x}{b:02x}"
+            # the gradient drifts slowly, most bands keep their colour
+            if color != self.bg_band_colors[i]:
+                self.bg_canvas.itemconfigure(self.bg_bands[i], fill=color, outline=color)
+                self.bg_band_colors[i] = color
+                updates += 1
         
-        self.root.after(50, self.animate_background)
+        for i in range(15):
+            x = (i * 60 + math.sin(self.animation_time + i) * 40) % 1100
+            y = (i * 50 + math.cos(self.animation_time * 0.7 + i) * 30) % 750
+            size = 2 + int(2 * math.sin(self.animation_time * 2 + i))
+            
+            alpha_val = int(100 + 50 * math.sin(self.animation_time * 3 + i))
+            if alpha_val > 150:
+                particle_color = "#ffffff"
+            else:
+                particle_color = "#dddddd"
+            
+            self.bg_canvas.coords(self.bg_particles[i], x-size, y-size, x+size, y+size)
+            updates += 1
+            if particle_color != self.bg_particle_colors[i]:
+                self.bg_canvas.itemconfigure(self.bg_particles[i], fill=particle_color, outline=particle_color)
+                self.bg_particle_colors[i] = particle_color
+                updates += 1
+        
+        remaining = getattr(self, 'remaining_queens', self.board_size)
+        if remaining != self.bg_remaining_value:
+            self.bg_canvas.itemconfigure(self.bg_remaining_text, text=f"Remaining Queens: {remaining}")
+            self.bg_remaining_value = remaining
+            updates += 1
+
+        self.frame_stats["frames"] += 1
+        self.frame_stats["items_updated"] += updates
+        self.frame_stats["frame_time"] += time.perf_counter() - frame_start
+        
+        self.root.after(self.frame_interval_ms, self.animate_background)
+
+    def background_stats(self):
+        # average canvas work per background frame
+        frames = max(self.frame_stats["frames"], 1)
+        return {
+            "frames": self.frame_stats["frames"],
+            "items_created": self.frame_stats["items_created"],
+            "updates_per_frame": self.frame_stats["items_updated"] / frames,
+            "avg_frame_ms": self.frame_stats["frame_time"] / frames * 1000,
+        }
 
     def store_entered_solution(self):
         solution = [-1] * self.board_size
@@ -220,10 +312,10 @@ class EightQueensUI:
     
     def show_total_solutions_info(self):
         try:
-            solutions = fetch_all_solutions()
-            total_solutions = len(solutions)
+            # known counts, so large boards are never enumerated here
+            total_solutions = solution_count(self.board_size)
             message = (
-                f"Eight Queens Puzzle Challenge\n\n"
+                f"{self.puzzle_name} Challenge\n\n"
                 f"There are {total_solutions} valid solutions.\n\n"
                 f"Your task: Find all solutions where no two queens\n"
                 f"attack each other (horizontally, vertically, or diagonally).\n\n"
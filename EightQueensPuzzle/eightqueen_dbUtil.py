@@ -1,42 +1,74 @@
+import os
+
 import firebase_admin
 from firebase_admin import firestore, credentials
 
+from EightQueensPuzzle.Solutions.bitboard import iter_chunks
+
+# shared/mind-arena.json at the repo root; built from this file so it does
+# not depend on the working directory (the game host starts in the repo root)
+CREDENTIALS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "shared", "mind-arena.json")
+
 if not firebase_admin._apps:
     try:
-        cred = credentials.Certificate("../shared/mind-arena.json")
+        cred = credentials.Certificate(CREDENTIALS_PATH)
         firebase_admin.initialize_app(cred)
     except Exception as e:
         print(f"Firebase initialization error: {e}")
 
-def save_program_solutions(solutions, N, program_type, time_took=None, player_name=None):
+# Firestore accepts at most 500 writes per batch commit
+BATCH_LIMIT = 500
+
+def save_program_solutions(solutions, N, program_type, time_took=None, player_name=None, solutions_count=None,
+                           progress_callback=None):
+    # solutions can be a list or a generator; it is consumed in chunks
     db = firestore.client()
     all_sols = db.collection("eightqueens").document(f"{program_type}").collection(f"N{N}")
     
     # Check if solutions already exist
-    existing_docs = list(all_sols.stream())
-    
-    if not existing_docs:
+    if not collection_has_documents(all_sols):
         #if no solutions; save
-        for sol in solutions:
-            all_sols.add({
-                "solution": sol,
-                "board_size": N,
-            })
+        written = write_solutions_batched(db, all_sols, solutions, N, solutions_count, progress_callback)
+        if solutions_count is None:
+            solutions_count = written
     else:
         print(f"Solutions already exist in database. Skipping solution insertion.")
     
     # save game round with time took
     if time_took is not None:
-        save_game_round(program_type, N, player_name, time_took, len(solutions))
+        if solutions_count is None:
+            solutions_count = len(solutions)
+        save_game_round(program_type, N, player_name, time_took, solutions_count)
+
+def collection_has_documents(collection):
+    # reads at most one document
+    for _ in collection.limit(1).stream():
+        return True
+    return False
+
+def write_solutions_batched(db, collection, solutions, N, total=None, progress_callback=None):
+    # one commit per BATCH_LIMIT solutions instead of one request each
+    written = 0
+    for chunk in iter_chunks(solutions, BATCH_LIMIT):
+        batch = db.batch()
+        for sol in chunk:
+            batch.set(collection.document(), {
+                "solution": sol,
+                "board_size": N,
+            })
+        batch.commit()
+        written += len(chunk)
+
+        if progress_callback is not None:
+            progress_callback(written, total)
+    return written
         
 def save_game_round(program_type, N, player_name, time_took, solutions_count):
     db = firestore.client()
     game_rounds = db.collection("eightqueens").document("game_rounds").collection(f"{program_type}_N{N}")
     
-    from datetime import datetime
-    
-    existing_rounds = list(game_rounds.stream())
-    round_number = len(existing_rounds) + 1
+    round_number = allocate_round_number(db, program_type, N)
     round_id = f"round{round_number}"
     
     game_rounds.document(round_id).set({
@@ -45,22 +77,36 @@ def save_game_round(program_type, N, player_name, time_took, solutions_count):
         "time_taken": time_took,
         "solutions_count": solutions_count,
     })
-    
-def fetch_all_solutions():
-    db = firestore.client()
-    solutions_ref = db.collection("eightqueens").document("sequential").collection("N8")
 
-    docs = solutions_ref.stream()
-    all_solutions = []
-    for doc in docs:
-        data = doc.to_dict()
-        # stored solution is a list of row, col pairs
-        all_solutions.append(data['solution'])
-    return all_solutions
+def allocate_round_number(db, program_type, N):
+    # next round id from a counter document, incremented in a transaction so
+    # the cost does not grow with history and concurrent saves never collide
+    counter_ref = db.collection("eightqueens").document("game_rounds").collection("counters").document(f"{program_type}_N{N}")
+    game_rounds = db.collection("eightqueens").document("game_rounds").collection(f"{program_type}_N{N}")
 
-def fetch_found_solutions():
+    @firestore.transactional
+    def increment(transaction):
+        snapshot = counter_ref.get(transaction=transaction)
+        if snapshot.exists:
+            current = snapshot.to_dict().get("count", 0)
+        else:
+            # first save since counters were introduced: continue after old rounds
+            current = count_documents(game_rounds)
+        transaction.set(counter_ref, {"count": current + 1})
+        return current + 1
+
+    return increment(db.transaction())
+
+def count_documents(collection):
+    # aggregation query when the client supports it, otherwise a full stream
+    try:
+        return collection.count().get()[0][0].value
+    except AttributeError:
+        return len(list(collection.stream()))
+    
+def fetch_found_solutions(N=8):
     db = firestore.client()
-    found_solutions = db.collection("eightqueens").document("player_solutions").collection("N8")
+    found_solutions = db.collection("eightqueens").document("player_solutions").collection(f"N{N}")
     found_docs = found_solutions.stream()
     found_solutions_list = []
     for doc in found_docs:
@@ -69,12 +115,40 @@ def fetch_found_solutions():
 
     return found_solutions_list
 
-def save_found_solution(player_name, player_solution):
-    db = firestore.client()
-    collection = db.collection("eightqueens").document("player_solutions").collection("N8")
+def found_solutions_collection(db, N):
+    return db.collection("eightqueens").document("player_solutions").collection(f"N{N}")
 
-    collection.add({
-        "player": player_name,
-        "solution": player_solution
-    })
+def found_solution_id(solution):
+    # one document per solution, so replaying a logged write never duplicates it
+    return "_".join(str(col) for col in solution)
 
+def save_found_solutions_batched(entries):
+    # entries are found-solution log records: {"player", "solution"}
+    db = firestore.client()
+    written = 0
+    for chunk in iter_chunks(entries, BATCH_LIMIT):
+        batch = db.batch()
+        for entry in chunk:
+            collection = found_solutions_collection(db, len(entry["solution"]))
+            batch.set(collection.document(found_solution_id(entry["solution"])), {
+                "player": entry["player"],
+                "solution": entry["solution"]
+            })
+        batch.commit()
+        written += len(chunk)
+    return written
+
+def delete_found_solutions(N=8):
+    # reset of a board size: deletes in pages of BATCH_LIMIT, one commit each
+    db = firestore.client()
+    collection = found_solutions_collection(db, N)
+    deleted = 0
+    while True:
+        docs = list(collection.limit(BATCH_LIMIT).stream())
+        if not docs:
+            return deleted
+        batch = db.batch()
+        for doc in docs:
+            batch.delete(doc.reference)
+        batch.commit()
+        deleted += len(docs)
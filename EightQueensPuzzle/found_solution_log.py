@@ -0,0 +1,199 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:     # Windows
+    fcntl = None
+    import msvcrt
+
+from EightQueensPuzzle.solution_catalog import CACHE_DIR
+
+# Write-ahead log for solutions found by players. Every find or reset is
+# appended to a local JSON-lines file first, which is what the running game
+# trusts; a background flusher copies pending records to Firestore in
+# batches. A record is pending until a later {"op": "synced"} line covers
+# its sequence number, so anything not yet synced when the game closes (or
+# the network is down) is sent on the next start.
+#   {"seq": 1, "op": "found", "N": 8, "player": "piyumi", "solution": [...]}
+#   {"seq": 2, "op": "clear", "N": 8}
+#   {"seq": 3, "op": "synced", "upto": 2}
+
+LOG_FILE = "found_solutions.jsonl"
+
+# seconds between background syncs; a new record wakes the flusher early
+FLUSH_INTERVAL = 5.0
+
+@contextmanager
+def file_lock(path):
+    # exclusive lock on path shared by every process using the log; threads
+    # in one process are kept apart by FoundSolutionLog._lock
+    with open(path, "a+") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+class FoundSolutionLog:
+
+    def __init__(self, path):
+        self.path = path
+        self.lock_path = path + ".lock"
+        self._lock = threading.Lock()       # guards the file and pending list
+        self._flush_lock = threading.Lock()  # one sync at a time
+        self._wake = threading.Event()
+        self._flusher = None
+        self._load()
+
+    def _load(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # read and compact under the file lock, so another process cannot
+        # append to the old file or compact it at the same time
+        with file_lock(self.lock_path):
+            self._read_and_compact()
+
+    def _read_and_compact(self):
+        records = []
+        try:
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # torn last line from a crash mid-write
+                        print(f"Skipping damaged found-solution log line: {line.strip()}")
+        except OSError:
+            pass
+
+        synced = max((r["upto"] for r in records if r["op"] == "synced"), default=0)
+        self._next_seq = max((r["seq"] for r in records), default=0) + 1
+        self.pending = [r for r in records if r["op"] != "synced" and r["seq"] > synced]
+
+        # compact: synced records are in Firestore already, drop them
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w") as f:
+            f.write(json.dumps({"seq": self._next_seq, "op": "synced", "upto": synced}) + "\n")
+            for record in self.pending:
+                f.write(json.dumps(record) + "\n")
+        os.replace(temp_path, self.path)
+        self._next_seq += 1
+
+    def _append(self, record):
+        with self._lock, file_lock(self.lock_path):
+            record["seq"] = self._next_seq
+            with open(self.path, "a") as f:
+                f.write(json.dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._next_seq += 1
+            if record["op"] != "synced":
+                self.pending.append(record)
+        return record
+
+    def record_found(self, player_name, solution):
+        record = self._append({"op": "found", "N": len(solution), "player": player_name,
+                               "solution": list(solution)})
+        self._wake.set()
+        return record
+
+    def record_clear(self, N=8):
+        record = self._append({"op": "clear", "N": N})
+        self._wake.set()
+        return record
+
+    def pending_changes(self, N=8):
+        # (cleared, found solutions) not in Firestore yet for this board size
+        cleared = False
+        found = []
+        with self._lock:
+            for record in self.pending:
+                if record["N"] != N:
+                    continue
+                if record["op"] == "clear":
+                    cleared = True
+                    found = []
+                else:
+                    found.append(record["solution"])
+        return cleared, found
+
+    def flush(self):
+        # copy pending records to Firestore in log order; finds between two
+        # resets go out as one batched write, a reset as batched deletes
+        from EightQueensPuzzle.eightqueen_dbUtil import delete_found_solutions, save_found_solutions_batched
+
+        with self._flush_lock:
+            with self._lock:
+                records = list(self.pending)
+
+            synced = 0
+            i = 0
+            while i < len(records):
+                if records[i]["op"] == "clear":
+                    delete_found_solutions(records[i]["N"])
+                    group = records[i:i + 1]
+                else:
+                    end = i
+                    while end < len(records) and records[end]["op"] == "found":
+                        end = end + 1
+                    group = records[i:end]
+                    save_found_solutions_batched(group)
+                self._mark_synced(group[-1]["seq"], len(group))
+                synced += len(group)
+                i = i + len(group)
+            return synced
+
+    def _mark_synced(self, upto, count):
+        self._append({"op": "synced", "upto": upto})
+        with self._lock:
+            self.pending = self.pending[count:]
+
+    def start_flusher(self, interval=FLUSH_INTERVAL):
+        if self._flusher is not None:
+            return self._flusher
+
+        def run():
+            while True:
+                self._wake.wait(interval)
+                self._wake.clear()
+                if not self.pending:
+                    continue
+                try:
+                    self.flush()
+                except Exception as e:
+                    # records stay pending and are retried on the next wake
+                    print(f"Error syncing found solutions to database: {e}")
+
+        self._flusher = threading.Thread(target=run, daemon=True)
+        self._flusher.start()
+        if self.pending:
+            self._wake.set()    # left over from the last session
+        return self._flusher
+
+_found_log = None
+_found_log_lock = threading.Lock()
+
+def get_found_log():
+    # one log per process, flushed in the background
+    global _found_log
+    with _found_log_lock:
+        if _found_log is None:
+            _found_log = FoundSolutionLog(os.path.join(CACHE_DIR, LOG_FILE))
+            _found_log.start_flusher()
+        return _found_log
+
+def log_found_solution(player_name, solution):
+    return get_found_log().record_found(player_name, solution)
+
+def log_clear(N=8):
+    return get_found_log().record_clear(N)
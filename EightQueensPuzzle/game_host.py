@@ -0,0 +1,143 @@
+import multiprocessing
+
+# Game host process. It is started once, imports tkinter, firebase_admin and
+# the game modules up front and then waits on a pipe for commands, so
+# opening Eight Queens does not pay interpreter start-up and import cost on
+# every launch. Protocol (tuples over the pipe):
+#   dashboard -> host: ("start", player_name, board_size) | ("stop",)
+#   host -> dashboard: ("ready",) once, then ("finished", error_or_None)
+
+# spawn, not the Linux default fork: the dashboard has already initialised
+# pygame and may have solver threads running, none of which should be
+# copied into the host
+_mp_context = multiprocessing.get_context("spawn")
+
+def warm_up():
+    # heavy imports and caches, done before the first game is requested
+    import tkinter
+    from EightQueensPuzzle.eightqeensUi import EightQueensUI
+    from EightQueensPuzzle.found_solution_log import get_found_log
+    from EightQueensPuzzle.solution_index import get_solution_index
+    get_solution_index(8)
+    get_found_log()     # starts syncing anything left from the last session
+
+def run_game(player_name, board_size):
+    import tkinter as tk
+    from EightQueensPuzzle.eightqeensUi import EightQueensUI
+
+    root = tk.Tk()
+    game = EightQueensUI(root, player_name, tk, board_size=board_size)
+
+    # Add return to hub button at bottom right
+    return_btn = tk.Button(
+        root,
+        text="Return to Game Hub",
+        command=root.quit,
+        bg="#2d3748",
+        fg="white",
+        font=("Arial", 12, "bold"),
+        relief=tk.FLAT,
+        bd=0,
+        activebackground="#4a5568",
+        activeforeground="white",
+        cursor="hand2",
+        padx=15,
+        pady=5
+    )
+    return_btn.place(x=780, y=570, width=180, height=50)
+
+    root.protocol("WM_DELETE_WINDOW", root.quit)
+    root.mainloop()
+    root.destroy()
+
+def host_main(conn, game_runner=run_game, warm_up_func=warm_up):
+    try:
+        warm_up_func()
+    except Exception as e:
+        print(f"Game host warm-up error: {e}")
+    conn.send(("ready",))
+
+    while True:
+        try:
+            command = conn.recv()
+        except EOFError:
+            break       # dashboard went away
+
+        if command[0] == "stop":
+            break
+        if command[0] == "start":
+            _, player_name, board_size = command
+            try:
+                game_runner(player_name, board_size)
+                conn.send(("finished", None))
+            except Exception as e:
+                conn.send(("finished", str(e)))
+
+class GameHost:
+
+    def __init__(self, game_runner=run_game, warm_up_func=warm_up):
+        self.game_runner = game_runner
+        self.warm_up_func = warm_up_func
+        self._process = None
+        self._conn = None
+
+    def is_running(self):
+        return self._process is not None and self._process.is_alive()
+
+    def start(self):
+        if self.is_running():
+            return
+        parent_conn, child_conn = _mp_context.Pipe()
+        self._process = _mp_context.Process(
+            target=host_main,
+            args=(child_conn, self.game_runner, self.warm_up_func),
+            daemon=True
+        )
+        self._process.start()
+        self._conn = parent_conn
+
+    def play(self, player_name, board_size=8, idle_callback=None, poll_interval=0.1):
+        # blocks until the player closes the game; idle_callback runs while
+        # waiting so the caller can keep its own window responsive
+        for attempt in range(2):
+            self.start()
+            try:
+                self._conn.send(("start", player_name, board_size))
+                while True:
+                    if not self._conn.poll(poll_interval):
+                        if not self._process.is_alive():
+                            raise EOFError("game host exited")
+                        if idle_callback is not None:
+                            idle_callback()
+                        continue
+                    message = self._conn.recv()
+                    if message[0] == "finished":
+                        return message[1]
+            except (EOFError, OSError, BrokenPipeError) as e:
+                # host died: start a fresh one and try once more
+                print(f"Game host error: {e}")
+                self.stop()
+        return "Game host could not be started"
+
+    def stop(self):
+        if self._conn is not None:
+            try:
+                self._conn.send(("stop",))
+            except (OSError, BrokenPipeError):
+                pass
+            self._conn.close()
+            self._conn = None
+        if self._process is not None:
+            self._process.join(timeout=2)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+
+_game_host = None
+
+def get_game_host():
+    # one host per dashboard process
+    global _game_host
+    if _game_host is None:
+        _game_host = GameHost()
+    return _game_host
@@ -1,78 +1,34 @@
-import os
-import subprocess
-import sys
 import pygame
 
-from EightQueensPuzzle.Solutions.sequential import find_max_solutions_sequantial
-from EightQueensPuzzle.Solutions.threaded import find_max_solutions_threaded
+from EightQueensPuzzle.game_host import get_game_host
+from EightQueensPuzzle.solver_runs import start_solver_runs
 
-def launch_eight_queens(self):
-    find_max_solutions_sequantial(player_name=self.player_name)
-    find_max_solutions_threaded(player_name=self.player_name)
+def prewarm_eight_queens():
+    # start the game host early so the first launch is already warm
+    try:
+        get_game_host().start()
+    except Exception as e:
+        print(f"Could not start Eight Queens game host: {e}")
+
+def launch_eight_queens(self, board_size=8):
+    # solver runs are cached on disk and recorded in the background, so
+    # launching only costs starting the game window
+    start_solver_runs(self.player_name, board_size)
 
     try:
         # Hide the pygame window temporarily
         pygame.display.iconify()
 
-        # Path to the Eight Queens game directory
-        game_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "EightQueensPuzzle")
-        game_file = os.path.join(game_dir, "eightqeensUi.py")
-
-        if os.path.exists(game_file):
-            # Create a simple launcher script that passes the player name
-            launcher_code = f'''
-import tkinter as tk
-import sys
-import os
-
-# Add the Eight Queens directory to Python path
-eight_queens_dir = r"{game_dir}"
-sys.path.insert(0, eight_queens_dir)
-
-from eightqeensUi import EightQueensUI
-
-root = tk.Tk()
-game = EightQueensUI(root, "{self.player_name}", tk)
-
-# Add return to hub button at bottom right
-return_btn = tk.Button(
-    root,
-    text="Return to Game Hub",
-    command=root.quit,
-    bg="#2d3748",
-    fg="white",
-    font=("Arial", 12, "bold"),
-    relief=tk.FLAT,
-    bd=0,
-    activebackground="#4a5568",
-    activeforeground="white",
-    cursor="hand2",
-    padx=15,
-    pady=5
-)
-return_btn.place(x=780, y=570, width=180, height=50)
-
-root.mainloop()
-'''
-            # Write launcher to temp file
-            temp_launcher = os.path.join(os.path.dirname(__file__), "temp_eight_queens_launcher.py")
-            with open(temp_launcher, 'w') as f:
-                f.write(launcher_code)
-
-            # Launch the game
-            result = subprocess.run([sys.executable, temp_launcher], cwd=game_dir)
-
-            # Clean up temp file
-            if os.path.exists(temp_launcher):
-                os.remove(temp_launcher)
-
-            # Restore the pygame window
-            pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
-            pygame.display.set_caption(f"Mind Arena - Welcome {self.player_name}!")
+        # the game runs in the pre-warmed host process; keep pumping pygame
+        # events meanwhile so the hub is not reported as hung
+        error = get_game_host().play(self.player_name, board_size, idle_callback=pygame.event.pump)
+        if error:
+            print(f"Error in Eight Queens: {error}")
 
-        else:
-            print(f"Eight Queens game not found at: {game_file}")
+        # Restore the pygame window
+        pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        pygame.display.set_caption(f"Mind Arena - Welcome {self.player_name}!")
 
     except Exception as e:
         print(f"Error launching Eight Queens: {e}")
-        pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
\ No newline at end of file
+        pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
@@ -1,12 +1,22 @@
+import queue
+import threading
 from tkinter import messagebox
-from firebase_admin import firestore
 from EightQueensPuzzle.user_alert import show_toast, show_win_popup
-from dbUtil import delete_collection
-from EightQueensPuzzle.eightqueen_dbUtil import (
-    fetch_all_solutions,
-    fetch_found_solutions,
-    save_found_solution
-)
+from EightQueensPuzzle.Solutions.symmetry import fundamental_family, solve_fundamental_solutions
+from EightQueensPuzzle.solution_index import SolutionIndex, get_solution_index
+from EightQueensPuzzle.eightqueen_dbUtil import fetch_found_solutions
+from EightQueensPuzzle.found_solution_log import get_found_log, log_clear, log_found_solution
+
+# results of a check
+INCORRECT = "incorrect"
+ALREADY_FOUND = "already_found"
+NEW_SOLUTION = "new_solution"
+
+# how often the UI looks for a finished background check (ms)
+RESULT_POLL_MS = 30
+
+# larger boards need a noticeable search to name the solution family
+FAMILY_MAX_N = 10
 
 def check_solution(self):
     player_solution = self.store_entered_solution()
@@ -15,65 +25,163 @@ def check_solution(self):
         messagebox.showerror("Error", "You must place exactly 1 queen in every row.")
         return "Incorrect solution!"
 
-        #  compare  with saved solutions in fb
-    validate_player_solution(player_solution, self.player_name)
+    N = len(player_solution)
+    if N in _found_indexes:
+        # fast path: everything needed is cached, so classify right away and
+        # start the save first; naming the solution family is a solve, so it
+        # runs on a worker and the popup comes back via after()
+        result = classify_player_solution(player_solution)
+        if result == NEW_SOLUTION:
+            threading.Thread(
+                target=save_player_solution,
+                args=(player_solution, self.player_name),
+                daemon=True
+            ).start()
+            if N <= FAMILY_MAX_N:
+                run_in_background(
+                    self.root,
+                    lambda: describe_family(player_solution),
+                    lambda detail: show_result(result, player_solution, detail)
+                )
+                return result
+        show_result(result, player_solution)
+        return result
 
-def validate_player_solution(player_solution, player_name):
-    try:
-        fetched_solutions = fetch_all_solutions()
+    # first check in this process: found solutions still have to be loaded,
+    # so the whole check runs on a worker and the result comes back via after()
+    def work():
+        result = check_and_save(player_solution, self.player_name)
+        return result, describe_family(player_solution) if result == NEW_SOLUTION else None
+
+    run_in_background(
+        self.root,
+        work,
+        lambda outcome: show_result(outcome[0], player_solution, outcome[1])
+    )
+
+def run_in_background(root, work, on_done, on_error=None):
+    # Tk is not thread safe: the worker only fills a queue, and the UI thread
+    # polls it with root.after and calls on_done (or on_error) itself
+    results = queue.Queue()
+
+    def worker():
+        try:
+            results.put((work(), None))
+        except Exception as e:
+            # always answer, or poll would re-schedule forever
+            results.put((None, e))
+
+    def poll():
+        try:
+            result, error = results.get_nowait()
+        except queue.Empty:
+            root.after(RESULT_POLL_MS, poll)
+            return
+        if error is not None:
+            (on_error or show_background_error)(error)
+            return
+        on_done(result)
+
+    threading.Thread(target=worker, daemon=True).start()
+    root.after(RESULT_POLL_MS, poll)
+
+def show_background_error(error):
+    print(f"Error checking solution: {error}")
+    messagebox.showerror("Error", f"Could not check the solution: {error}")
+
+# found solutions per board size, loaded once and kept up to date locally
+_found_indexes = {}
+_found_lock = threading.Lock()
+
+def get_found_index(N=8):
+    with _found_lock:
+        if N in _found_indexes:
+            return _found_indexes[N]
+
+    # Firestore copy plus local changes the flusher has not sent yet; loaded
+    # without the lock so a slow fetch does not block checks on other sizes
+    cleared, found = get_found_log().pending_changes(N)
+    remote = [] if cleared else fetch_found_solutions(N)
+    index = SolutionIndex(N, remote + found)
+
+    with _found_lock:
+        # another thread may have loaded it meanwhile; keep the first one,
+        # it may already hold claimed solutions
+        return _found_indexes.setdefault(N, index)
 
+def classify_player_solution(player_solution):
+    N = len(player_solution)
+    # all solutions come from the local catalog, no network round trip
+    if player_solution not in get_solution_index(N):
+        return INCORRECT
+
+    try:
         #load solved solutions
-        found_solutions = fetch_found_solutions()
+        found_index = get_found_index(N)
     except Exception as e:
         print(f"Error fetching solutions from database  {e}")
+        found_index = SolutionIndex(N)
 
-    #check if solution is in all solutions
-    is_correct = False
-    i = 0
-    while i < len(fetched_solutions):
-        if fetched_solutions[i] == player_solution:
-            is_correct = True
-            break
-        i += 1
+    #check if solution is already found, and claim it if not
+    with _found_lock:
+        if player_solution in found_index:
+            return ALREADY_FOUND
+        found_index.add(player_solution)
+    return NEW_SOLUTION
 
-    #not a valid solution
-    if not is_correct:
-        show_toast("Result", "Incorrect solution!")
+def save_player_solution(player_solution, player_name):
+    N = len(player_solution)
+    try:
+        # local log only; Firestore is updated by the background flusher
+        log_found_solution(player_name, player_solution)
+    except Exception as e:
+        print(f"Error saving found solution: {e}")
+        # not stored remotely, so the solution can be found again
+        if N in _found_indexes:
+            with _found_lock:
+                _found_indexes[N].discard(player_solution)
         return
 
-    #check if solution is already found
-    already_found = False
-    j = 0
-    while j < len(found_solutions):
-        if found_solutions[j] == player_solution:
-            already_found = True
-            break
-        j += 1
+    #clear flag
+    if N in _found_indexes and len(_found_indexes[N]) == len(get_solution_index(N)) - 1:
+        clear_found_solutions(N)
+
+def check_and_save(player_solution, player_name):
+    result = classify_player_solution(player_solution)
+    if result == NEW_SOLUTION:
+        save_player_solution(player_solution, player_name)
+    return result
+
+def describe_family(player_solution):
+    # which family (up to rotation/reflection) a solution belongs to; a full
+    # solve the first time per N, so call it off the UI thread
+    N = len(player_solution)
+    if N > FAMILY_MAX_N:
+        return None
+    family = fundamental_family(player_solution)
+    total_families = len(solve_fundamental_solutions(N))
+    return f"Solution family {family} of {total_families}"
 
-    if already_found:
+def show_result(result, player_solution, family_detail=None):
+    #not a valid solution
+    if result == INCORRECT:
+        show_toast("Result", "Incorrect solution!")
+    elif result == ALREADY_FOUND:
         messagebox.showwarning("warning", "This solution was already found by someone else!")
-        return
     else:
-        #save new correct solution
-        found_solutions.append({
-            "player": player_name,
-            "solution": player_solution
-        })
-
-        try:
-            save_found_solution(player_name, player_solution)
-        except Exception as e:
-            print(f"Error saving found solution to database: {e}")
+        show_win_popup(family_detail)
 
-    #clear flag
-    if len(found_solutions) == len(fetched_solutions) - 1:
-        clear_found_solutions()
+def validate_player_solution(player_solution, player_name):
+    # synchronous check, save and feedback
+    result = check_and_save(player_solution, player_name)
+    detail = describe_family(player_solution) if result == NEW_SOLUTION else None
+    show_result(result, player_solution, detail)
+    return result
 
-    show_win_popup()
-    return
+#clear the flag (logged, deleted from db in batches by the flusher)
+def clear_found_solutions(N=8):
+    log_clear(N)
 
-#clear the flag (db)
-def clear_found_solutions():
-    db = firestore.client()
-    collection = db.collection("eightqueens").document("player_solutions").collection("N8")
-    delete_collection(collection)
\ No newline at end of file
+    if N in _found_indexes:
+        with _found_lock:
+            _found_indexes[N].clear()
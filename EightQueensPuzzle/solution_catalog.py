@@ -0,0 +1,139 @@
+import mmap
+import os
+import struct
+import threading
+
+from EightQueensPuzzle.Solutions.bitboard import iter_solutions
+
+# Local solution catalog. Every solution for an N x N board is stored as N
+# bytes (the column of the queen in each row), sorted, after a small header.
+# The file is generated once from the solver and memory-mapped, so checking a
+# player's board is a local lookup instead of a Firestore read.
+
+CATALOG_VERSION = 1
+CATALOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog")
+# solver runs and the found-solution log
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+MIN_CATALOG_N = 4
+MAX_CATALOG_N = 12
+
+# playable rooms; boards above MAX_CATALOG_N are checked rule by rule
+MIN_BOARD_SIZE = 4
+MAX_BOARD_SIZE = 14
+
+# number of solutions per board size (OEIS A000170), so nothing has to be
+# enumerated just to tell the player how many there are
+KNOWN_SOLUTION_COUNTS = {
+    4: 2, 5: 10, 6: 4, 7: 40, 8: 92, 9: 352, 10: 724,
+    11: 2680, 12: 14200, 13: 73712, 14: 365596,
+}
+
+_MAGIC = b"EQSC"
+_HEADER = struct.Struct("<4sBBI")   # magic, version, N, solution count
+
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+
+def catalog_path(N):
+    return os.path.join(CATALOG_DIR, f"N{N}.v{CATALOG_VERSION}.bin")
+
+def build_catalog(N):
+    if not MIN_CATALOG_N <= N <= MAX_CATALOG_N:
+        raise ValueError(f"Catalog board size must be between {MIN_CATALOG_N} and {MAX_CATALOG_N}")
+
+    os.makedirs(CATALOG_DIR, exist_ok=True)
+    path = catalog_path(N)
+    # per-process temp name: a game host process may build the same catalog
+    temp_path = f"{path}.{os.getpid()}.tmp"
+
+    # the solver yields solutions in sorted order already
+    count = 0
+    with open(temp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, CATALOG_VERSION, N, 0))
+        for solution in iter_solutions(N):
+            f.write(bytes(solution))
+            count += 1
+        f.seek(0)
+        f.write(_HEADER.pack(_MAGIC, CATALOG_VERSION, N, count))
+
+    os.replace(temp_path, path)
+    return path
+
+class SolutionCatalog:
+
+    def __init__(self, N):
+        self.N = N
+        path = catalog_path(N)
+        if not self._is_valid_file(path):
+            build_catalog(N)
+
+        self._file = open(path, "rb")
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        _, _, _, self.count = _HEADER.unpack_from(self._data, 0)
+
+    def _is_valid_file(self, path):
+        try:
+            with open(path, "rb") as f:
+                header = f.read(_HEADER.size)
+                magic, version, N, count = _HEADER.unpack(header)
+                size = os.fstat(f.fileno()).st_size
+        except (OSError, struct.error):
+            return False
+        return (magic == _MAGIC and version == CATALOG_VERSION and N == self.N
+                and size == _HEADER.size + count * N)
+
+    def _record(self, index):
+        start = _HEADER.size + index * self.N
+        return self._data[start:start + self.N]
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, solution):
+        if len(solution) != self.N:
+            return False
+        if any(not 0 <= col < self.N for col in solution):
+            return False
+
+        # binary search over the sorted fixed-size records
+        key = bytes(solution)
+        low, high = 0, self.count
+        while low < high:
+            mid = (low + high) // 2
+            if self._record(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+        return low < self.count and self._record(low) == key
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield list(self._record(index))
+
+    def close(self):
+        self._data.close()
+        self._file.close()
+
+def solution_count(N=8):
+    if N in KNOWN_SOLUTION_COUNTS:
+        return KNOWN_SOLUTION_COUNTS[N]
+    return len(get_catalog(N))
+
+def get_catalog(N=8):
+    # one open catalog per board size per process; the lock keeps two
+    # worker threads from building the same catalog at once
+    with _catalogs_lock:
+        if N not in _catalogs:
+            _catalogs[N] = SolutionCatalog(N)
+        return _catalogs[N]
+
+def sync_catalog_to_firestore(N=8, program_type="sequential"):
+    # Firestore is a copy of the catalog, not the source of truth
+    from EightQueensPuzzle.eightqueen_dbUtil import save_program_solutions
+
+    catalog = get_catalog(N)
+    save_program_solutions(iter(catalog), N=N, program_type=program_type, solutions_count=len(catalog))
+
+if __name__ == "__main__":
+    for size in range(MIN_CATALOG_N, MAX_CATALOG_N + 1):
+        print(f"N={size}: {len(get_catalog(size))} solutions -> {catalog_path(size)}")
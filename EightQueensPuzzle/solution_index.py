@@ -0,0 +1,75 @@
+import threading
+
+from EightQueensPuzzle.Solutions.bitboard import is_valid_solution
+from EightQueensPuzzle.solution_catalog import MAX_CATALOG_N, get_catalog, solution_count
+
+# Hash index over solutions. Each board is encoded as one integer (the
+# queen columns read as base-N digits), so "is this a solution" and "was it
+# already found" are set lookups instead of list scans.
+
+_solution_indexes = {}
+_solution_indexes_lock = threading.Lock()
+
+def encode_solution(solution, N=None):
+    # None for anything that is not a full board of size N
+    N = len(solution) if N is None else N
+    if len(solution) != N:
+        return None
+    code = 0
+    for col in solution:
+        if not 0 <= col < N:
+            return None
+        code = code * N + col
+    return code
+
+class SolutionIndex:
+
+    def __init__(self, N, solutions=()):
+        self.N = N
+        self._codes = set()
+        for solution in solutions:
+            self.add(solution)
+
+    def add(self, solution):
+        code = encode_solution(solution, self.N)
+        if code is None:
+            raise ValueError(f"Not a board of size {self.N}: {solution}")
+        self._codes.add(code)
+
+    def discard(self, solution):
+        code = encode_solution(solution, self.N)
+        if code is not None:
+            self._codes.discard(code)
+
+    def clear(self):
+        self._codes.clear()
+
+    def __contains__(self, solution):
+        code = encode_solution(solution, self.N)
+        return code is not None and code in self._codes
+
+    def __len__(self):
+        return len(self._codes)
+
+class RuleIndex:
+    # for boards too big to catalog: membership is a direct rule check and
+    # the size comes from the known solution counts
+
+    def __init__(self, N):
+        self.N = N
+
+    def __contains__(self, solution):
+        return len(solution) == self.N and is_valid_solution(solution)
+
+    def __len__(self):
+        return solution_count(self.N)
+
+def get_solution_index(N=8):
+    # built once per process from the local catalog
+    with _solution_indexes_lock:
+        if N not in _solution_indexes:
+            if N > MAX_CATALOG_N:
+                _solution_indexes[N] = RuleIndex(N)
+            else:
+                _solution_indexes[N] = SolutionIndex(N, get_catalog(N))
+        return _solution_indexes[N]
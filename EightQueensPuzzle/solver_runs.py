@@ -0,0 +1,104 @@
+import json
+import os
+import threading
+import time
+
+from EightQueensPuzzle.Solutions import bitboard, sequential, threaded
+from EightQueensPuzzle.solution_catalog import CACHE_DIR, MAX_CATALOG_N
+
+# Solver runs shown in the game_rounds history. The solution count and time
+# of a solver only change when the solver or N changes, so each run is
+# stored on disk keyed by (program type, N, solver version) and reused.
+# Launching the game only starts a background job that records the round.
+
+RUNS_FILE = "solver_runs.json"
+
+# the list-based solvers take seconds to minutes beyond this board size
+SIMPLE_SOLVER_MAX_N = 10
+
+SOLVERS = {
+    "sequential": (sequential.solve_eight_queens_sequential, sequential.SOLVER_VERSION),
+    "threaded": (threaded.solve_eight_queens_threaded, threaded.SOLVER_VERSION),
+    "bitboard": (bitboard.solve_eight_queens_bitboard, bitboard.SOLVER_VERSION),
+}
+
+_runs_lock = threading.Lock()
+
+def solvers_for_board(N):
+    # solving work sized to the board; above MAX_CATALOG_N the game only uses
+    # the known solution counts, so nothing is solved
+    if N <= SIMPLE_SOLVER_MAX_N:
+        return ["sequential", "threaded"]
+    if N <= MAX_CATALOG_N:
+        return ["bitboard"]
+    return []
+
+def run_key(program_type, N):
+    return f"{program_type}:N{N}:v{SOLVERS[program_type][1]}"
+
+def runs_path():
+    return os.path.join(CACHE_DIR, RUNS_FILE)
+
+def load_runs():
+    try:
+        with open(runs_path()) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_runs(runs):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    temp_path = runs_path() + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(runs, f, indent=2)
+    os.replace(temp_path, runs_path())
+
+def get_solver_run(program_type, N):
+    # (run, solutions): the cached run with solutions None, or run the solver
+    # once, remember the run and hand back the solutions it returned
+    key = run_key(program_type, N)
+    with _runs_lock:
+        runs = load_runs()
+        if key in runs:
+            return runs[key], None
+
+        solve = SOLVERS[program_type][0]
+        start_time = time.perf_counter()
+        solutions = solve(N)
+        time_taken = time.perf_counter() - start_time
+
+        run = {"solutions_count": len(solutions), "time_taken": time_taken}
+        runs[key] = run
+        save_runs(runs)
+    return run, solutions
+
+def record_solver_runs(player_name, N=8):
+    from EightQueensPuzzle.eightqueen_dbUtil import save_game_round, save_program_solutions
+
+    for program_type in solvers_for_board(N):
+        try:
+            run, solutions = get_solver_run(program_type, N)
+            fresh = solutions is not None
+            if fresh:
+                # first run of this solver version: make sure Firestore has
+                # the solutions this solver produced
+                save_program_solutions(solutions, N=N, program_type=program_type,
+                                       solutions_count=run["solutions_count"])
+            save_game_round(program_type, N, player_name, run["time_taken"], run["solutions_count"])
+            print(f"{program_type} N={N}: {run['solutions_count']} solutions in {run['time_taken']:.4f}s"
+                  f"{'' if fresh else ' (cached)'}")
+        except Exception as e:
+            print(f"Error recording {program_type} solver run: {e}")
+
+def start_solver_runs(player_name, N=8):
+    # runs next to the game instead of before it
+    job = threading.Thread(target=record_solver_runs, args=(player_name, N), daemon=True)
+    job.start()
+    return job
+
+if __name__ == "__main__":
+    # precompute every cached run
+    for size in range(4, MAX_CATALOG_N + 1):
+        for name in solvers_for_board(size):
+            result, _ = get_solver_run(name, size)
+            print(f"{name} N={size}: {result['solutions_count']} solutions in {result['time_taken']:.4f}s")
@@ -0,0 +1,171 @@
+import itertools
+import threading
+
+# In-memory stand-in for the parts of the Firestore client the Eight Queens
+# code uses. Documents live in one dict keyed by path; reads and writes are
+# counted so tests can check how much traffic a call generates.
+
+MAX_BATCH_WRITES = 500
+
+class FakeSnapshot:
+
+    def __init__(self, reference, data):
+        self.reference = reference
+        self.id = reference.id
+        self._data = data
+
+    @property
+    def exists(self):
+        return self._data is not None
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+class FakeDocument:
+
+    def __init__(self, db, path):
+        self._db = db
+        self.path = path
+        self.id = path.rsplit("/", 1)[-1]
+
+    def collection(self, name):
+        return FakeCollection(self._db, f"{self.path}/{name}")
+
+    def get(self, transaction=None):
+        with self._db.lock:
+            self._db.reads += 1
+            return FakeSnapshot(self, self._db.docs.get(self.path))
+
+    def set(self, data, merge=False):
+        with self._db.lock:
+            self._db.writes += 1
+            if merge and self.path in self._db.docs:
+                self._db.docs[self.path].update(data)
+            else:
+                self._db.docs[self.path] = dict(data)
+
+    def delete(self):
+        with self._db.lock:
+            self._db.writes += 1
+            self._db.docs.pop(self.path, None)
+
+class FakeCollection:
+
+    def __init__(self, db, path, limit=None):
+        self._db = db
+        self.path = path
+        self._limit = limit
+
+    def document(self, doc_id=None):
+        if doc_id is None:
+            doc_id = f"auto{next(self._db.ids)}"
+        return FakeDocument(self._db, f"{self.path}/{doc_id}")
+
+    def add(self, data):
+        ref = self.document()
+        ref.set(data)
+        return None, ref
+
+    def limit(self, count):
+        return FakeCollection(self._db, self.path, limit=count)
+
+    def count(self):
+        return FakeCountQuery(self)
+
+    def stream(self):
+        prefix = self.path + "/"
+        with self._db.lock:
+            paths = [p for p in self._db.docs
+                     if p.startswith(prefix) and "/" not in p[len(prefix):]]
+            if self._limit is not None:
+                paths = paths[:self._limit]
+            self._db.reads += len(paths)
+            snapshots = [FakeSnapshot(FakeDocument(self._db, p), self._db.docs[p]) for p in paths]
+        return iter(snapshots)
+
+class FakeAggregation:
+
+    def __init__(self, value):
+        self.value = value
+
+class FakeCountQuery:
+
+    def __init__(self, collection):
+        self._collection = collection
+
+    def get(self):
+        # an aggregation is billed as a single read
+        with self._collection._db.lock:
+            self._collection._db.reads += 1
+            return [[FakeAggregation(self._collection._db.count(self._collection.path))]]
+
+class FakeBatch:
+
+    def __init__(self, db):
+        self._db = db
+        self._ops = []
+
+    def set(self, reference, data, merge=False):
+        self._ops.append(("set", reference, data, merge))
+
+    def delete(self, reference):
+        self._ops.append(("delete", reference, None, False))
+
+    def commit(self):
+        if len(self._ops) > MAX_BATCH_WRITES:
+            raise ValueError("Batch exceeds 500 writes")
+        with self._db.lock:
+            self._db.commits += 1
+        for op, reference, data, merge in self._ops:
+            if op == "set":
+                reference.set(data, merge=merge)
+            else:
+                reference.delete()
+        self._ops = []
+
+class FakeTransaction:
+
+    def __init__(self, db):
+        self._db = db
+        self._writes = []
+
+    def set(self, reference, data, merge=False):
+        self._writes.append((reference, data, merge))
+
+    def commit(self):
+        for reference, data, merge in self._writes:
+            reference.set(data, merge=merge)
+        self._writes = []
+
+def transactional(func):
+    # stands in for firestore.transactional: the fake runs each transaction
+    # under the store lock, which gives the same no-lost-update guarantee
+    def run(transaction, *args, **kwargs):
+        with transaction._db.lock:
+            result = func(transaction, *args, **kwargs)
+            transaction.commit()
+            return result
+    return run
+
+class FakeFirestore:
+
+    def __init__(self):
+        self.docs = {}
+        self.lock = threading.RLock()
+        self.ids = itertools.count(1)
+        self.reads = 0
+        self.writes = 0
+        self.commits = 0
+
+    def collection(self, name):
+        return FakeCollection(self, name)
+
+    def batch(self):
+        return FakeBatch(self)
+
+    def transaction(self):
+        return FakeTransaction(self)
+
+    def count(self, collection_path):
+        prefix = collection_path + "/"
+        return sum(1 for p in self.docs if p.startswith(prefix) and "/" not in p[len(prefix):])
@@ -12,9 +12,9 @@ from EightQueensPuzzle.player_solutions import validate_player_solution
 
 class TestValidatePlayerSolution(unittest.TestCase):
 
-    @patch('EightQueensPuzzle.player_solutions.fetch_all_solutions')
+    @patch('EightQueensPuzzle.player_solutions.get_solution_index')
     @patch('EightQueensPuzzle.player_solutions.fetch_found_solutions')
-    @patch('EightQueensPuzzle.player_solutions.save_found_solution')
+    @patch('EightQueensPuzzle.player_solutions.log_found_solution')
     @patch('EightQueensPuzzle.player_solutions.messagebox')
     #find a new answer
     def test_correct_solution_not_found_before(self, mock_messagebox, mock_save, mock_found, mock_all):
@@ -27,7 +27,7 @@ class TestValidatePlayerSolution(unittest.TestCase):
         self.assertIn("Congratulations", result)
         self.assertIn("piyumi", result)
         mock_save.assert_called_once_with("piyumi", valid_solution)
-    @patch('EightQueensPuzzle.player_solutions.fetch_all_solutions')
+    @patch('EightQueensPuzzle.player_solutions.get_solution_index')
     @patch('EightQueensPuzzle.player_solutions.fetch_found_solutions')
     @patch('EightQueensPuzzle.player_solutions.messagebox')
     #find a wrong answer
@@ -41,7 +41,7 @@ class TestValidatePlayerSolution(unittest.TestCase):
         self.assertEqual(result, "Incorrect solution!")
         mock_messagebox.showinfo.assert_called_with("Incorrect", "Incorrect solution!")
 
-    @patch('EightQueensPuzzle.player_solutions.fetch_all_solutions')
+    @patch('EightQueensPuzzle.player_solutions.get_solution_index')
     @patch('EightQueensPuzzle.player_solutions.fetch_found_solutions')
     @patch('EightQueensPuzzle.player_solutions.messagebox')
     #already found
@@ -0,0 +1,43 @@
+import csv
+import json
+
+from EightQueensPuzzle.Solutions.benchmark import (
+    RESULT_FIELDS,
+    SOLVERS,
+    parse_sizes,
+    percentile,
+    run_benchmark,
+    write_results
+)
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile([7], 95) == 7
+
+def test_parse_sizes():
+    assert list(parse_sizes("4-6")) == [4, 5, 6]
+    assert list(parse_sizes("8")) == [8]
+
+def test_every_backend_agrees():
+    rows = run_benchmark(sizes=[6], repeats=2, warmup=0)
+    assert {row["solver"] for row in rows} == set(SOLVERS)
+    assert all(row["solutions"] == 4 for row in rows)
+    for row in rows:
+        assert row["min_ms"] <= row["median_ms"] <= row["p95_ms"] <= row["max_ms"]
+        assert row["peak_memory_kib"] is not None
+
+def test_results_written(tmp_path):
+    rows = run_benchmark(solvers=["bitboard", "count"], sizes=[5, 6], repeats=1, warmup=0, measure_memory=False)
+    csv_path, json_path = write_results(rows, str(tmp_path), label="test")
+
+    with open(csv_path) as f:
+        reader = csv.DictReader(f)
+        assert reader.fieldnames == RESULT_FIELDS
+        assert len(list(reader)) == 4
+
+    with open(json_path) as f:
+        data = json.load(f)
+    assert "commit" in data["environment"]
+    assert data["results"] == rows
@@ -0,0 +1,83 @@
+import os
+import threading
+
+import pytest
+
+from EightQueensPuzzle import solution_catalog
+from EightQueensPuzzle.Solutions.bitboard import count_solutions, solve_eight_queens_bitboard
+from EightQueensPuzzle.solution_catalog import KNOWN_SOLUTION_COUNTS, SolutionCatalog, build_catalog, catalog_path
+
+@pytest.fixture
+def catalog_dir(tmp_path, monkeypatch):
+    # keep generated files out of the package folder
+    monkeypatch.setattr(solution_catalog, "CATALOG_DIR", str(tmp_path))
+    return tmp_path
+
+def test_catalog_contains_all_solutions(catalog_dir):
+    catalog = SolutionCatalog(8)
+    try:
+        assert len(catalog) == 92
+        assert list(catalog) == solve_eight_queens_bitboard(8)
+        for solution in solve_eight_queens_bitboard(8):
+            assert solution in catalog
+    finally:
+        catalog.close()
+
+def test_catalog_rejects_invalid_boards(catalog_dir):
+    catalog = SolutionCatalog(8)
+    try:
+        assert [0, 1, 2, 3, 4, 5, 6, 7] not in catalog
+        assert [0, 4, 7, 5, 2, 6, 1] not in catalog      # wrong length
+        assert [-1, 4, 7, 5, 2, 6, 1, 3] not in catalog  # empty row
+    finally:
+        catalog.close()
+
+def test_catalog_file_size(catalog_dir):
+    path = build_catalog(6)
+    # header + 4 solutions of 6 bytes
+    assert os.path.getsize(path) == solution_catalog._HEADER.size + 4 * 6
+
+def test_catalog_rebuilds_bad_file(catalog_dir):
+    os.makedirs(catalog_dir, exist_ok=True)
+    with open(catalog_path(5), "wb") as f:
+        f.write(b"not a catalog")
+
+    catalog = SolutionCatalog(5)
+    try:
+        assert len(catalog) == 10
+    finally:
+        catalog.close()
+
+def test_catalog_size_limits(catalog_dir):
+    with pytest.raises(ValueError):
+        build_catalog(3)
+
+def test_known_solution_counts():
+    for N in range(4, 11):
+        assert KNOWN_SOLUTION_COUNTS[N] == count_solutions(N)
+
+def test_get_catalog_builds_once_across_threads(catalog_dir, monkeypatch):
+    monkeypatch.setattr(solution_catalog, "_catalogs", {})
+    builds = []
+    real_build = solution_catalog.build_catalog
+
+    def counting_build(N):
+        builds.append(N)
+        return real_build(N)
+
+    monkeypatch.setattr(solution_catalog, "build_catalog", counting_build)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(solution_catalog.get_catalog(9)))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    try:
+        assert builds == [9]
+        assert all(catalog is results[0] for catalog in results)
+        assert len(results[0]) == 352
+        assert not [name for name in os.listdir(catalog_dir) if name.endswith(".tmp")]
+    finally:
+        results[0].close()
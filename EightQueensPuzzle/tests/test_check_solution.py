@@ -0,0 +1,159 @@
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Mock firebase when it is not installed
+sys.modules.setdefault('firebase_admin', MagicMock())
+sys.modules.setdefault('firebase_admin.firestore', MagicMock())
+sys.modules.setdefault('firebase_admin.credentials', MagicMock())
+
+from EightQueensPuzzle import found_solution_log, player_solutions, solution_catalog, solution_index
+from EightQueensPuzzle.found_solution_log import FoundSolutionLog
+from EightQueensPuzzle.player_solutions import (
+    ALREADY_FOUND,
+    INCORRECT,
+    NEW_SOLUTION,
+    check_solution,
+    classify_player_solution
+)
+
+VALID = [0, 4, 7, 5, 2, 6, 1, 3]
+
+class FakeRoot:
+    # records after() callbacks instead of running a Tk mainloop
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, delay, callback):
+        self.callbacks.append(callback)
+
+    def run_pending(self):
+        while self.callbacks:
+            self.callbacks.pop(0)()
+
+class FakeGame:
+    def __init__(self, solution):
+        self.root = FakeRoot()
+        self.player_name = "piyumi"
+        self._solution = solution
+
+    def store_entered_solution(self):
+        return list(self._solution)
+
+@pytest.fixture(autouse=True)
+def reset_found_index(tmp_path, monkeypatch):
+    # keep the generated catalog out of the package folder
+    monkeypatch.setattr(solution_catalog, "CATALOG_DIR", str(tmp_path))
+    monkeypatch.setattr(solution_catalog, "_catalogs", {})
+    monkeypatch.setattr(solution_index, "_solution_indexes", {})
+    # a throwaway log with no flusher, nothing is sent anywhere
+    monkeypatch.setattr(found_solution_log, "_found_log", FoundSolutionLog(str(tmp_path / "found.jsonl")))
+    player_solutions._found_indexes.clear()
+    yield
+    player_solutions._found_indexes.clear()
+
+@pytest.fixture
+def ui():
+    with patch.object(player_solutions, "show_toast") as toast, \
+         patch.object(player_solutions, "show_win_popup") as popup, \
+         patch.object(player_solutions, "messagebox") as box:
+        yield {"toast": toast, "popup": popup, "messagebox": box}
+
+@patch.object(player_solutions, "fetch_found_solutions", return_value=[])
+def test_classify_player_solution(mock_fetch):
+    assert classify_player_solution([0, 1, 2, 3, 4, 5, 6, 7]) == INCORRECT
+    assert classify_player_solution(VALID) == NEW_SOLUTION
+    # claimed locally, so a second check sees it as found
+    assert classify_player_solution(VALID) == ALREADY_FOUND
+
+@patch.object(player_solutions, "log_found_solution")
+@patch.object(player_solutions, "fetch_found_solutions", return_value=[])
+def test_first_check_runs_on_worker(mock_fetch, mock_save, ui):
+    game = FakeGame(VALID)
+    check_solution(game)
+
+    # nothing shown yet: the result arrives through root.after polling
+    ui["popup"].assert_not_called()
+    # the poll callback re-schedules itself until the worker is done
+    game.root.run_pending()
+
+    ui["popup"].assert_called_once()
+    mock_save.assert_called_once_with("piyumi", VALID)
+
+@patch.object(player_solutions, "log_found_solution")
+@patch.object(player_solutions, "fetch_found_solutions", return_value=[])
+def test_cached_check_saves_before_family_lookup(mock_fetch, mock_save, ui):
+    player_solutions.get_found_index(8)
+    saved = threading.Event()
+    mock_save.side_effect = lambda *args: saved.set()
+    family_threads = []
+    real_describe = player_solutions.describe_family
+
+    def describe(solution):
+        family_threads.append(threading.current_thread())
+        return real_describe(solution)
+
+    game = FakeGame(VALID)
+    with patch.object(player_solutions, "describe_family", side_effect=describe):
+        result = check_solution(game)
+        assert result == NEW_SOLUTION
+        # the save does not wait for the popup
+        assert saved.wait(timeout=5)
+        game.root.run_pending()
+
+    # the family is named on a worker and shown through root.after
+    assert family_threads and family_threads[0] is not threading.main_thread()
+    ui["popup"].assert_called_once()
+    assert ui["popup"].call_args[0][0].startswith("Solution family")
+
+@patch.object(player_solutions, "check_and_save", side_effect=RuntimeError("offline"))
+def test_worker_error_is_shown(mock_check, ui):
+    game = FakeGame(VALID)
+    check_solution(game)
+
+    # the poll stops once the worker reports the error
+    game.root.run_pending()
+    ui["messagebox"].showerror.assert_called_once()
+    assert "offline" in ui["messagebox"].showerror.call_args[0][1]
+    ui["popup"].assert_not_called()
+
+@patch.object(player_solutions, "fetch_found_solutions", return_value=[])
+def test_cached_incorrect_check_answers_immediately(mock_fetch, ui):
+    player_solutions.get_found_index(8)
+    game = FakeGame([0, 1, 2, 3, 4, 5, 6, 7])
+    assert check_solution(game) == INCORRECT
+    ui["toast"].assert_called_once()
+    assert not game.root.callbacks
+
+@patch.object(player_solutions, "log_found_solution", side_effect=RuntimeError("offline"))
+@patch.object(player_solutions, "fetch_found_solutions", return_value=[])
+def test_failed_save_releases_solution(mock_fetch, mock_save, ui):
+    assert player_solutions.validate_player_solution(VALID, "piyumi") == NEW_SOLUTION
+    assert VALID not in player_solutions.get_found_index(8)
+
+def test_found_index_fetches_without_lock():
+    def fetch(N):
+        # other checks can take the lock while Firestore answers
+        assert not player_solutions._found_lock.locked()
+        return [VALID]
+
+    with patch.object(player_solutions, "fetch_found_solutions", side_effect=fetch):
+        index = player_solutions.get_found_index(8)
+    assert VALID in index
+    assert player_solutions.get_found_index(8) is index
+
+@patch.object(player_solutions, "fetch_found_solutions", return_value=[VALID])
+def test_found_index_includes_unsynced_changes(mock_fetch):
+    log = found_solution_log.get_found_log()
+    other = [1, 3, 5, 7, 2, 0, 6, 4]
+    log.record_found("imalka", other)
+    assert other in player_solutions.get_found_index(8)
+    assert VALID in player_solutions.get_found_index(8)
+
+    # a logged reset hides the Firestore copy until the flusher deletes it
+    player_solutions._found_indexes.clear()
+    log.record_clear(8)
+    assert len(player_solutions.get_found_index(8)) == 0
+    mock_fetch.assert_called_once()
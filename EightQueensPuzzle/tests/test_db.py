@@ -1,27 +1,112 @@
+import importlib
+import os
+import sys
+import threading
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-from EightQueensPuzzle.eightqueen_dbUtil import (save_sequencial_solutions_eigh_queens,save_threaded_solutions_eight_queens)
+# Mock firebase when it is not installed
+sys.modules.setdefault('firebase_admin', MagicMock())
+sys.modules.setdefault('firebase_admin.firestore', MagicMock())
+sys.modules.setdefault('firebase_admin.credentials', MagicMock())
+
+from fake_firestore import FakeFirestore, transactional
+from EightQueensPuzzle.Solutions.bitboard import iter_solutions, solve_eight_queens_bitboard
+from EightQueensPuzzle import eightqueen_dbUtil
+from EightQueensPuzzle.eightqueen_dbUtil import save_game_round, save_program_solutions
+
+SOLUTIONS_PATH = "eightqueens/sequential/N8"
 
 @pytest.fixture
-def mock_firestore():
+def fake_db():
+    db = FakeFirestore()
     with patch("EightQueensPuzzle.eightqueen_dbUtil.firestore") as mock_fs:
-        mock_client = MagicMock()
-        mock_fs.client.return_value = mock_client
-        mock_collection = MagicMock()
-        mock_client.collection.return_value.document.return_value.collection.return_value = mock_collection
-        yield mock_collection
+        mock_fs.client.return_value = db
+        mock_fs.transactional = transactional
+        yield db
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.mark.parametrize("cwd", [REPO_ROOT, os.path.join(REPO_ROOT, "EightQueensPuzzle")])
+def test_credentials_path_does_not_depend_on_cwd(cwd, monkeypatch):
+    # the game host process starts in the repo root, the old launcher in EightQueensPuzzle
+    monkeypatch.chdir(cwd)
+    importlib.reload(eightqueen_dbUtil)
+    assert eightqueen_dbUtil.CREDENTIALS_PATH == os.path.join(REPO_ROOT, "shared", "mind-arena.json")
+
+def test_save_writes_every_solution(fake_db):
+    solutions = solve_eight_queens_bitboard(8)
+    save_program_solutions(solutions, N=8, program_type="sequential")
+
+    assert fake_db.count(SOLUTIONS_PATH) == 92
+    # 92 solutions fit in a single batch
+    assert fake_db.commits == 1
+
+def test_save_batches_of_500(fake_db):
+    progress = []
+    save_program_solutions(iter_solutions(10), N=10, program_type="sequential",
+                           progress_callback=lambda written, total: progress.append(written))
+
+    assert fake_db.count("eightqueens/sequential/N10") == 724
+    assert fake_db.commits == 2
+    assert progress == [500, 724]
+
+def test_existing_solutions_are_skipped(fake_db):
+    save_program_solutions(solve_eight_queens_bitboard(8), N=8, program_type="sequential")
+    reads_before = fake_db.reads
+    commits_before = fake_db.commits
+
+    save_program_solutions(solve_eight_queens_bitboard(8), N=8, program_type="sequential")
+
+    # existence check reads one document, nothing new is written
+    assert fake_db.reads - reads_before == 1
+    assert fake_db.commits == commits_before
+    assert fake_db.count(SOLUTIONS_PATH) == 92
+
+def test_save_records_game_round(fake_db):
+    save_program_solutions(iter_solutions(8), N=8, program_type="threaded",
+                           time_took=0.5, player_name="piyumi", solutions_count=92)
+
+    rounds = [doc.to_dict() for doc in
+              fake_db.collection("eightqueens").document("game_rounds").collection("threaded_N8").stream()]
+    assert len(rounds) == 1
+    assert rounds[0]["solutions_count"] == 92
+    assert rounds[0]["player_name"] == "piyumi"
+
+ROUNDS_PATH = "eightqueens/game_rounds/sequential_N8"
+
+def add_old_rounds(db, count):
+    rounds = db.collection("eightqueens").document("game_rounds").collection("sequential_N8")
+    for i in range(count):
+        rounds.document(f"round{i + 1}").set({"player_name": "old", "time_taken": 0.1})
+
+def test_round_cost_does_not_grow_with_history(fake_db):
+    add_old_rounds(fake_db, 10000)
+    # first save migrates the counter from the existing rounds
+    save_game_round("sequential", 8, "piyumi", 0.2, 92)
+    assert fake_db.docs[ROUNDS_PATH + "/round10001"]["player_name"] == "piyumi"
+
+    reads_before = fake_db.reads
+    save_game_round("sequential", 8, "imalka", 0.3, 92)
+
+    # only the counter document is read, not the 10k rounds
+    assert fake_db.reads - reads_before == 1
+    assert fake_db.docs[ROUNDS_PATH + "/round10002"]["player_name"] == "imalka"
 
-def test_save_sequential_calls_firestore(mock_firestore):
-    solutions = [[0,1,2,3,4,5,6,7]]  # dummy solution
-    save_sequencial_solutions_eigh_queens(solutions, N=8)
+def test_concurrent_rounds_get_unique_ids(fake_db):
+    add_old_rounds(fake_db, 10)
 
-    #  call add for each solution
-    assert mock_firestore.add.call_count == len(solutions)
+    def play(player):
+        for _ in range(25):
+            save_game_round("sequential", 8, player, 0.1, 92)
 
-def test_save_threaded_calls_firestore(mock_firestore):
-    solutions = [[7,6,5,4,3,2,1,0]]
-    save_threaded_solutions_eight_queens(solutions, N=8)
+    threads = [threading.Thread(target=play, args=(f"player{i}",)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
 
-    assert mock_firestore.add.call_count == len(solutions)
\ No newline at end of file
+    # 10 old rounds + 200 new ones, none overwritten
+    assert fake_db.count(ROUNDS_PATH) == 210
+    assert fake_db.docs["eightqueens/game_rounds/counters/sequential_N8"]["count"] == 210
@@ -0,0 +1,131 @@
+import json
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Mock firebase when it is not installed
+sys.modules.setdefault('firebase_admin', MagicMock())
+sys.modules.setdefault('firebase_admin.firestore', MagicMock())
+sys.modules.setdefault('firebase_admin.credentials', MagicMock())
+
+from fake_firestore import FakeFirestore
+from EightQueensPuzzle.Solutions.bitboard import iter_solutions
+from EightQueensPuzzle.found_solution_log import FoundSolutionLog, file_lock
+
+FOUND_PATH = "eightqueens/player_solutions/N{}"
+
+@pytest.fixture
+def fake_db():
+    db = FakeFirestore()
+    with patch("EightQueensPuzzle.eightqueen_dbUtil.firestore") as mock_fs:
+        mock_fs.client.return_value = db
+        yield db
+
+@pytest.fixture
+def log_path(tmp_path):
+    return str(tmp_path / "found.jsonl")
+
+def test_records_wait_for_flush(fake_db, log_path):
+    log = FoundSolutionLog(log_path)
+    solutions = list(iter_solutions(8))[:3]
+    for solution in solutions:
+        log.record_found("piyumi", solution)
+
+    # nothing leaves the machine until the flusher runs
+    assert fake_db.writes == 0
+    assert log.pending_changes(8) == (False, solutions)
+
+    assert log.flush() == 3
+    assert fake_db.count(FOUND_PATH.format(8)) == 3
+    assert fake_db.commits == 1
+    assert log.pending == []
+
+def test_replayed_records_do_not_duplicate(fake_db, log_path):
+    log = FoundSolutionLog(log_path)
+    solution = next(iter_solutions(8))
+    log.record_found("piyumi", solution)
+    log.flush()
+
+    # the sync went through but was not marked: it is sent again on restart
+    log.pending = [json.loads(line) for line in open(log_path) if '"found"' in line]
+    log.flush()
+    assert fake_db.count(FOUND_PATH.format(8)) == 1
+
+def test_clear_deletes_in_batches(fake_db, log_path):
+    log = FoundSolutionLog(log_path)
+    for solution in iter_solutions(10):
+        log.record_found("piyumi", solution)
+    log.flush()
+    assert fake_db.count(FOUND_PATH.format(10)) == 724
+    commits_before = fake_db.commits
+
+    log.record_clear(10)
+    log.record_found("imalka", next(iter_solutions(10)))
+    assert log.pending_changes(10) == (True, [next(iter_solutions(10))])
+    log.flush()
+
+    # 724 deletes in two commits, then the find logged after the reset
+    assert fake_db.commits - commits_before == 3
+    assert fake_db.count(FOUND_PATH.format(10)) == 1
+
+def test_pending_records_survive_restart(fake_db, log_path):
+    log = FoundSolutionLog(log_path)
+    first, second = list(iter_solutions(8))[:2]
+    log.record_found("piyumi", first)
+    log.flush()
+    log.record_found("imalka", second)
+
+    # the game closed before the second record was synced
+    reopened = FoundSolutionLog(log_path)
+    assert reopened.pending_changes(8) == (False, [second])
+    # synced records are compacted away
+    assert sum(1 for line in open(log_path) if '"found"' in line) == 1
+
+    reopened.flush()
+    assert fake_db.count(FOUND_PATH.format(8)) == 2
+
+def test_damaged_last_line_is_skipped(fake_db, log_path):
+    log = FoundSolutionLog(log_path)
+    solution = next(iter_solutions(8))
+    log.record_found("piyumi", solution)
+    with open(log_path, "a") as f:
+        f.write('{"seq": 9, "op": "fou')
+
+    assert FoundSolutionLog(log_path).pending_changes(8) == (False, [solution])
+
+def test_failed_sync_keeps_records_pending(log_path):
+    log = FoundSolutionLog(log_path)
+    log.record_found("piyumi", next(iter_solutions(8)))
+    with patch("EightQueensPuzzle.eightqueen_dbUtil.firestore") as mock_fs:
+        mock_fs.client.side_effect = RuntimeError("offline")
+        with pytest.raises(RuntimeError):
+            log.flush()
+    assert len(log.pending) == 1
+
+def test_flusher_syncs_in_background(fake_db, log_path):
+    log = FoundSolutionLog(log_path)
+    log.start_flusher(interval=0.05)
+    log.record_found("piyumi", next(iter_solutions(8)))
+
+    deadline = time.time() + 5
+    while log.pending and time.time() < deadline:
+        time.sleep(0.02)
+    assert log.pending == []
+    assert fake_db.count(FOUND_PATH.format(8)) == 1
+
+def test_compaction_waits_for_the_file_lock(log_path):
+    FoundSolutionLog(log_path).record_found("piyumi", next(iter_solutions(8)))
+    opened = []
+
+    # another process holding the lock (appending or compacting) makes a
+    # new log wait instead of replacing the file underneath it
+    with file_lock(log_path + ".lock"):
+        opener = threading.Thread(target=lambda: opened.append(FoundSolutionLog(log_path)))
+        opener.start()
+        opener.join(timeout=0.2)
+        assert not opened
+    opener.join(timeout=5)
+    assert len(opened[0].pending) == 1
@@ -0,0 +1,67 @@
+import os
+import time
+
+from EightQueensPuzzle import game_host
+from EightQueensPuzzle.game_host import GameHost
+
+# the host runs these in its own process instead of opening Tk windows
+
+WARM_UP_SECONDS = 0.2
+
+def fake_warm_up():
+    time.sleep(WARM_UP_SECONDS)     # stands in for the tkinter/firebase imports
+
+def fake_game(player_name, board_size):
+    if player_name == "crash":
+        raise RuntimeError("board exploded")
+    with open(os.environ["GAME_HOST_LOG"], "a") as f:
+        f.write(f"{os.getpid()} {player_name} {board_size}\n")
+
+def read_log(path):
+    with open(path) as f:
+        return [line.split() for line in f]
+
+def test_host_serves_several_games(tmp_path, monkeypatch):
+    log = tmp_path / "games.log"
+    monkeypatch.setenv("GAME_HOST_LOG", str(log))
+    host = GameHost(game_runner=fake_game, warm_up_func=fake_warm_up)
+    try:
+        host.start()
+        assert host.play("piyumi", 8) is None
+
+        # later launches reuse the warm process instead of starting a new one
+        start = time.perf_counter()
+        assert host.play("imalka", 10) is None
+        assert time.perf_counter() - start < WARM_UP_SECONDS
+
+        entries = read_log(log)
+        assert [entry[1:] for entry in entries] == [["piyumi", "8"], ["imalka", "10"]]
+        assert entries[0][0] == entries[1][0]      # same host pid
+    finally:
+        host.stop()
+    assert not host.is_running()
+
+def test_game_errors_are_reported(tmp_path, monkeypatch):
+    monkeypatch.setenv("GAME_HOST_LOG", str(tmp_path / "games.log"))
+    host = GameHost(game_runner=fake_game, warm_up_func=fake_warm_up)
+    try:
+        assert host.play("crash") == "board exploded"
+        # the host survives a failed game
+        assert host.play("warna") is None
+    finally:
+        host.stop()
+
+def test_idle_callback_runs_while_waiting(tmp_path, monkeypatch):
+    monkeypatch.setenv("GAME_HOST_LOG", str(tmp_path / "games.log"))
+    host = GameHost(game_runner=fake_game, warm_up_func=fake_warm_up)
+    ticks = []
+    try:
+        host.play("piyumi", idle_callback=lambda: ticks.append(1), poll_interval=0.02)
+    finally:
+        host.stop()
+    # the first game waits for warm-up, so the caller was called back
+    assert ticks
+
+def test_host_uses_spawn():
+    # the host must not inherit the dashboard's pygame state or threads
+    assert game_host._mp_context.get_start_method() == "spawn"
@@ -0,0 +1,42 @@
+from EightQueensPuzzle.Solutions.bitboard import solve_eight_queens_bitboard
+from EightQueensPuzzle.solution_index import RuleIndex, SolutionIndex, encode_solution, get_solution_index
+
+def test_encode_solution_is_unique():
+    solutions = solve_eight_queens_bitboard(8)
+    codes = {encode_solution(solution) for solution in solutions}
+    assert len(codes) == 92
+
+def test_encode_rejects_partial_boards():
+    assert encode_solution([-1, 4, 7, 5, 2, 6, 1, 3]) is None
+    assert encode_solution([0, 4, 7], N=8) is None
+
+def test_index_lookup():
+    index = SolutionIndex(8, solve_eight_queens_bitboard(8))
+    assert len(index) == 92
+    assert [0, 4, 7, 5, 2, 6, 1, 3] in index
+    assert [0, 1, 2, 3, 4, 5, 6, 7] not in index
+    assert [-1, 4, 7, 5, 2, 6, 1, 3] not in index
+
+def test_index_incremental_updates():
+    found = SolutionIndex(8)
+    solution = [0, 4, 7, 5, 2, 6, 1, 3]
+    assert solution not in found
+    found.add(solution)
+    assert solution in found
+    found.clear()
+    assert len(found) == 0
+
+def test_index_large_board():
+    solutions = solve_eight_queens_bitboard(12)
+    index = SolutionIndex(12, solutions)
+    assert len(index) == 14200
+    assert solutions[-1] in index
+
+def test_rule_index_for_large_boards():
+    # N=13 is not catalogued: checked directly, count from the known table
+    index = get_solution_index(13)
+    assert isinstance(index, RuleIndex)
+    assert len(index) == 73712
+    assert [0, 2, 4, 1, 8, 11, 9, 12, 3, 5, 7, 10, 6] in index
+    assert [0, 2, 4, 1, 8, 11, 9, 12, 3, 5, 7, 6, 10] not in index
+    assert [0, 2, 4] not in index
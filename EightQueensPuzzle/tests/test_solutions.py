@@ -1,5 +1,18 @@
-from EightQueensPuzzle.Solutions.sequential import solve_eight_queens_sequential
+import types
+from itertools import permutations
+
+from EightQueensPuzzle.Solutions import count_solutions, iter_chunks, iter_solutions
+from EightQueensPuzzle.Solutions.sequential import iter_solutions_sequential, solve_eight_queens_sequential
 from EightQueensPuzzle.Solutions.threaded import solve_eight_queens_threaded
+from EightQueensPuzzle.Solutions.bitboard import analyze_partial, is_valid_solution, solve_eight_queens_bitboard
+from EightQueensPuzzle.Solutions import multiprocess
+from EightQueensPuzzle.Solutions.multiprocess import report_speedup, solve_eight_queens_multiprocess
+from EightQueensPuzzle.Solutions.symmetry import (
+    expand_orbits,
+    fundamental_family,
+    solve_eight_queens_symmetric,
+    solve_fundamental_solutions
+)
 
 def test_sequential_solution_count():
     all_solutions = solve_eight_queens_sequential()
@@ -34,4 +47,106 @@ def test_threaded_solutions_valid():
                 # check same col
                 assert solution[r1] != solution[r2]
                 # check diagonal
-                assert abs(r1 - r2) != abs(solution[r1] - solution[r2])
\ No newline at end of file
+                assert abs(r1 - r2) != abs(solution[r1] - solution[r2])
+
+def test_bitboard_solution_count():
+    all_solutions = solve_eight_queens_bitboard()
+    assert len(all_solutions) == 92
+
+def test_bitboard_matches_sequential():
+    # same solutions in the same order as the sequential solver
+    assert solve_eight_queens_bitboard() == solve_eight_queens_sequential()
+
+def test_bitboard_larger_boards():
+    # known solution counts
+    assert len(solve_eight_queens_bitboard(4)) == 2
+    assert len(solve_eight_queens_bitboard(10)) == 724
+    assert len(solve_eight_queens_bitboard(12)) == 14200
+
+def test_multiprocess_matches_sequential():
+    # merged in deterministic order, whatever finishes first
+    all_solutions = solve_eight_queens_multiprocess(max_workers=2)
+    assert len(all_solutions) == 92
+    assert all_solutions == solve_eight_queens_sequential()
+
+def test_multiprocess_three_row_split():
+    all_solutions = solve_eight_queens_multiprocess(10, prefix_rows=3, max_workers=2)
+    assert all_solutions == solve_eight_queens_bitboard(10)
+
+def test_report_speedup_has_single_process_baseline(monkeypatch):
+    # the list-based solver is skipped above SEQUENTIAL_MAX_N
+    monkeypatch.setattr(multiprocess, "SEQUENTIAL_MAX_N", 6)
+    rows = report_speedup(sizes=[6, 7], max_workers=2)
+    assert [row["solutions"] for row in rows] == [4, 40]
+    assert rows[0]["speedup"] is not None and rows[0]["sequential_time"] is not None
+    assert rows[1]["speedup"] is None and rows[1]["sequential_time"] is None
+    assert all(row["bitboard_time"] > 0 and row["pool_gain"] > 0 for row in rows)
+
+def test_fundamental_solution_count():
+    assert len(solve_fundamental_solutions()) == 12
+    # odd board: middle column of row 0 is searched too
+    assert len(solve_fundamental_solutions(9)) == 46
+
+def test_symmetric_matches_sequential():
+    assert solve_eight_queens_symmetric() == solve_eight_queens_sequential()
+    assert expand_orbits(solve_fundamental_solutions(9)) == solve_eight_queens_bitboard(9)
+
+def test_fundamental_family():
+    solution = [0, 4, 7, 5, 2, 6, 1, 3]
+    mirrored = [7 - col for col in solution]
+    assert fundamental_family(solution) is not None
+    assert fundamental_family(solution) == fundamental_family(mirrored)
+    assert fundamental_family([0, 1, 2, 3, 4, 5, 6, 7]) is None
+
+def test_iter_solutions_is_lazy():
+    stream = iter_solutions()
+    assert isinstance(stream, types.GeneratorType)
+    assert isinstance(iter_solutions_sequential(), types.GeneratorType)
+    assert next(stream) == [0, 4, 7, 5, 2, 6, 1, 3]
+
+def test_iter_solutions_matches_sequential():
+    assert list(iter_solutions()) == solve_eight_queens_sequential()
+    assert list(iter_solutions(9)) == solve_eight_queens_bitboard(9)
+
+def test_count_solutions():
+    assert count_solutions() == 92
+    assert count_solutions(6) == 4
+    assert count_solutions(11) == 2680
+
+def test_iter_chunks():
+    chunks = list(iter_chunks(iter_solutions(), 40))
+    assert [len(chunk) for chunk in chunks] == [40, 40, 12]
+
+def test_is_valid_solution():
+    for solution in solve_eight_queens_bitboard(6):
+        assert is_valid_solution(solution)
+    assert not is_valid_solution([0, 1, 2, 3, 4, 5, 6, 7])
+    assert not is_valid_solution([0, 4, 7, 5, 2, 6, 1, 8])
+    # exactly 92 of the 8! permutations pass
+    assert sum(1 for p in permutations(range(8)) if is_valid_solution(list(p))) == 92
+
+def test_hint_counts_match_solution_list():
+    all_solutions = solve_eight_queens_bitboard(8)
+    # queens in scattered rows, not just a prefix
+    for queens in [set(), {(3, 5)}, {(0, 0), (7, 3)}, {(2, 4), (6, 1), (4, 7)}]:
+        expected = sum(1 for s in all_solutions if all(s[row] == col for (row, col) in queens))
+        hint = analyze_partial(8, queens)
+        assert hint["completions"] == expected
+        assert hint["exact"]
+        assert hint["solvable"] == (expected > 0)
+
+def test_hint_legal_cells_and_conflicts():
+    hint = analyze_partial(8, {(0, 0), (1, 1)})
+    assert hint["attacked_queens"] == {(0, 0), (1, 1)}
+    assert hint["solvable"] is False
+
+    hint = analyze_partial(8, {(0, 0)})
+    assert 0 not in hint["legal_cells"]
+    assert hint["legal_cells"][1] == [2, 3, 4, 5, 6, 7]
+    assert hint["legal_cells"][7] == [1, 2, 3, 4, 5, 6]
+
+def test_hint_stops_at_node_limit():
+    hint = analyze_partial(12, set(), node_limit=1000)
+    assert not hint["exact"]
+    assert 0 < hint["completions"] < 14200
+    assert hint["solvable"] is True
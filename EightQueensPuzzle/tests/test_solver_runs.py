@@ -0,0 +1,77 @@
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Mock firebase when it is not installed
+sys.modules.setdefault('firebase_admin', MagicMock())
+sys.modules.setdefault('firebase_admin.firestore', MagicMock())
+sys.modules.setdefault('firebase_admin.credentials', MagicMock())
+
+from EightQueensPuzzle import solver_runs
+from EightQueensPuzzle.solver_runs import get_solver_run, record_solver_runs, run_key, solvers_for_board
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(solver_runs, "CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+def counting_solver(calls):
+    def solve(N):
+        calls.append(N)
+        return [[0]] * 92
+    return solve
+
+def test_solver_run_is_memoized_on_disk(monkeypatch):
+    calls = []
+    monkeypatch.setitem(solver_runs.SOLVERS, "sequential", (counting_solver(calls), 2))
+
+    run, solutions = get_solver_run("sequential", 8)
+    assert len(solutions) == run["solutions_count"] == 92
+
+    run_again, solutions = get_solver_run("sequential", 8)
+    assert solutions is None
+    assert run_again == run
+    assert calls == [8]
+
+def test_new_solver_version_recomputes(monkeypatch):
+    calls = []
+    monkeypatch.setitem(solver_runs.SOLVERS, "sequential", (counting_solver(calls), 2))
+    get_solver_run("sequential", 8)
+
+    monkeypatch.setitem(solver_runs.SOLVERS, "sequential", (counting_solver(calls), 3))
+    assert run_key("sequential", 8) == "sequential:N8:v3"
+    _, solutions = get_solver_run("sequential", 8)
+    assert solutions is not None
+    assert calls == [8, 8]
+
+def test_solvers_sized_to_board():
+    assert solvers_for_board(8) == ["sequential", "threaded"]
+    assert solvers_for_board(12) == ["bitboard"]
+    assert solvers_for_board(14) == []
+
+@patch("EightQueensPuzzle.eightqueen_dbUtil.save_program_solutions")
+@patch("EightQueensPuzzle.eightqueen_dbUtil.save_game_round")
+def test_rounds_recorded_from_cache(mock_round, mock_save):
+    record_solver_runs("piyumi", 6)
+    assert mock_save.call_count == 2
+    assert mock_round.call_count == 2
+
+    # second launch: no solving and no solution upload, only the rounds
+    mock_save.reset_mock()
+    with patch.object(solver_runs.time, "perf_counter", side_effect=AssertionError("solver ran")):
+        record_solver_runs("imalka", 6)
+    mock_save.assert_not_called()
+    assert mock_round.call_count == 4
+    assert mock_round.call_args[0][:3] == ("threaded", 6, "imalka")
+
+@patch("EightQueensPuzzle.eightqueen_dbUtil.save_program_solutions")
+@patch("EightQueensPuzzle.eightqueen_dbUtil.save_game_round")
+def test_upload_is_the_timed_solver_output(mock_round, mock_save, monkeypatch):
+    solved = [[1, 3, 0, 2], [2, 0, 3, 1]]
+    monkeypatch.setitem(solver_runs.SOLVERS, "sequential", (lambda N: solved, 2))
+    monkeypatch.setitem(solver_runs.SOLVERS, "threaded", (lambda N: solved[:1], 2))
+    record_solver_runs("piyumi", 4)
+
+    uploads = {call.kwargs["program_type"]: call.args[0] for call in mock_save.call_args_list}
+    assert uploads == {"sequential": solved, "threaded": solved[:1]}
@@ -34,10 +34,10 @@ def show_toast(title, message, duration=3):
 
     Thread(target=toast_thread, daemon=True).start()
 
-def show_win_popup():
+def show_win_popup(detail=None):
     win = tk.Toplevel()
     win.title("Congratulations!")
-    win.geometry("350x200")
+    win.geometry("350x230" if detail else "350x200")
     win.resizable(False, False)
     win.configure(bg="#ffffff")
 
@@ -63,4 +63,15 @@ def show_win_popup():
         font=("Arial", 14, "bold"),
         bg="white"
     )
-    msg_label.pack(pady=5)
\ No newline at end of file
+    msg_label.pack(pady=5)
+
+    # Optional extra line, e.g. the solution family
+    if detail:
+        detail_label = tk.Label(
+            win,
+            text=detail,
+            font=("Arial", 11),
+            fg="#555555",
+            bg="white"
+        )
+        detail_label.pack(pady=5)
@@ -0,0 +1,73 @@
+from astar_algorithm import AStarAlgorithm
+from bfs_algorithm import BFSAlgorithm
+from bidirectional_bfs_algorithm import BidirectionalBFSAlgorithm
+from board_generator import generate_boards, get_jump_table, route_dice
+from dijkstra_algorithm import DijkstraAlgorithm
+from reverse_dp_algorithm import ReverseDPAlgorithm
+from zero_one_bfs_algorithm import ZeroOneBFSAlgorithm
+
+# Shortest-path algorithms a round can run. Each class takes
+# (board, verbose) and has find_shortest_path() -> (moves, path, time),
+# reading the board's shared jump table. A registered algorithm is run by
+# solve_round and shown on the result screen without touching the
+# controller.
+
+PATH_ALGORITHMS = {}
+
+def register_algorithm(key, label, algorithm_class):
+
+    PATH_ALGORITHMS[key] = {'label': label, 'class': algorithm_class}
+
+register_algorithm('bfs', 'BFS', BFSAlgorithm)
+register_algorithm('dijkstra', 'Dijkstra', DijkstraAlgorithm)
+register_algorithm('bidirectional_bfs', 'Bidirectional BFS', BidirectionalBFSAlgorithm)
+register_algorithm('zero_one_bfs', '0-1 BFS', ZeroOneBFSAlgorithm)
+register_algorithm('astar', 'A*', AStarAlgorithm)
+register_algorithm('reverse_dp', 'Reverse DP', ReverseDPAlgorithm)
+
+# solve_round also times the Markov chain solver under this key
+MARKOV_KEY = 'markov'
+MARKOV_LABEL = 'Markov'
+
+def algorithm_label(key):
+
+    if key == MARKOV_KEY:
+        return MARKOV_LABEL
+    return PATH_ALGORITHMS[key]['label'] if key in PATH_ALGORITHMS else key
+
+def algorithm_times(algorithm_results):
+
+    # {key: seconds} for every algorithm a round ran, in registry order with
+    # the Markov solver last; what reports and saved sessions record
+    keys = [key for key in PATH_ALGORITHMS if key in algorithm_results]
+    if MARKOV_KEY in algorithm_results:
+        keys.append(MARKOV_KEY)
+    return {key: algorithm_results[key]['time'] for key in keys}
+
+def run_path_algorithms(board, names=None, verbose=True):
+
+    # {key: {'moves', 'path', 'dice', 'time'}} for the chosen algorithms (all by default)
+    jump = get_jump_table(board)
+    results = {}
+    for key in names or PATH_ALGORITHMS:
+        if key not in PATH_ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {key}")
+        algorithm = PATH_ALGORITHMS[key]['class'](board, verbose=verbose)
+        moves, path, execution_time = algorithm.find_shortest_path()
+        results[key] = {'moves': moves, 'path': path, 'dice': route_dice(jump, path),
+                        'time': execution_time}
+    return results
+
+if __name__ == "__main__":
+    # average time per algorithm over random 12x12 boards
+    boards = generate_boards(12, 200, seed=1)
+    totals = {key: 0.0 for key in PATH_ALGORITHMS}
+    for board in boards:
+        results = run_path_algorithms(board, verbose=False)
+        assert len({result['moves'] for result in results.values()}) == 1
+        for key, result in results.items():
+            totals[key] += result['time']
+
+    print(f"\n{'algorithm':<20} {'avg time (us)':>14}")
+    for key, total in totals.items():
+        print(f"{PATH_ALGORITHMS[key]['label']:<20} {total / len(boards) * 1_000_000:>14.1f}")
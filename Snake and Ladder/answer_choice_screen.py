@@ -4,10 +4,22 @@ import random
 
 class AnswerChoiceScreen:
      
-    def __init__(self, root, game_state, correct_answer, on_choice_callback):
+    def __init__(self, root, game_state, correct_answer, on_choice_callback, start_position=1):
        
         self.root = root
         self.game_state = game_state
+        self.start_position = start_position
+        # any start cell can be asked about, the answer comes from the moves
+        # table; a passed-in answer has to agree with it
+        moves_table = game_state.moves_table
+        if moves_table is not None:
+            table_answer = moves_table.moves_from(start_position)
+            if correct_answer is not None and correct_answer != table_answer:
+                raise ValueError(f"Answer {correct_answer} does not match the "
+                                 f"{table_answer} moves from cell {start_position}")
+            correct_answer = table_answer
+        elif correct_answer is None or start_position != 1:
+            raise ValueError("A moves table is needed to ask about another start cell")
         self.correct_answer = correct_answer
         self.on_choice_callback = on_choice_callback
         self.styles = GameStyles()
@@ -90,6 +102,7 @@ class AnswerChoiceScreen:
         
         info_data = [
             ("👤 Player", self.game_state.player_name),
+            ("📍 Start Cell", str(self.start_position)),
             ("📏 Board Size", f"{board_info['board_size']}×{board_info['board_size']}"),
             ("🎯 Total Cells", str(board_info['total_cells'])),
             ("🐍 Snakes", str(board_info['num_snakes'])),
@@ -124,9 +137,15 @@ class AnswerChoiceScreen:
         question_area = tk.Frame(right_col, bg=self.styles.get_color('bg_main'))
         question_area.pack(fill=tk.BOTH, expand=True, padx=(10,0), pady=10)
         
+        if self.start_position == 1:
+            question = "What is the MINIMUM number of dice throws\nneeded to reach the last cell?"
+        else:
+            question = (f"What is the MINIMUM number of dice throws\n"
+                        f"needed to reach the last cell from cell {self.start_position}?")
+        
         tk.Label(
             question_area,
-            text="What is the MINIMUM number of dice throws\nneeded to reach the last cell?",
+            text=question,
             font=('Arial', 15, 'bold'),
             bg=self.styles.get_color('bg_main'),
             fg=self.styles.get_color('text_light'),
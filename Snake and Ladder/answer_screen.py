@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import messagebox
 from styles import GameStyles
+from algorithm_registry import algorithm_label, algorithm_times
 
 class AnswerScreen:
     
@@ -81,8 +82,8 @@ class AnswerScreen:
             fg=self.styles.get_color('text_muted')
         ).pack(pady=(30, 5))
         
-        perf_text = (f"BFS: {self.algorithm_results['bfs']['time']*1000:.2f}ms  •  "
-                    f"Dijkstra: {self.algorithm_results['dijkstra']['time']*1000:.2f}ms")
+        perf_text = "  •  ".join(f"{algorithm_label(key)}: {seconds*1000:.2f}ms"
+                                 for key, seconds in algorithm_times(self.algorithm_results).items())
         
         tk.Label(
             container,
@@ -0,0 +1,115 @@
+import random
+import timeit
+from collections import deque
+
+from board_generator import BoardGenerator, build_jump_table
+
+# Micro-benchmark: snake/ladder lookups through the two dicts (the old
+# _apply_snake_or_ladder) against the flat jump table, on a real 12x12
+# board and a synthetic 100x100 board. Run: python benchmark_jump_table.py
+
+class SyntheticBoard:
+
+    def __init__(self, board_size, seed=1):
+
+        rng = random.Random(seed)
+        self.board_size = board_size
+        self.total_cells = board_size * board_size
+        self.snakes = {}
+        self.ladders = {}
+
+        # same rule of thumb as the game: N-2 of each, no shared cells
+        cells = rng.sample(range(2, self.total_cells), 4 * (board_size - 2))
+        for i in range(board_size - 2):
+            low, high = sorted(cells[4 * i:4 * i + 2])
+            self.ladders[low] = high
+            low, high = sorted(cells[4 * i + 2:4 * i + 4])
+            self.snakes[high] = low
+        self.jump_table = build_jump_table(self.total_cells, self.snakes, self.ladders)
+
+def apply_with_dicts(board, position):
+
+    if position in board.ladders:
+        return board.ladders[position]
+    if position in board.snakes:
+        return board.snakes[position]
+    return position
+
+def bfs_with_dicts(board):
+
+    target = board.total_cells
+    visited = {1}
+    queue = deque([(1, 0)])
+    while queue:
+        position, moves = queue.popleft()
+        if position == target:
+            return moves
+        for dice_value in range(1, 7):
+            next_position = position + dice_value
+            if next_position > target:
+                continue
+            final_position = apply_with_dicts(board, next_position)
+            if final_position not in visited:
+                visited.add(final_position)
+                queue.append((final_position, moves + 1))
+    return -1
+
+def bfs_with_table(board):
+
+    target = board.total_cells
+    jump = board.jump_table
+    visited = {1}
+    queue = deque([(1, 0)])
+    while queue:
+        position, moves = queue.popleft()
+        if position == target:
+            return moves
+        for dice_value in range(1, 7):
+            next_position = position + dice_value
+            if next_position > target:
+                continue
+            final_position = jump[next_position]
+            if final_position not in visited:
+                visited.add(final_position)
+                queue.append((final_position, moves + 1))
+    return -1
+
+def lookups_with_dicts(board):
+
+    for position in range(1, board.total_cells + 1):
+        apply_with_dicts(board, position)
+
+def lookups_with_table(board):
+
+    jump = board.jump_table
+    for position in range(1, board.total_cells + 1):
+        jump[position]
+
+def best_time_us(func, board, number):
+
+    # best of 5 repeats, per call, in microseconds
+    times = timeit.repeat(lambda: func(board), number=number, repeat=5)
+    return min(times) / number * 1_000_000
+
+def run_benchmark():
+
+    random.seed(7)
+    boards = [
+        ("12x12", BoardGenerator(12), 2000),
+        ("100x100", SyntheticBoard(100), 20),
+    ]
+
+    print(f"\n{'board':<9} {'case':<14} {'dicts(us)':>11} {'table(us)':>11} {'speedup':>8}")
+    rows = []
+    for name, board, number in boards:
+        assert bfs_with_dicts(board) == bfs_with_table(board)
+        for case, old, new in [("bfs", bfs_with_dicts, bfs_with_table),
+                               ("cell lookups", lookups_with_dicts, lookups_with_table)]:
+            old_time = best_time_us(old, board, number)
+            new_time = best_time_us(new, board, number)
+            rows.append({'board': name, 'case': case, 'dicts_us': old_time, 'table_us': new_time})
+            print(f"{name:<9} {case:<14} {old_time:>11.1f} {new_time:>11.1f} {old_time / new_time:>7.2f}x")
+    return rows
+
+if __name__ == "__main__":
+    run_benchmark()
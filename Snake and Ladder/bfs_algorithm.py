@@ -1,26 +1,43 @@
 from collections import deque
 import time
 
+from board_generator import get_jump_table, new_parent_array, route_dice, trace_path
+
 class BFSAlgorithm:  
     
-    def __init__(self, board):
+    def __init__(self, board, verbose=True):
         
         self.board = board
         self.total_cells = board.total_cells
         self.snakes = board.snakes
         self.ladders = board.ladders
+        self.jump = get_jump_table(board)
+        self.verbose = verbose
+        
+        # optimal route from the last search: cells rested on and dice rolled
+        self.path = []
+        self.dice = []
     
     def find_minimum_moves(self):
         
-        print("\n🔍 Running BFS Algorithm...")
+        moves, _, execution_time = self.find_shortest_path()
+        return moves, execution_time
+    
+    def find_shortest_path(self):
+        
+        if self.verbose:
+            print("\n🔍 Running BFS Algorithm...")
         start_time = time.time()
         
         # Start from cell 1, target is last cell
         start = 1
         target = self.total_cells
+        jump = self.jump
         
         # BFS initialization
-        visited = set([start])
+        # parent[cell] = cell the player rolled from, 0 = not reached yet
+        parent = new_parent_array(target)
+        parent[start] = start
         queue = deque([(start, 0)])  # (current_position, number_of_moves)
         
         while queue:
@@ -29,8 +46,11 @@ class BFSAlgorithm:
             # Check if we reached the target
             if current_position == target:
                 execution_time = time.time() - start_time
-                print(f"✅ BFS Found: {moves} moves in {execution_time*1000:.4f}ms")
-                return moves, execution_time
+                if self.verbose:
+                    print(f"✅ BFS Found: {moves} moves in {execution_time*1000:.4f}ms")
+                self.path = trace_path(parent, start, target)
+                self.dice = route_dice(jump, self.path)
+                return moves, self.path, execution_time
             
             # Try all possible dice rolls (1 to 6)
             for dice_value in range(1, 7):
@@ -41,30 +61,30 @@ class BFSAlgorithm:
                     continue
                 
                 # Apply snake or ladder if present
-                final_position = self._apply_snake_or_ladder(next_position)
+                final_position = jump[next_position]
                 
                 # If not visited, add to queue
-                if final_position not in visited:
-                    visited.add(final_position)
+                if not parent[final_position]:
+                    parent[final_position] = current_position
                     queue.append((final_position, moves + 1))
         
         # No path found (shouldn't happen in valid game)
         execution_time = time.time() - start_time
-        print(f"❌ BFS: No path found")
-        return -1, execution_time
+        if self.verbose:
+            print(f"❌ BFS: No path found")
+        return -1, [], execution_time
     
-    def _apply_snake_or_ladder(self, position):
-        
-        # Check if there's a ladder at this position
-        if position in self.ladders:
-            return self.ladders[position]
+    def find_optimal_route(self):
         
-        # Check if there's a snake at this position
-        if position in self.snakes:
-            return self.snakes[position]
+        # (cells rested on from start to goal, dice to roll for each step)
+        if not self.path:
+            self.find_shortest_path()
+        return self.path, self.dice
+    
+    def _apply_snake_or_ladder(self, position):
         
-        # No snake or ladder
-        return position
+        # Ladder top, snake tail, or the same cell
+        return self.jump[position]
     
     def get_algorithm_info(self):
         
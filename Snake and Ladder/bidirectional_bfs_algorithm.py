@@ -0,0 +1,115 @@
+import time
+
+from board_generator import get_jump_table, trace_path
+
+class BidirectionalBFSAlgorithm:
+
+    def __init__(self, board, verbose=True):
+
+        self.board = board
+        self.total_cells = board.total_cells
+        self.snakes = board.snakes
+        self.ladders = board.ladders
+        self.jump = get_jump_table(board)
+        self.verbose = verbose
+
+    def find_minimum_moves(self):
+
+        moves, _, execution_time = self.find_shortest_path()
+        return moves, execution_time
+
+    def _previous_cells(self, cell, landing_cells):
+
+        # resting cells one roll before cell: roll onto a cell that is,
+        # or jumps to, cell
+        target = self.total_cells
+        jump = self.jump
+        for landing in landing_cells[cell]:
+            for dice_value in range(1, 7):
+                previous = landing - dice_value
+                if previous < 1:
+                    break
+                if jump[previous] == previous and previous != target:
+                    yield previous
+
+    def find_shortest_path(self):
+
+        if self.verbose:
+            print("\n🔍 Running Bidirectional BFS...")
+        start_time = time.time()
+
+        start = 1
+        target = self.total_cells
+        jump = self.jump
+
+        # landing_cells[cell] = cells a player can land on and end up at cell
+        landing_cells = [[] for _ in range(target + 1)]
+        for cell in range(1, target + 1):
+            landing_cells[jump[cell]].append(cell)
+
+        # depth from each side, -1 = not reached; parent points back to the
+        # start, following points on towards the last cell
+        forward = [-1] * (target + 1)
+        backward = [-1] * (target + 1)
+        parent = [0] * (target + 1)
+        following = [0] * (target + 1)
+        forward[start] = 0
+        backward[target] = 0
+        parent[start] = start
+        following[target] = target
+        forward_frontier = [start]
+        backward_frontier = [target]
+        meeting = [start] if start == target else []
+
+        # grow the smaller side one full level at a time until they touch
+        while not meeting and forward_frontier and backward_frontier:
+            next_frontier = []
+            if len(forward_frontier) <= len(backward_frontier):
+                for cell in forward_frontier:
+                    for dice_value in range(1, 7):
+                        next_position = cell + dice_value
+                        if next_position > target:
+                            break
+                        final_position = jump[next_position]
+                        if forward[final_position] == -1:
+                            forward[final_position] = forward[cell] + 1
+                            parent[final_position] = cell
+                            next_frontier.append(final_position)
+                            if backward[final_position] != -1:
+                                meeting.append(final_position)
+                forward_frontier = next_frontier
+            else:
+                for cell in backward_frontier:
+                    for previous in self._previous_cells(cell, landing_cells):
+                        if backward[previous] == -1:
+                            backward[previous] = backward[cell] + 1
+                            following[previous] = cell
+                            next_frontier.append(previous)
+                            if forward[previous] != -1:
+                                meeting.append(previous)
+                backward_frontier = next_frontier
+
+        execution_time = time.time() - start_time
+        if not meeting:
+            if self.verbose:
+                print(f"❌ Bidirectional BFS: No path found")
+            return -1, [], execution_time
+
+        middle = min(meeting, key=lambda cell: forward[cell] + backward[cell])
+        path = trace_path(parent, start, middle)
+        while path[-1] != target:
+            path.append(following[path[-1]])
+
+        moves = len(path) - 1
+        if self.verbose:
+            print(f"✅ Bidirectional BFS Found: {moves} moves in {execution_time*1000:.4f}ms")
+        return moves, path, execution_time
+
+    def get_algorithm_info(self):
+
+        return {
+            'name': 'Bidirectional BFS',
+            'description': 'Searches from the first and the last cell until the two searches meet',
+            'complexity': 'O(N) where N is number of cells',
+            'guarantees': 'Shortest path'
+        }
@@ -1,7 +1,87 @@
 import random
+from array import array
+from bisect import bisect_left, bisect_right
+
+# full restarts allowed when greedy placement cannot fit every snake/ladder
+MAX_GENERATION_ROUNDS = 20
+
+# snake/ladder relocations tried when aiming for a target difficulty
+DEFAULT_SEARCH_STEPS = 2000
+
+def build_jump_table(total_cells, snakes, ladders):
+    
+    # jump[cell] = cell the player ends on after landing on cell;
+    # built once per board so lookups are a single index, not two dict checks
+    typecode = 'H' if total_cells <= 0xFFFF else 'I'
+    jump = array(typecode, range(total_cells + 1))
+    for base, top in ladders.items():
+        jump[base] = top
+    for head, tail in snakes.items():
+        jump[head] = tail
+    return jump
+
+def get_jump_table(board):
+    
+    # boards from BoardGenerator carry their table; anything else
+    # with total_cells/snakes/ladders (e.g. test stubs) gets one built
+    jump = getattr(board, 'jump_table', None)
+    if jump is None:
+        jump = build_jump_table(board.total_cells, board.snakes, board.ladders)
+    return jump
+
+def new_parent_array(total_cells):
+    
+    # parent[cell] for path searches, 0 = not reached; same compact
+    # element type as the jump table instead of a dict per search
+    typecode = 'H' if total_cells <= 0xFFFF else 'I'
+    return array(typecode, [0]) * (total_cells + 1)
+
+def route_dice(jump, path):
+    
+    # dice value for each step of a path of resting cells (the smallest
+    # one when two rolls end on the same cell)
+    dice = []
+    for cell, next_cell in zip(path, path[1:]):
+        dice.append(next(d for d in range(1, 7)
+                         if cell + d < len(jump) and jump[cell + d] == next_cell))
+    return dice
+
+def trace_path(parent, start, target):
+    
+    # walk parent links back from target; parent[start] is start itself
+    path = [target]
+    while path[-1] != start:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path
+
 class BoardGenerator:
     
-    def __init__(self, board_size):
+    def __init__(self, board_size, rng=None, verbose=True, target_moves=None,
+                 target_expected=None, max_search_steps=DEFAULT_SEARCH_STEPS):
+        
+        self._setup(board_size, rng, verbose)
+        
+        # Generate NEW random board each time
+        self._generate_board()
+        self.jump_table = build_jump_table(self.total_cells, self.snakes, self.ladders)
+        
+        # Optional difficulty target: (low, high) ranges, inclusive
+        if target_moves is not None or target_expected is not None:
+            self.difficulty_met = self._fit_difficulty(target_moves, target_expected, max_search_steps)
+    
+    @classmethod
+    def from_layout(cls, board_size, snakes, ladders):
+        
+        # rebuild a saved board (e.g. from the board pool) without generating
+        board = cls.__new__(cls)
+        board._setup(board_size, None, False)
+        board.snakes = {int(head): int(tail) for head, tail in snakes.items()}
+        board.ladders = {int(base): int(top) for base, top in ladders.items()}
+        board.jump_table = build_jump_table(board.total_cells, board.snakes, board.ladders)
+        return board
+    
+    def _setup(self, board_size, rng, verbose):
         
         if not isinstance(board_size, int):
             raise ValueError("Board size must be an integer")
@@ -12,6 +92,8 @@ class BoardGenerator:
 
         self.board_size = board_size
         self.total_cells = board_size * board_size
+        self.rng = rng or random
+        self.verbose = verbose
 
         #set the number of snakes as N-2
         self.num_snakes = board_size - 2
@@ -21,110 +103,181 @@ class BoardGenerator:
         
         self.snakes = {}  # {head_position: tail_position}
         self.ladders = {}  # {base_position: top_position}
-        
-        # Generate NEW random board each time
-        self._generate_board()
+        self.difficulty_met = None
+        self.placement_complete = None
     
     def _generate_board(self):
         
-        print(f"\n🎲 Generating NEW random board...")
+        if self.verbose:
+            print(f"\n🎲 Generating NEW random board...")
+
+        # Greedy placement almost always fills every snake and ladder;
+        # if it gets stuck, start the board again
+        for _ in range(MAX_GENERATION_ROUNDS):
+            self.snakes = {}
+            self.ladders = {}
+
+            # Available cells, sorted (exclude cell 1 and last cell)
+            free_cells = list(range(2, self.total_cells))
+            
+            # Generate ladders 
+            self._generate_ladders(free_cells)
+            
+            # Generate snakes
+            self._generate_snakes(free_cells)
 
-        # Available cells (exclude cell 1 and last cell)
-        available_cells = set(range(2, self.total_cells))
+            self.placement_complete = (len(self.ladders) == self.num_ladders
+                                       and len(self.snakes) == self.num_snakes)
+            if self.placement_complete:
+                break
+        else:
+            if self.verbose:
+                print(f"⚠️  Only placed {len(self.ladders)} ladders and {len(self.snakes)} snakes")
         
-        # Generate ladders 
-        self._generate_ladders(available_cells)
+        if self.verbose:
+            print(f"✅ Board generated: {len(self.ladders)} ladders, {len(self.snakes)} snakes")
+            print(f"   Snakes will bring you DOWN ⬇️")
+            print(f"   Ladders will take you UP ⬆️")
+    
+    def _generate_ladders(self, free_cells, count=None):
         
-        # Generate snakes
-        self._generate_snakes(available_cells)
+        # Ladder base is in lower/middle of board
+        max_base = self.total_cells - (self.board_size * 2)
+        bases = free_cells[:bisect_right(free_cells, max_base)]
         
-        print(f"✅ Board generated: {len(self.ladders)} ladders, {len(self.snakes)} snakes")
-        print(f"   Snakes will bring you DOWN ⬇️")
-        print(f"   Ladders will take you UP ⬆️")
-    
-    def _generate_ladders(self, available_cells):
-       
-        ladder_count = 0
-        attempts = 0
-        max_attempts = 1000
+        # Calculate minimum and maximum climb
+        min_climb = max(5, self.board_size)
         
-        while ladder_count < self.num_ladders and attempts < max_attempts:
-            attempts += 1
-            
-            # Ladder base is in lower/middle of board
-            max_base = self.total_cells - (self.board_size * 2)
-            possible_bases = [c for c in available_cells if c <= max_base]
-            
-            if not possible_bases:
-                break
-            
-            #random starting position for ladder 
-            base = random.choice(possible_bases)
-            
-            # Calculate minimum and maximum climb
-            min_climb = max(5, self.board_size)
-            max_top = min(self.total_cells - 1, base + (self.board_size * 3))
-            
-            if base + min_climb > max_top:
-                continue
-            
-            # Find valid top positions
-            valid_tops = [t for t in range(base + min_climb, max_top + 1) 
-                         if t in available_cells and t != self.total_cells]
-            
-            if not valid_tops:
-                continue
-            
-            #random ending position for ladder
-            top = random.choice(valid_tops)
-            
-            # Add ladder
+        def top_range(base):
+            return base + min_climb, min(self.total_cells - 1, base + (self.board_size * 3))
+        
+        placed = self._place_pairs(free_cells, bases, top_range, count or self.num_ladders)
+        for base, top in placed:
             self.ladders[base] = top
-            available_cells.discard(base)
-            available_cells.discard(top)
-            ladder_count += 1
+        return placed
     
-    def _generate_snakes(self, available_cells):
+    def _generate_snakes(self, free_cells, count=None):
         
-        snake_count = 0
-        attempts = 0
-        max_attempts = 1000
+        # Snake head is in upper/middle 
+        min_head = self.total_cells // 3
+        heads = free_cells[bisect_left(free_cells, min_head):]
         
-        while snake_count < self.num_snakes and attempts < max_attempts:
-            attempts += 1
-            
-            # Snake head is in upper/middle 
-            min_head = self.total_cells // 3
-            possible_heads = [c for c in available_cells if c >= min_head]
-            
-            if not possible_heads:
-                break
-            
-            #random starting position for snake
-            head = random.choice(possible_heads)
-            
-            # Calculate minimum descent and tail range
-            min_descent = max(5, self.board_size)
-            min_tail = max(2, head - (self.board_size * 3))
-            
-            if head - min_descent < min_tail:
+        # Calculate minimum descent and tail range
+        min_descent = max(5, self.board_size)
+        
+        def tail_range(head):
+            return max(2, head - (self.board_size * 3)), head - min_descent
+        
+        placed = self._place_pairs(free_cells, heads, tail_range, count or self.num_snakes)
+        for head, tail in placed:
+            self.snakes[head] = tail
+        return placed
+    
+    def _place_pairs(self, free_cells, starts, end_range, count):
+        
+        # Pick a random start, then a random free cell in its end range.
+        # free_cells stays sorted, so the free ends are one bisect slice.
+        # Starts that are taken or have no free end are dropped for good:
+        # cells are only ever taken, so they never become usable again.
+        starts = list(starts)
+        taken = set()
+        random_value = self.rng.random
+        
+        placed = []
+        while len(placed) < count and starts:
+            i = int(random_value() * len(starts))
+            start = starts[i]
+            lo = hi = 0
+            if start not in taken:
+                low, high = end_range(start)
+                lo = bisect_left(free_cells, low)
+                hi = bisect_right(free_cells, high)
+            if lo >= hi:
+                # swap with the last start and drop it
+                starts[i] = starts[-1]
+                starts.pop()
                 continue
             
-            # Find valid tail positions
-            valid_tails = [t for t in range(min_tail, head - min_descent + 1) 
-                          if t in available_cells and t > 1]
-            
-            if not valid_tails:
+            end = free_cells[lo + int(random_value() * (hi - lo))]
+            del free_cells[bisect_left(free_cells, start)]
+            del free_cells[bisect_left(free_cells, end)]
+            taken.add(start)
+            taken.add(end)
+            placed.append((start, end))
+        
+        return placed
+    
+    def _fit_difficulty(self, target_moves, target_expected, max_steps):
+        
+        # Local search: move one random snake or ladder somewhere valid and
+        # keep the change unless it takes the board further from the target.
+        # The minimum-moves table is updated incrementally on every change.
+        from min_moves_table import MinMovesTable
+        from markov_chain import MarkovChainSolver
+        
+        table = MinMovesTable(self, verbose=False)
+        table.compute()
+        
+        def miss():
+            score = range_distance(table.moves[1], target_moves)
+            # expected rolls needs a full solve, only check it when the
+            # minimum already fits
+            if score == 0 and target_expected is not None:
+                expected, _ = MarkovChainSolver(self, verbose=False).find_expected_rolls()
+                score = range_distance(expected, target_expected)
+            return score
+        
+        best = miss()
+        steps = 0
+        while best > 0 and steps < max_steps:
+            steps += 1
+            change = self._relocate_random_jump(table)
+            if change is None:
                 continue
-            
-            #random ending position for snake 
-            tail = random.choice(valid_tails)
-            
-            # Add snake
-            self.snakes[head] = tail
-            available_cells.discard(head)
-            available_cells.discard(tail)
-            snake_count += 1
+            score = miss()
+            if score <= best:
+                best = score
+            else:
+                self._undo_relocation(table, change)
+        
+        if self.verbose:
+            status = "✅" if best == 0 else "⚠️  closest"
+            print(f"🎯 Difficulty {status}: {table.moves[1]} min moves after {steps} changes")
+        return best == 0
+    
+    def _relocate_random_jump(self, table):
+        
+        entries = [(self.ladders, base) for base in self.ladders] + \
+                  [(self.snakes, head) for head in self.snakes]
+        if not entries:
+            return None
+        jumps, start = entries[self.rng.randrange(len(entries))]
+        end = jumps.pop(start)
+        table.set_jump(start, start)
+        
+        used = set(self.ladders) | set(self.ladders.values()) | set(self.snakes) | set(self.snakes.values())
+        free_cells = [cell for cell in range(2, self.total_cells) if cell not in used]
+        if jumps is self.ladders:
+            placed = self._generate_ladders(free_cells, count=1)
+        else:
+            placed = self._generate_snakes(free_cells, count=1)
+        
+        if not placed:
+            jumps[start] = end
+            table.set_jump(start, end)
+            return None
+        
+        new_start, new_end = placed[0]
+        table.set_jump(new_start, new_end)
+        return jumps, start, end, new_start
+    
+    def _undo_relocation(self, table, change):
+        
+        jumps, start, end, new_start = change
+        del jumps[new_start]
+        table.set_jump(new_start, new_start)
+        jumps[start] = end
+        table.set_jump(start, end)
     
     def get_position_coordinates(self, cell_num):
         
@@ -167,16 +320,16 @@ class BoardGenerator:
                 'message': f"Need exactly {self.total_cells - current_pos} to win!"
             }
         
-        # Check for ladder at new position
-        if next_pos in self.ladders:
-            final_pos = self.ladders[next_pos]
+        final_pos = self.jump_table[next_pos]
+        
+        # Ladder takes you up
+        if final_pos > next_pos:
             landed_on = 'ladder'
             message = f"🪜 Ladder! Climbed from {next_pos} to {final_pos}"
             print(message)
         
-        # Check for snake at new position
-        elif next_pos in self.snakes:
-            final_pos = self.snakes[next_pos]
+        # Snake brings you down
+        elif final_pos < next_pos:
             landed_on = 'snake'
             message = f"🐍 Snake! Fell from {next_pos} to {final_pos}"
             print(message)
@@ -225,4 +378,24 @@ class BoardGenerator:
         else:
             print("   No ladders generated")
         
-        print(f"{'='*60}\n")
\ No newline at end of file
+        print(f"{'='*60}\n")
+
+def range_distance(value, target_range):
+    
+    # 0 inside the (low, high) range, otherwise how far outside it is
+    if target_range is None:
+        return 0
+    low, high = target_range
+    if value < 0 or value == float('inf'):
+        return float('inf')
+    if value < low:
+        return low - value
+    if value > high:
+        return value - high
+    return 0
+
+def generate_boards(board_size, count, seed=None):
+    
+    # quiet batch generation, e.g. to fill a pool of boards ahead of time
+    rng = random.Random(seed)
+    return [BoardGenerator(board_size, rng=rng, verbose=False) for _ in range(count)]
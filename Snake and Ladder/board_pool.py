@@ -0,0 +1,174 @@
+import json
+import os
+import threading
+
+from algorithm_registry import MARKOV_KEY, run_path_algorithms
+from board_generator import BoardGenerator
+from markov_chain import MarkovChainSolver
+from min_moves_table import MinMovesTable
+
+# Ready-to-play rounds. A background thread keeps a few solved boards per
+# size (layout, algorithm results and the minimum-moves table) and saves
+# them to disk, so starting a round is a pop from the pool instead of
+# generating and solving inside the Tk callback. The file survives between
+# sessions; boards left over from the last run are used first.
+
+POOL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "board_pool")
+POOL_FILE = "board_pool.json"
+
+# ready boards kept per board size
+DEFAULT_TARGET_PER_SIZE = 3
+
+BOARD_SIZES = range(6, 13)
+
+def solve_round(board, verbose=True, names=None):
+
+    # everything a round needs from the algorithms, in the shape the
+    # controller and result screen use; names picks registered path
+    # algorithms (BFS is always run, it gives the answer)
+    if names is not None and 'bfs' not in names:
+        names = ['bfs'] + list(names)
+    algorithm_results = run_path_algorithms(board, names, verbose=verbose)
+
+    markov = MarkovChainSolver(board, verbose=verbose)
+    expected_rolls, markov_time = markov.find_expected_rolls()
+    algorithm_results[MARKOV_KEY] = {
+        'expected': expected_rolls,
+        'median': markov.percentile(50),
+        'p90': markov.percentile(90),
+        'time': markov_time
+    }
+
+    # minimum moves from every cell, used during play and for quizzes
+    moves_table = MinMovesTable(board, verbose=verbose)
+    moves_table.compute()
+    return algorithm_results, moves_table
+
+def make_entry(board_size):
+
+    board = BoardGenerator(board_size, verbose=False)
+    algorithm_results, moves_table = solve_round(board, verbose=False)
+    return {
+        'board_size': board_size,
+        'snakes': board.snakes,
+        'ladders': board.ladders,
+        'algorithm_results': algorithm_results,
+        'moves': moves_table.moves
+    }
+
+def restore_entry(entry):
+
+    # (board, algorithm_results, moves_table) from a pool entry
+    board = BoardGenerator.from_layout(entry['board_size'], entry['snakes'], entry['ladders'])
+    moves_table = MinMovesTable(board, verbose=False)
+    moves_table.moves = list(entry['moves'])
+    return board, entry['algorithm_results'], moves_table
+
+class BoardPool:
+
+    def __init__(self, path=None, target_per_size=DEFAULT_TARGET_PER_SIZE, sizes=BOARD_SIZES):
+
+        self.path = path or os.path.join(POOL_DIR, POOL_FILE)
+        self.target_per_size = target_per_size
+        self.sizes = list(sizes)
+        self._lock = threading.Lock()      # guards entries and the file
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._worker = None
+        self.entries = {size: [] for size in self.sizes}
+        self._load()
+
+    def _load(self):
+
+        try:
+            with open(self.path) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            # no pool yet, or a damaged file: start empty and refill
+            return
+
+        # JSON object keys are strings, board sizes are ints
+        for size, entries in saved.items():
+            if int(size) in self.entries:
+                self.entries[int(size)] = entries[:self.target_per_size]
+
+    def _save(self):
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(self.entries, f)
+        os.replace(temp_path, self.path)
+
+    def count(self, board_size):
+
+        with self._lock:
+            return len(self.entries.get(board_size, []))
+
+    def pop(self, board_size):
+
+        # a ready entry for board_size, or None when the pool is empty
+        with self._lock:
+            entries = self.entries.get(board_size)
+            if not entries:
+                return None
+            entry = entries.pop(0)
+            self._save()
+        self._wake.set()
+        return entry
+
+    def put_back(self, entry):
+
+        # return an entry a round could not use; it is handed out next
+        with self._lock:
+            self.entries[entry['board_size']].insert(0, entry)
+            self._save()
+
+    def add(self, entry):
+
+        with self._lock:
+            self.entries[entry['board_size']].append(entry)
+            self._save()
+
+    def missing_size(self):
+
+        # the emptiest size below target, or None when the pool is full
+        with self._lock:
+            counts = [(len(self.entries[size]), size) for size in self.sizes]
+        count, size = min(counts)
+        return size if count < self.target_per_size else None
+
+    def fill(self):
+
+        # fill every size up to target; returns the number of boards made
+        made = 0
+        size = self.missing_size()
+        while size is not None and not self._stop.is_set():
+            self.add(make_entry(size))
+            made += 1
+            size = self.missing_size()
+        return made
+
+    def start(self):
+
+        if self._worker is not None:
+            return self._worker
+
+        def run():
+            while not self._stop.is_set():
+                try:
+                    self.fill()
+                except Exception as e:
+                    print(f"❌ Board pool error: {e}")
+                # sleep until a pop makes room again
+                self._wake.wait()
+                self._wake.clear()
+
+        self._worker = threading.Thread(target=run, daemon=True)
+        self._worker.start()
+        return self._worker
+
+    def stop(self):
+
+        self._stop.set()
+        self._wake.set()
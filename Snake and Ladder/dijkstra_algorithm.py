@@ -1,28 +1,45 @@
 import heapq
 import time
 
+from board_generator import get_jump_table, new_parent_array, route_dice, trace_path
+
 class DijkstraAlgorithm:
     
-    def __init__(self, board):
+    def __init__(self, board, verbose=True):
         
         self.board = board
         self.total_cells = board.total_cells
         self.snakes = board.snakes
         self.ladders = board.ladders
+        self.jump = get_jump_table(board)
+        self.verbose = verbose
+        
+        # optimal route from the last search: cells rested on and dice rolled
+        self.path = []
+        self.dice = []
     
     def find_minimum_moves(self):
         
-        print("\n🔍 Running Dijkstra's Algorithm...")
+        moves, _, execution_time = self.find_shortest_path()
+        return moves, execution_time
+    
+    def find_shortest_path(self):
+        
+        if self.verbose:
+            print("\n🔍 Running Dijkstra's Algorithm...")
         start_time = time.time()
         
         # Start from cell 1, target is last cell
         start = 1
         target = self.total_cells
+        jump = self.jump
         
         # Dijkstra's initialization
         # Priority queue: (distance/moves, position)
         heap = [(0, start)]
         distances = {start: 0}
+        parent = new_parent_array(target)
+        parent[start] = start
         
         while heap:
             current_moves, current_position = heapq.heappop(heap)
@@ -30,8 +47,11 @@ class DijkstraAlgorithm:
             # Check if reached the target
             if current_position == target:
                 execution_time = time.time() - start_time
-                print(f"✅ Dijkstra Found: {current_moves} moves in {execution_time*1000:.4f}ms")
-                return current_moves, execution_time
+                if self.verbose:
+                    print(f"✅ Dijkstra Found: {current_moves} moves in {execution_time*1000:.4f}ms")
+                self.path = trace_path(parent, start, target)
+                self.dice = route_dice(jump, self.path)
+                return current_moves, self.path, execution_time
             
             # Skip if already found a path 
             if current_position in distances and distances[current_position] < current_moves:
@@ -46,7 +66,7 @@ class DijkstraAlgorithm:
                     continue
                 
                 # Apply snake or ladder
-                final_position = self._apply_snake_or_ladder(next_position)
+                final_position = jump[next_position]
                 
                 # Calculate new distance
                 new_moves = current_moves + 1
@@ -54,25 +74,26 @@ class DijkstraAlgorithm:
                 # If found a shorter path to final_position
                 if final_position not in distances or new_moves < distances[final_position]:
                     distances[final_position] = new_moves
+                    parent[final_position] = current_position
                     heapq.heappush(heap, (new_moves, final_position))
         
         # No path found
         execution_time = time.time() - start_time
-        print(f"❌ Dijkstra: No path found")
-        return -1, execution_time
+        if self.verbose:
+            print(f"❌ Dijkstra: No path found")
+        return -1, [], execution_time
     
-    def _apply_snake_or_ladder(self, position):
-        
-        # Check if there's a ladder at this position
-        if position in self.ladders:
-            return self.ladders[position]
+    def find_optimal_route(self):
         
-        # Check if there's a snake at this position
-        if position in self.snakes:
-            return self.snakes[position]
+        # (cells rested on from start to goal, dice to roll for each step)
+        if not self.path:
+            self.find_shortest_path()
+        return self.path, self.dice
+    
+    def _apply_snake_or_ladder(self, position):
         
-        # No snake or ladder
-        return position
+        # Ladder top, snake tail, or the same cell
+        return self.jump[position]
     
     def get_algorithm_info(self):
     
@@ -82,7 +82,7 @@ class FirebaseDatabase:
             print(f"⚠️  Collection creation: {e}")
     
     def save_game_session(self, player_name, board_size, snakes, ladders, 
-                         player_choice, correct_answer, bfs_time, dijkstra_time):
+                         player_choice, correct_answer, algorithm_times):
         
         if not self.enabled:
             print("⚠️  Firebase not enabled")
@@ -100,8 +100,8 @@ class FirebaseDatabase:
                 'player_choice': player_choice,
                 'correct_answer': correct_answer,
                 'is_correct': player_choice == correct_answer,
-                'bfs_time_ms': round(bfs_time * 1000, 4),
-                'dijkstra_time_ms': round(dijkstra_time * 1000, 4),
+                'algorithm_times_ms': {key: round(seconds * 1000, 4)
+                                       for key, seconds in algorithm_times.items()},
                 'timestamp': firestore.SERVER_TIMESTAMP,
                 'created_at': datetime.now().isoformat()
             }
@@ -3,6 +3,9 @@ from tkinter import messagebox
 from styles import GameStyles
 import math
 
+# delay between steps when the optimal route is drawn
+ROUTE_STEP_MS = 400
+
 class GameBoardUI:
     
     def __init__(self, root, game_state, on_back_callback, on_game_complete_callback):
@@ -22,6 +25,10 @@ class GameBoardUI:
         self.player_text_id = None    # Track player text ID
         self.position_label = None
         self.rolls_label = None
+        self.moves_left_label = None
+        self.route_button = None
+        self.route_items = []   # canvas items of the drawn optimal route
+        self.route_job = None   # pending after() call of the route animation
     
     def show(self):
         #Display the game board screen
@@ -72,6 +79,14 @@ class GameBoardUI:
         )
         self.rolls_label.pack(side=tk.LEFT, padx=20, pady=20)
         
+        self.moves_left_label = tk.Label(
+            header, text=self._moves_left_text(status),
+            font=self.styles.get_font('heading'),
+            bg=self.styles.get_color('bg_dark'),
+            fg=self.styles.get_color('info')
+        )
+        self.moves_left_label.pack(side=tk.LEFT, padx=20, pady=20)
+        
         tk.Button(
             header, text="⬅ New Game",
             font=self.styles.get_font('normal'),
@@ -455,6 +470,76 @@ class GameBoardUI:
         status = self.game_state.get_game_status()
         self.position_label.config(text=f"Position: {status['current_position']}/{status['target_position']}")
         self.rolls_label.config(text=f"Rolls: {status['dice_rolls']}")
+        self.moves_left_label.config(text=self._moves_left_text(status))
+    
+    def _moves_left_text(self, status):
+        
+        # looked up in the precomputed table, no search per roll
+        moves_left = status.get('moves_remaining')
+        if moves_left is None:
+            return ""
+        if moves_left < 0:
+            return "Moves left: -"
+        return f"Moves left: {moves_left}"
+    
+    def _cell_center(self, cell):
+        
+        row, col = self.game_state.board.get_position_coordinates(cell)
+        return col * self.cell_size + self.cell_size // 2, row * self.cell_size + self.cell_size // 2
+    
+    def _on_show_route(self):
+        
+        # second click hides the route again
+        if self.route_items or self.route_job:
+            self._clear_route()
+            return
+        
+        if not self.game_state.optimal_path:
+            messagebox.showinfo("Best Route", "No route was stored for this board.", parent=self.root)
+            return
+        
+        self.route_button.config(text="🧭 HIDE BEST ROUTE")
+        self._draw_route_step(0)
+    
+    def _draw_route_step(self, step):
+        
+        # one roll of the optimal route per call, dice value on the cell it ends on
+        path = self.game_state.optimal_path
+        dice = self.game_state.optimal_dice
+        if step >= len(path) - 1:
+            self.route_job = None
+            return
+        
+        x1, y1 = self._cell_center(path[step])
+        x2, y2 = self._cell_center(path[step + 1])
+        r = max(8, self.cell_size // 6)
+        self.route_items.append(self.canvas.create_line(
+            x1, y1, x2, y2,
+            fill=self.styles.get_color('info'),
+            width=4, arrow=tk.LAST, dash=(6, 3)
+        ))
+        self.route_items.append(self.canvas.create_oval(
+            x2-r, y2-r, x2+r, y2+r,
+            fill=self.styles.get_color('info'),
+            outline='white', width=2
+        ))
+        self.route_items.append(self.canvas.create_text(
+            x2, y2, text=str(dice[step]) if step < len(dice) else "",
+            font=('Arial', r, 'bold'), fill='white'
+        ))
+        
+        self.route_job = self.root.after(ROUTE_STEP_MS, lambda: self._draw_route_step(step + 1))
+    
+    def _clear_route(self):
+        
+        if self.route_job:
+            self.root.after_cancel(self.route_job)
+            self.route_job = None
+        for item in self.route_items:
+            self.canvas.delete(item)
+        self.route_items = []
+        if self.route_button:
+            self.route_button.config(text="🧭 SHOW BEST ROUTE")
     
     def _create_dice_panel(self, parent):
        
@@ -497,6 +582,15 @@ class GameBoardUI:
         )
         self.roll_button.pack(pady=25)
         
+        self.route_button = tk.Button(
+            dice_panel, text="🧭 SHOW BEST ROUTE",
+            font=self.styles.get_font('small'),
+            bg=self.styles.get_color('btn_primary'),
+            fg='white', padx=10, pady=8,
+            cursor='hand2', command=self._on_show_route
+        )
+        self.route_button.pack(pady=(0, 10))
+        
         tk.Label(
             dice_panel, text="Click to roll!",
             font=self.styles.get_font('normal'),
@@ -560,5 +654,8 @@ class GameBoardUI:
     
     def destroy(self):
         
+        if self.route_job:
+            self.root.after_cancel(self.route_job)
+            self.route_job = None
         if self.frame:
             self.frame.destroy() 
\ No newline at end of file
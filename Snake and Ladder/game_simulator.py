@@ -0,0 +1,186 @@
+import random
+import time
+
+from board_generator import BoardGenerator, generate_boards, get_jump_table
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Headless Monte Carlo games. With NumPy a whole batch of games moves
+# together: positions are one int array, the dice come from a NumPy
+# generator and snakes/ladders are a single index into the board's jump
+# table. Without NumPy the same rules run one game at a time.
+
+DEFAULT_BATCH_SIZE = 100000
+
+# games still running after this many rolls are counted as unfinished
+DEFAULT_MAX_ROLLS = 10000
+
+class GameSimulator:
+
+    def __init__(self, board, seed=None):
+
+        self.board = board
+        self.total_cells = board.total_cells
+        self.jump = get_jump_table(board)
+        self.seed = seed
+
+    def simulate(self, num_games, batch_size=DEFAULT_BATCH_SIZE, max_rolls=DEFAULT_MAX_ROLLS):
+
+        start_time = time.time()
+
+        if np is not None:
+            histogram, unfinished = self._simulate_numpy(num_games, batch_size, max_rolls)
+        else:
+            histogram, unfinished = self._simulate(num_games, max_rolls)
+
+        elapsed = time.time() - start_time
+        result = summarize(histogram)
+        result['games'] = num_games
+        result['unfinished'] = unfinished
+        result['time'] = elapsed
+        result['games_per_sec'] = num_games / elapsed if elapsed > 0 else float('inf')
+        return result
+
+    def _simulate_numpy(self, num_games, batch_size, max_rolls):
+
+        target = self.total_cells
+        jump = np.asarray(self.jump, dtype=np.int32)
+        rng = np.random.default_rng(self.seed)
+        histogram = np.zeros(max_rolls + 1, dtype=np.int64)
+        unfinished = 0
+
+        remaining = num_games
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            remaining -= size
+
+            positions = np.full(size, jump[1], dtype=np.int32)
+            rolls = 0
+            while positions.size and rolls < max_rolls:
+                rolls += 1
+                next_positions = positions + rng.integers(1, 7, size=positions.size, dtype=np.int32)
+                # rolling past the last cell keeps the player where they are
+                positions = np.where(next_positions <= target,
+                                     jump[np.minimum(next_positions, target)], positions)
+                finished = positions == target
+                histogram[rolls] += np.count_nonzero(finished)
+                positions = positions[~finished]
+            unfinished += positions.size
+
+        return histogram.tolist(), unfinished
+
+    def _simulate(self, num_games, max_rolls):
+
+        target = self.total_cells
+        jump = self.jump
+        rng = random.Random(self.seed)
+        histogram = [0] * (max_rolls + 1)
+        unfinished = 0
+
+        for _ in range(num_games):
+            position = jump[1]
+            rolls = 0
+            while position != target and rolls < max_rolls:
+                rolls += 1
+                next_position = position + rng.randint(1, 6)
+                if next_position <= target:
+                    position = jump[next_position]
+            if position == target:
+                histogram[rolls] += 1
+            else:
+                unfinished += 1
+
+        return histogram, unfinished
+
+def summarize(histogram):
+
+    # mean, min, max and percentiles of the roll counts in a histogram
+    finished = sum(histogram)
+    if not finished:
+        return {'histogram': histogram, 'mean': None, 'min': None, 'max': None, 'percentiles': {}}
+
+    mean = sum(rolls * count for rolls, count in enumerate(histogram)) / finished
+    observed = [rolls for rolls, count in enumerate(histogram) if count]
+    percentiles = {}
+    for percent in (5, 25, 50, 75, 90, 95, 99):
+        needed = percent / 100 * finished
+        cumulative = 0
+        for rolls, count in enumerate(histogram):
+            cumulative += count
+            if cumulative >= needed:
+                percentiles[percent] = rolls
+                break
+
+    # trim trailing empty buckets so results stay small
+    return {
+        'histogram': histogram[:observed[-1] + 1],
+        'mean': mean,
+        'min': observed[0],
+        'max': observed[-1],
+        'percentiles': percentiles
+    }
+
+def sanity_check(result, min_moves, expected_rolls):
+
+    # a simulation agrees with BFS when no game beats the minimum, and with
+    # the Markov chain when its mean is within a few standard errors
+    histogram = result['histogram']
+    finished = sum(histogram)
+    if not finished:
+        # every game hit the roll cap: only right if the goal is unreachable
+        return {
+            'min_ok': True,
+            'mean_ok': expected_rolls == float('inf'),
+            'standard_error': None
+        }
+    variance = sum(count * (rolls - result['mean']) ** 2
+                   for rolls, count in enumerate(histogram)) / finished
+    standard_error = (variance / finished) ** 0.5
+    return {
+        'min_ok': result['min'] >= min_moves,
+        'mean_ok': abs(result['mean'] - expected_rolls) <= 4 * standard_error + 1e-9,
+        'standard_error': standard_error
+    }
+
+def calibrate_difficulty(board_size, boards=20, games_per_board=20000, seed=None):
+
+    # mean rolls over many random boards of one size; the quartiles split
+    # boards into easy / medium / hard for that size
+    # seed fixes both the boards and the dice
+    means = []
+    for i, board in enumerate(generate_boards(board_size, boards, seed)):
+        simulator = GameSimulator(board, seed=None if seed is None else seed + i)
+        means.append(simulator.simulate(games_per_board)['mean'])
+    means.sort()
+    return {
+        'board_size': board_size,
+        'easy_below': means[len(means) // 4],
+        'hard_above': means[(3 * len(means)) // 4]
+    }
+
+def rate_difficulty(mean_rolls, calibration):
+
+    if mean_rolls < calibration['easy_below']:
+        return 'easy'
+    if mean_rolls > calibration['hard_above']:
+        return 'hard'
+    return 'medium'
+
+if __name__ == "__main__":
+    from bfs_algorithm import BFSAlgorithm
+    from markov_chain import MarkovChainSolver
+
+    board = BoardGenerator(10)
+    result = GameSimulator(board, seed=1).simulate(1000000)
+    min_moves, _ = BFSAlgorithm(board).find_minimum_moves()
+    expected, _ = MarkovChainSolver(board).find_expected_rolls()
+    check = sanity_check(result, min_moves, expected)
+
+    print(f"\n🎲 {result['games']} games in {result['time']:.2f}s ({result['games_per_sec']:,.0f} games/sec)")
+    print(f"   Mean rolls: {result['mean']:.3f} (Markov: {expected:.3f}, ±{check['standard_error']:.3f})")
+    print(f"   Fewest rolls: {result['min']} (BFS: {min_moves})")
+    print(f"   Percentiles: {result['percentiles']}")
+    print(f"   Checks: {'✅' if check['min_ok'] and check['mean_ok'] else '❌'}")
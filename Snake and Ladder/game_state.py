@@ -8,13 +8,17 @@ class GameState:
         self.player_name = ""
         self.board_size = 8
         self.board = None
+        self.moves_table = None  # MinMovesTable for the current board
+        self.optimal_path = []   # shortest route: cells rested on, start to goal
+        self.optimal_dice = []   # dice for each step of that route
         self.session_id = None
         self.current_position = 1
         self.is_game_active = False
         self.move_history = []
         self.dice_rolls = 0
     
-    def start_new_game(self, player_name, board_size):
+    @staticmethod
+    def validate_new_game(player_name, board_size):
         
         # Validate player name
         if not player_name or not player_name.strip():
@@ -23,13 +27,25 @@ class GameState:
         # Validate board size
         if not isinstance(board_size, int) or not 6 <= board_size <= 12:
             raise ValueError("Board size must be between 6 and 12")
+    
+    def start_new_game(self, player_name, board_size, board=None):
+        
+        self.validate_new_game(player_name, board_size)
         
         # Set player info
         self.player_name = player_name.strip()
         self.board_size = board_size
         
-        # Generate NEW board with random snakes and ladders
-        self.board = BoardGenerator(board_size)
+        # Use a prepared board (board pool) or generate a NEW random one
+        if board is not None:
+            if board.board_size != board_size:
+                raise ValueError("Prepared board does not match the board size")
+            self.board = board
+        else:
+            self.board = BoardGenerator(board_size)
+        self.moves_table = None
+        self.optimal_path = []
+        self.optimal_dice = []
         
         # Reset game state
         self.current_position = 1
@@ -88,6 +104,36 @@ class GameState:
             return None
         return self.board.get_board_info()
     
+    def get_moves_remaining(self):
+        
+        # minimum rolls left from the current cell, -1 if the goal is unreachable
+        if not self.moves_table:
+            return None
+        return self.moves_table.moves_from(self.current_position)
+    
+    def compare_with_optimal(self):
+        
+        # player's moves against the shortest route found by the search
+        if not self.optimal_path:
+            return None
+        route = set(self.optimal_path)
+        player_cells = [1] + [move['to'] for move in self.move_history]
+        
+        # first roll where the player left the optimal route
+        left_route_at = None
+        for i, move in enumerate(self.move_history):
+            if i >= len(self.optimal_path) - 1 or move['to'] != self.optimal_path[i + 1]:
+                left_route_at = move['roll']
+                break
+        
+        return {
+            'optimal_rolls': len(self.optimal_path) - 1,
+            'player_rolls': len(self.move_history),
+            'extra_rolls': len(self.move_history) - (len(self.optimal_path) - 1),
+            'cells_on_route': len(route.intersection(player_cells)),
+            'left_route_at': left_route_at
+        }
+    
     def get_game_status(self):
        
         return {
@@ -97,6 +143,7 @@ class GameState:
             'target_position': self.board.total_cells if self.board else 0,
             'is_active': self.is_game_active,
             'dice_rolls': self.dice_rolls,
+            'moves_remaining': self.get_moves_remaining(),
             'progress': (self.current_position / self.board.total_cells * 100) if self.board else 0
         }
     
@@ -105,6 +152,9 @@ class GameState:
         self.player_name = ""
         self.board_size = 8
         self.board = None
+        self.moves_table = None
+        self.optimal_path = []
+        self.optimal_dice = []
         self.session_id = None
         self.current_position = 1
         self.is_game_active = False
@@ -0,0 +1,222 @@
+import time
+
+from board_generator import get_jump_table
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class MarkovChainSolver:
+
+    def __init__(self, board, verbose=True):
+
+        self.board = board
+        self.total_cells = board.total_cells
+        self.snakes = board.snakes
+        self.ladders = board.ladders
+        self.jump = get_jump_table(board)
+
+        self.expected = None
+        self.execution_time = 0
+        self._distributions = {}
+        self.verbose = verbose
+
+    def _next_cells(self, cell):
+
+        # final cell for each dice value; rolling past the end means staying put
+        target = self.total_cells
+        return [self.jump[cell + d] if cell + d <= target else cell for d in range(1, 7)]
+
+    def _doomed_cells(self):
+
+        # cells that can end up somewhere the last cell is unreachable from;
+        # their expected number of rolls is infinite
+        target = self.total_cells
+        predecessors = [[] for _ in range(target + 1)]
+        for cell in range(1, target):
+            for next_cell in set(self._next_cells(cell)):
+                predecessors[next_cell].append(cell)
+
+        reaches_goal = {target}
+        frontier = [target]
+        while frontier:
+            cell = frontier.pop()
+            for previous in predecessors[cell]:
+                if previous not in reaches_goal:
+                    reaches_goal.add(previous)
+                    frontier.append(previous)
+
+        doomed = set(range(1, target + 1)) - reaches_goal
+        frontier = list(doomed)
+        while frontier:
+            cell = frontier.pop()
+            for previous in predecessors[cell]:
+                if previous not in doomed:
+                    doomed.add(previous)
+                    frontier.append(previous)
+        return doomed
+
+    def compute(self):
+
+        if self.verbose:
+            print("\n🔍 Running Markov Chain solver...")
+        start_time = time.time()
+
+        target = self.total_cells
+        doomed = self._doomed_cells()
+        # transient states: resting cells that still finish with probability 1
+        states = [cell for cell in range(1, target)
+                  if self.jump[cell] == cell and cell not in doomed]
+        index = {cell: i for i, cell in enumerate(states)}
+
+        # E[c] = 1 + 1/6 * sum of E[next cell], E[last cell] = 0
+        # -> (I - Q) E = 1 over the transient states
+        if np is not None:
+            values = self._solve_numpy(states, index)
+        else:
+            values = self._solve(states, index)
+
+        expected = [float('inf')] * (target + 1)
+        expected[target] = 0.0
+        for cell, value in zip(states, values):
+            expected[cell] = value
+        for cell in range(1, target + 1):
+            if self.jump[cell] != cell:
+                expected[cell] = expected[self.jump[cell]]
+        self.expected = expected
+
+        self.execution_time = time.time() - start_time
+        if self.verbose:
+            print(f"✅ Markov Found: {expected[1]:.2f} expected rolls in {self.execution_time*1000:.4f}ms")
+        return expected
+
+    def _solve_numpy(self, states, index):
+
+        size = len(states)
+        matrix = np.eye(size)
+        for i, cell in enumerate(states):
+            for next_cell in self._next_cells(cell):
+                if next_cell in index:
+                    matrix[i, index[next_cell]] -= 1 / 6
+        return np.linalg.solve(matrix, np.ones(size)).tolist()
+
+    def _solve(self, states, index):
+
+        # Gaussian elimination with partial pivoting on plain lists
+        size = len(states)
+        rows = []
+        for i, cell in enumerate(states):
+            row = [0.0] * (size + 1)
+            row[i] = 1.0
+            for next_cell in self._next_cells(cell):
+                if next_cell in index:
+                    row[index[next_cell]] -= 1 / 6
+            row[size] = 1.0
+            rows.append(row)
+
+        for col in range(size):
+            pivot = max(range(col, size), key=lambda r: abs(rows[r][col]))
+            rows[col], rows[pivot] = rows[pivot], rows[col]
+            pivot_row = rows[col]
+            for r in range(col + 1, size):
+                factor = rows[r][col] / pivot_row[col]
+                if factor:
+                    row = rows[r]
+                    for c in range(col, size + 1):
+                        row[c] -= factor * pivot_row[c]
+
+        values = [0.0] * size
+        for i in range(size - 1, -1, -1):
+            total = rows[i][size] - sum(rows[i][c] * values[c] for c in range(i + 1, size))
+            values[i] = total / rows[i][i]
+        return values
+
+    def find_expected_rolls(self):
+
+        self.compute()
+        return self.expected[1], self.execution_time
+
+    def expected_from(self, position):
+
+        if self.expected is None:
+            self.compute()
+        if not 1 <= position <= self.total_cells:
+            raise ValueError(f"Cell number must be between 1 and {self.total_cells}")
+        return self.expected[position]
+
+    def length_distribution(self, start=1, max_rolls=1000, tolerance=1e-9):
+
+        # probs[t] = chance the game from start ends on exactly roll t; the
+        # probability mass is pushed one roll at a time over the sparse moves
+        key = (start, max_rolls, tolerance)
+        if key in self._distributions:
+            return self._distributions[key]
+
+        if np is not None:
+            probs = self._distribution_numpy(start, max_rolls, tolerance)
+        else:
+            probs = self._distribution(start, max_rolls, tolerance)
+        self._distributions[key] = probs
+        return probs
+
+    def _distribution_numpy(self, start, max_rolls, tolerance):
+
+        target = self.total_cells
+        successors = np.array([self._next_cells(cell) for cell in range(target + 1)]).ravel()
+        current = np.zeros(target + 1)
+        current[self.jump[start]] = 1.0
+        probs = [float(current[target])]
+        current[target] = 0.0
+        remaining = 1.0 - probs[0]
+
+        rolls = 0
+        while rolls < max_rolls and remaining > tolerance:
+            rolls += 1
+            current = np.bincount(successors, weights=np.repeat(current / 6, 6), minlength=target + 1)
+            finished = current[target]
+            current[target] = 0.0
+            probs.append(float(finished))
+            remaining -= finished
+        return probs
+
+    def _distribution(self, start, max_rolls, tolerance):
+
+        target = self.total_cells
+        current = {self.jump[start]: 1.0}
+        probs = [float(current.pop(target, 0.0))]
+        remaining = 1.0 - probs[0]
+
+        rolls = 0
+        while rolls < max_rolls and remaining > tolerance:
+            rolls += 1
+            following = {}
+            for cell, mass in current.items():
+                share = mass / 6
+                for next_cell in self._next_cells(cell):
+                    following[next_cell] = following.get(next_cell, 0.0) + share
+            finished = following.pop(target, 0.0)
+            probs.append(finished)
+            remaining -= finished
+            current = following
+        return probs
+
+    def percentile(self, percent, start=1):
+
+        # smallest roll count t with P(game length <= t) >= percent
+        cumulative = 0.0
+        probs = self.length_distribution(start)
+        for rolls, prob in enumerate(probs):
+            cumulative += prob
+            if cumulative >= percent / 100:
+                return rolls
+        return None
+
+    def get_algorithm_info(self):
+
+        return {
+            'name': 'Markov Chain (absorbing)',
+            'description': 'Solves for the expected number of rolls from every cell',
+            'complexity': 'O(N^3) linear solve where N is number of cells',
+            'guarantees': 'Exact expected rolls and game-length distribution'
+        }
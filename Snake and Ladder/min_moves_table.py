@@ -0,0 +1,200 @@
+import time
+
+from board_generator import get_jump_table
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class MinMovesTable:
+
+    def __init__(self, board, verbose=True):
+
+        self.board = board
+        self.total_cells = board.total_cells
+        self.snakes = board.snakes
+        self.ladders = board.ladders
+
+        # jump[cell] = where a player landing on cell ends up
+        self.jump = get_jump_table(board)
+
+        self.moves = None
+        self.execution_time = 0
+        self._predecessors = None
+        self.verbose = verbose
+
+    def compute(self):
+
+        if self.verbose:
+            print("\n🔍 Building minimum-moves table...")
+        start_time = time.time()
+
+        if np is not None:
+            self.moves = self._reverse_bfs_numpy()
+        else:
+            self.moves = self._reverse_bfs()
+
+        # a player never rests on a snake head or ladder base,
+        # standing there means standing at the other end
+        for cell in range(1, self.total_cells + 1):
+            if self.jump[cell] != cell:
+                self.moves[cell] = self.moves[self.jump[cell]]
+
+        self.execution_time = time.time() - start_time
+        if self.verbose:
+            print(f"✅ Table built for {self.total_cells} cells in {self.execution_time*1000:.4f}ms")
+        return self.moves
+
+    def _reverse_bfs_numpy(self):
+
+        target = self.total_cells
+        cells = np.arange(target + 1)
+        jump = np.asarray(self.jump)
+
+        # successors[cell, dice - 1] = final cell after that roll,
+        # rolling past the last cell leaves the player where they are
+        steps = cells[:, None] + np.arange(1, 7)[None, :]
+        successors = np.where(steps <= target, jump[np.minimum(steps, target)], cells[:, None])
+
+        moves = np.full(target + 1, -1, dtype=np.int64)
+        moves[target] = 0
+        frontier = np.zeros(target + 1, dtype=bool)
+        frontier[target] = True
+
+        # one level per iteration: every unvisited cell with a roll into
+        # the current frontier is one more move away
+        level = 0
+        while frontier.any():
+            level += 1
+            reached = frontier[successors].any(axis=1) & (moves == -1)
+            reached[0] = False
+            moves[reached] = level
+            frontier = reached
+
+        return moves.tolist()
+
+    def _build_predecessors(self):
+
+        # reverse edges: predecessors[cell] = cells one roll away from it
+        target = self.total_cells
+        predecessors = [[] for _ in range(target + 1)]
+        for cell in range(1, target):
+            for dice_value in range(1, 7):
+                next_position = cell + dice_value
+                if next_position > target:
+                    break
+                predecessors[self.jump[next_position]].append(cell)
+        self._predecessors = predecessors
+        return predecessors
+
+    def _reverse_bfs(self):
+
+        target = self.total_cells
+        moves = [-1] * (target + 1)
+        moves[target] = 0
+        self._resume_bfs(moves, [target], 0)
+        return moves
+
+    def _resume_bfs(self, moves, frontier, level):
+
+        # level-synchronous BFS over the reverse edges, starting from the
+        # cells already known to be `level` moves from the end
+        predecessors = self._predecessors or self._build_predecessors()
+        while frontier:
+            level += 1
+            next_frontier = []
+            for position in frontier:
+                for cell in predecessors[position]:
+                    if moves[cell] == -1:
+                        moves[cell] = level
+                        next_frontier.append(cell)
+            frontier = next_frontier
+
+    def set_jump(self, cell, new_target):
+
+        # Put a ladder/snake on cell (new_target != cell) or remove it
+        # (new_target == cell) and update the table without a full re-solve.
+        # Cells closer than k = min(old value of cell, lower bound for the
+        # new landing) cannot have changed: a path using cell costs more
+        # than k both before and after. Those are kept and the reverse BFS
+        # resumes from level k - 1.
+        if self.moves is None:
+            self.compute()
+        moves = self.moves
+        predecessors = self._predecessors or self._build_predecessors()
+        target = self.total_cells
+        old_target = self.jump[cell]
+        if old_target == new_target:
+            return moves
+
+        infinite = float('inf')
+
+        def distance(value):
+            return infinite if value < 0 else value
+
+        old_value = distance(moves[cell])
+        if new_target == cell:
+            # cell becomes a resting cell; it needs at least one roll more
+            # than its best next cell did before
+            next_values = [distance(moves[self.jump[cell + d]])
+                           for d in range(1, 7) if cell + d <= target]
+            lower_bound = 1 + min(next_values) if next_values else infinite
+        else:
+            lower_bound = distance(moves[new_target])
+        k = min(old_value, lower_bound)
+
+        # rewire the reverse edges of the cells that roll onto cell
+        self.jump[cell] = new_target
+        for previous in range(max(1, cell - 6), cell):
+            predecessors[old_target].remove(previous)
+            predecessors[new_target].append(previous)
+
+        if k == 0:
+            # the new jump lands on the goal, so any cell may have got
+            # closer: keep only the goal and search again from it
+            for c in range(1, target):
+                moves[c] = -1
+            self._resume_bfs(moves, [target], 0)
+        elif k != infinite:
+            frontier = []
+            for c in range(1, target + 1):
+                if self.jump[c] != c or moves[c] >= k:
+                    moves[c] = -1
+                elif moves[c] == k - 1:
+                    frontier.append(c)
+            self._resume_bfs(moves, frontier, k - 1)
+
+        for c in range(1, target + 1):
+            if self.jump[c] != c:
+                moves[c] = moves[self.jump[c]]
+        return moves
+
+    def moves_from(self, position):
+
+        if self.moves is None:
+            self.compute()
+        if not 1 <= position <= self.total_cells:
+            raise ValueError(f"Cell number must be between 1 and {self.total_cells}")
+        return self.moves[position]
+
+    def find_minimum_moves(self):
+
+        # same answer and return shape as the single-source algorithms
+        self.compute()
+        return self.moves[1], self.execution_time
+
+    def resting_cells(self):
+
+        # cells a player can actually stand on before the goal
+        return [cell for cell in range(1, self.total_cells)
+                if self.jump[cell] == cell]
+
+    def get_algorithm_info(self):
+
+        return {
+            'name': 'Reverse BFS (all positions)',
+            'description': 'Works back from the last cell to get the minimum moves from every cell',
+            'complexity': 'O(N) where N is number of cells',
+            'guarantees': 'Shortest path from every cell'
+        }
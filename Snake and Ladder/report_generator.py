@@ -8,6 +8,12 @@ import matplotlib
 matplotlib.use('Agg') 
 import matplotlib.pyplot as plt
 
+from algorithm_registry import MARKOV_KEY, algorithm_label
+
+# chart colours and markers, one per algorithm in the order they appear
+ALGORITHM_COLORS = ['#2ecc71', '#3498db', '#9b59b6', '#e67e22', '#1abc9c', '#e74c3c', '#f1c40f']
+ALGORITHM_MARKERS = ['o', 's', '^', 'D', 'v', 'P', 'X']
+
 class ReportGenerator:
     
     def __init__(self):
@@ -30,7 +36,7 @@ class ReportGenerator:
             print(f"   ⚠️  Could not create report directory: {e}")
     
     def add_game_round(self, player_name, board_size, player_choice, 
-                      correct_answer, is_correct, bfs_time, dijkstra_time, dice_rolls):
+                      correct_answer, is_correct, algorithm_times, dice_rolls):
         
         round_data = {
             'round_number': len(self.rounds) + 1,
@@ -42,8 +48,8 @@ class ReportGenerator:
             'correct_answer': correct_answer,
             'is_correct': is_correct,
             'difference': abs(player_choice - correct_answer),
-            'bfs_time_ms': round(bfs_time * 1000, 4),
-            'dijkstra_time_ms': round(dijkstra_time * 1000, 4),
+            'algorithm_times_ms': {key: round(seconds * 1000, 4)
+                                   for key, seconds in algorithm_times.items()},
             'dice_rolls': dice_rolls
         }
         
@@ -119,12 +125,12 @@ class ReportGenerator:
             print(f"   ⚠️  No rounds to export")
             return
         
-        # Define CSV headers
+        # Define CSV headers, one time column per algorithm
+        algorithm_keys = self._algorithm_keys()
         headers = [
             'Round', 'Timestamp', 'Player', 'Board Size', 'Cells',
-            'Prediction', 'Correct', 'Is Correct', 'Difference',
-            'BFS Time (ms)', 'Dijkstra Time (ms)', 'Dice Rolls'
-        ]
+            'Prediction', 'Correct', 'Is Correct', 'Difference'
+        ] + [f"{algorithm_label(key)} Time (ms)" for key in algorithm_keys] + ['Dice Rolls']
         
         try:
             with open(filename, 'w', newline='') as f:
@@ -141,11 +147,9 @@ class ReportGenerator:
                         round_data['player_choice'],
                         round_data['correct_answer'],
                         'Yes' if round_data['is_correct'] else 'No',
-                        round_data['difference'],
-                        round_data['bfs_time_ms'],
-                        round_data['dijkstra_time_ms'],
-                        round_data['dice_rolls']
-                    ])
+                        round_data['difference']
+                    ] + [round_data['algorithm_times_ms'].get(key, '') for key in algorithm_keys]
+                      + [round_data['dice_rolls']])
             
             print(f"   ✅ CSV Report: {filename}")
         
@@ -158,6 +162,10 @@ class ReportGenerator:
         filename = f"{self.report_dir}/statistics_{timestamp}.txt"
         
         summary = self._calculate_summary()
+        algorithm_lines = "\n".join(
+            f"{algorithm_label(key) + ' Avg Time:':<23} {avg_time:.4f} ms"
+            for key, avg_time in summary['avg_algorithm_times'].items()
+        )
         
         stats_text = f"""
 {'='*70}
@@ -178,9 +186,8 @@ Max Difference:         {summary['max_difference']} moves
 
 ALGORITHM PERFORMANCE (Execution Time)
 {'-'*70}
-BFS Average Time:       {summary['avg_bfs_time']:.4f} ms
-Dijkstra Avg Time:      {summary['avg_dijkstra_time']:.4f} ms
-Faster Algorithm:       {summary['fastest_algorithm']}
+{algorithm_lines}
+Fastest Algorithm:      {summary['fastest_algorithm']}
 
 GAME STATISTICS
 {'-'*70}
@@ -216,20 +223,26 @@ Location:    {os.path.abspath(filename)}
         
         try:
             # Extract data
-            rounds_num = [r['round_number'] for r in self.rounds]
-            bfs_times = [r['bfs_time_ms'] for r in self.rounds]
-            dijkstra_times = [r['dijkstra_time_ms'] for r in self.rounds]
+            algorithm_keys = self._algorithm_keys()
             
             # Create figure and axis
             fig, ax = plt.subplots(figsize=(12, 6))
             fig.patch.set_facecolor('#1a1a2e')
             ax.set_facecolor('#16213e')
             
-            # Plot lines
-            ax.plot(rounds_num, bfs_times, marker='o', linestyle='-', linewidth=2.5, 
-                   markersize=8, label='BFS Algorithm', color='#2ecc71')
-            ax.plot(rounds_num, dijkstra_times, marker='s', linestyle='-', linewidth=2.5, 
-                   markersize=8, label='Dijkstra Algorithm', color='#3498db')
+            # Plot one line per algorithm, over the rounds that ran it
+            for i, key in enumerate(algorithm_keys):
+                timed = [r for r in self.rounds if key in r['algorithm_times_ms']]
+                rounds_num = [r['round_number'] for r in timed]
+                times = [r['algorithm_times_ms'][key] for r in timed]
+                color = ALGORITHM_COLORS[i % len(ALGORITHM_COLORS)]
+                ax.plot(rounds_num, times, marker=ALGORITHM_MARKERS[i % len(ALGORITHM_MARKERS)],
+                       linestyle='-', linewidth=2.5, markersize=8,
+                       label=f'{algorithm_label(key)} Algorithm', color=color)
+                
+                # Add value labels on points
+                for r, t in zip(rounds_num, times):
+                    ax.text(r, t, f'{t:.2f}', ha='center', va='bottom', fontsize=8, color=color)
             
             # Customize chart
             ax.set_xlabel('Game Round', fontsize=12, color='#ecf0f1', fontweight='bold')
@@ -254,11 +267,6 @@ Location:    {os.path.abspath(filename)}
             for text in legend.get_texts():
                 text.set_color('#ecf0f1')
             
-            # Add value labels on points
-            for i, (r, b, d) in enumerate(zip(rounds_num, bfs_times, dijkstra_times)):
-                ax.text(r, b, f'{b:.2f}', ha='center', va='bottom', fontsize=8, color='#2ecc71')
-                ax.text(r, d, f'{d:.2f}', ha='center', va='bottom', fontsize=8, color='#3498db')
-            
             plt.tight_layout()
             plt.savefig(filename, dpi=300, facecolor='#1a1a2e', edgecolor='none')
             plt.close()
@@ -312,12 +320,14 @@ Location:    {os.path.abspath(filename)}
             
             ax2.set_facecolor('#16213e')
             
-            algo_names = ['BFS', 'Dijkstra']
-            algo_times = [summary['avg_bfs_time'], summary['avg_dijkstra_time']]
-            algo_colors = ['#2ecc71', '#3498db']
+            avg_times = summary['avg_algorithm_times']
+            algo_names = [algorithm_label(key) for key in avg_times]
+            algo_times = list(avg_times.values())
+            algo_colors = [ALGORITHM_COLORS[i % len(ALGORITHM_COLORS)] for i in range(len(algo_times))]
             
             bars2 = ax2.bar(algo_names, algo_times, color=algo_colors, 
                            edgecolor='#ecf0f1', linewidth=2, width=0.5)
+            ax2.tick_params(axis='x', labelrotation=30)
             
             ax2.set_ylabel('Average Time (milliseconds)', fontsize=12, color='#ecf0f1', fontweight='bold')
             ax2.set_title('Algorithm Speed Comparison\nAverage Execution Time', fontsize=12, 
@@ -340,8 +350,7 @@ Location:    {os.path.abspath(filename)}
             ax2.set_axisbelow(True)
             
             # Add faster algorithm indicator
-            faster = 'BFS' if summary['avg_bfs_time'] < summary['avg_dijkstra_time'] else 'Dijkstra'
-            fig.suptitle(f'⚡ Faster Algorithm: {faster}', fontsize=10, color='#f39c12', 
+            fig.suptitle(f'⚡ Fastest Algorithm: {summary["fastest_algorithm"]}', fontsize=10, color='#f39c12', 
                         fontweight='bold', y=0.98)
             
             plt.tight_layout()
@@ -364,8 +373,7 @@ Location:    {os.path.abspath(filename)}
                 'avg_difference': 0,
                 'min_difference': 0,
                 'max_difference': 0,
-                'avg_bfs_time': 0,
-                'avg_dijkstra_time': 0,
+                'avg_algorithm_times': {},
                 'fastest_algorithm': 'N/A',
                 'avg_dice_rolls': 0,
                 'min_dice_rolls': 0,
@@ -377,13 +385,18 @@ Location:    {os.path.abspath(filename)}
         total = len(self.rounds)
         
         differences = [r['difference'] for r in self.rounds]
-        bfs_times = [r['bfs_time_ms'] for r in self.rounds]
-        dijkstra_times = [r['dijkstra_time_ms'] for r in self.rounds]
         dice_rolls = [r['dice_rolls'] for r in self.rounds]
         board_sizes = [r['board_size'] for r in self.rounds]
         
-        avg_bfs = sum(bfs_times) / len(bfs_times) if bfs_times else 0
-        avg_dijkstra = sum(dijkstra_times) / len(dijkstra_times) if dijkstra_times else 0
+        # average over the rounds that ran each algorithm
+        avg_times = {}
+        for key in self._algorithm_keys():
+            times = [r['algorithm_times_ms'][key] for r in self.rounds if key in r['algorithm_times_ms']]
+            avg_times[key] = sum(times) / len(times)
+        
+        # fastest shortest-path algorithm; the Markov solver answers a different question
+        path_times = {key: t for key, t in avg_times.items() if key != MARKOV_KEY}
+        fastest = algorithm_label(min(path_times, key=path_times.get)) if path_times else 'N/A'
         
         # Find most used board size
         board_size_counts = {}
@@ -399,15 +412,24 @@ Location:    {os.path.abspath(filename)}
             'avg_difference': sum(differences) / len(differences) if differences else 0,
             'min_difference': min(differences) if differences else 0,
             'max_difference': max(differences) if differences else 0,
-            'avg_bfs_time': avg_bfs,
-            'avg_dijkstra_time': avg_dijkstra,
-            'fastest_algorithm': 'BFS' if avg_bfs < avg_dijkstra else 'Dijkstra',
+            'avg_algorithm_times': avg_times,
+            'fastest_algorithm': fastest,
             'avg_dice_rolls': sum(dice_rolls) / len(dice_rolls) if dice_rolls else 0,
             'min_dice_rolls': min(dice_rolls) if dice_rolls else 0,
             'max_dice_rolls': max(dice_rolls) if dice_rolls else 0,
             'most_used_board_size': most_used_board
         }
     
+    def _algorithm_keys(self):
+        
+        # every algorithm timed in any round, in first-seen order
+        keys = []
+        for r in self.rounds:
+            for key in r['algorithm_times_ms']:
+                if key not in keys:
+                    keys.append(key)
+        return keys
+    
     def get_round_count(self):
         return len(self.rounds)
     
@@ -1,5 +1,6 @@
 import tkinter as tk
 from styles import GameStyles
+from algorithm_registry import MARKOV_KEY, algorithm_label, algorithm_times
 
 class ResultScreen:                                                                                                                                                                 
     
@@ -10,10 +11,7 @@ class ResultScreen:
         self.game_state = game_state
         self.player_choice = player_choice
         self.correct_answer = correct_answer
-        self.algorithm_results = algorithm_results or {
-            'bfs': {'time': 0},
-            'dijkstra': {'time': 0}
-        }
+        self.algorithm_results = algorithm_results or {}
         self.on_play_again_callback = on_play_again_callback
         self.on_back_callback = on_back_callback
         self.styles = GameStyles()
@@ -164,6 +162,19 @@ class ResultScreen:
         )
         rolls_val.pack(side=tk.RIGHT)
         
+        # Player's moves against the optimal route
+        comparison = self.game_state.compare_with_optimal()
+        if comparison:
+            route_frame = tk.Frame(details_panel, bg=self.styles.get_color('bg_dark'))
+            route_frame.pack(fill=tk.X)
+            dice_text = " ".join(str(d) for d in self.game_state.optimal_dice)
+            _add_row(route_frame, "Optimal Dice:", dice_text, value_fg=self.styles.get_color('info'), value_font=('Arial', 12, 'bold'))
+            extra = comparison['extra_rolls']
+            extra_color = self.styles.get_color('success') if extra <= 0 else self.styles.get_color('warning')
+            _add_row(route_frame, "Rolls Over Optimal:", f"{extra:+d}", value_fg=extra_color, value_font=('Arial', 13, 'bold'))
+            left_text = f"roll {comparison['left_route_at']}" if comparison['left_route_at'] else "never"
+            _add_row(route_frame, "Left Best Route:", left_text, value_fg=self.styles.get_color('text_muted'), value_font=('Arial', 12, 'bold'))
+        
         # Algorithm performance area
         algo_title = tk.Label(
             details_panel,
@@ -177,10 +188,12 @@ class ResultScreen:
         
         algo_frame = tk.Frame(details_panel, bg=self.styles.get_color('bg_dark'))
         algo_frame.pack(fill=tk.X)
-        bfs_time = f"{self.algorithm_results['bfs']['time']*1000:.2f}ms"
-        dijkstra_time = f"{self.algorithm_results['dijkstra']['time']*1000:.2f}ms"
-        _add_row(algo_frame, "BFS:", bfs_time, value_fg=self.styles.get_color('success'), value_font=('Arial', 13, 'bold'))
-        _add_row(algo_frame, "Dijkstra:", dijkstra_time, value_fg=self.styles.get_color('success'), value_font=('Arial', 13, 'bold'))
+        for key, seconds in algorithm_times(self.algorithm_results).items():
+            algo_time = f"{seconds*1000:.2f}ms"
+            _add_row(algo_frame, f"{algorithm_label(key)}:", algo_time, value_fg=self.styles.get_color('success'), value_font=('Arial', 13, 'bold'))
+        if MARKOV_KEY in self.algorithm_results:
+            markov = self.algorithm_results[MARKOV_KEY]
+            _add_row(algo_frame, "Expected Rolls:", f"{markov['expected']:.1f}", value_fg=self.styles.get_color('info'), value_font=('Arial', 13, 'bold'))
         
         # Small spacer to push content up slightly
         tk.Frame(details_panel, bg=self.styles.get_color('bg_dark'), height=6).pack()
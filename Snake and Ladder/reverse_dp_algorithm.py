@@ -0,0 +1,78 @@
+import time
+
+from board_generator import get_jump_table
+
+class ReverseDPAlgorithm:
+
+    def __init__(self, board, verbose=True):
+
+        self.board = board
+        self.total_cells = board.total_cells
+        self.snakes = board.snakes
+        self.ladders = board.ladders
+        self.jump = get_jump_table(board)
+        self.verbose = verbose
+        self.passes = 0
+
+    def find_minimum_moves(self):
+
+        moves, _, execution_time = self.find_shortest_path()
+        return moves, execution_time
+
+    def find_shortest_path(self):
+
+        if self.verbose:
+            print("\n🔍 Running Reverse DP...")
+        start_time = time.time()
+
+        start = 1
+        target = self.total_cells
+        jump = self.jump
+        infinite = float('inf')
+
+        # moves[cell] = 1 + min(moves after each roll), filled from the last
+        # cell down. Ladders only point forward, but a snake points back to
+        # a cell not filled yet, so sweep again until nothing improves.
+        moves = [infinite] * (target + 1)
+        best_next = [0] * (target + 1)
+        moves[target] = 0
+        self.passes = 0
+        changed = True
+        while changed:
+            changed = False
+            self.passes += 1
+            for cell in range(target - 1, 0, -1):
+                if jump[cell] != cell:
+                    continue
+                for dice_value in range(1, 7):
+                    next_position = cell + dice_value
+                    if next_position > target:
+                        break
+                    final_position = jump[next_position]
+                    if moves[final_position] + 1 < moves[cell]:
+                        moves[cell] = moves[final_position] + 1
+                        best_next[cell] = final_position
+                        changed = True
+
+        execution_time = time.time() - start_time
+        if moves[start] == infinite:
+            if self.verbose:
+                print(f"❌ Reverse DP: No path found")
+            return -1, [], execution_time
+
+        path = [start]
+        while path[-1] != target:
+            path.append(best_next[path[-1]])
+
+        if self.verbose:
+            print(f"✅ Reverse DP Found: {moves[start]} moves in {execution_time*1000:.4f}ms")
+        return moves[start], path, execution_time
+
+    def get_algorithm_info(self):
+
+        return {
+            'name': 'Reverse DP',
+            'description': 'Fills minimum moves from the last cell down, re-sweeping after snakes',
+            'complexity': 'O(N * sweeps) where N is number of cells',
+            'guarantees': 'Shortest path from every cell'
+        }
@@ -6,8 +6,8 @@ from answer_choice_screen import AnswerChoiceScreen
 from game_board_ui import GameBoardUI
 from result_screen import ResultScreen
 from game_state import GameState
-from bfs_algorithm import BFSAlgorithm
-from dijkstra_algorithm import DijkstraAlgorithm
+from board_pool import BoardPool, restore_entry, solve_round
+from algorithm_registry import PATH_ALGORITHMS, algorithm_times
 from firebase_database import FirebaseDatabase
 from report_generator import ReportGenerator
 from styles import GameStyles
@@ -42,6 +42,10 @@ class SnakeLadderGame:
         print("\n📊 Initializing Report Generator...")
         self.report_gen = ReportGenerator()
         
+        # Solved boards prepared in the background
+        self.board_pool = BoardPool()
+        self.board_pool.start()
+        
         # Game state
         self.game_state = GameState()
         self.current_screen = None
@@ -78,26 +82,41 @@ class SnakeLadderGame:
             print(f"👤 Player: {player_name}")
             print(f"📏 Board: {board_size}×{board_size}")
             
-            self.game_state.start_new_game(player_name, board_size)
-            
-            print(f"\n🧮 RUNNING ALGORITHMS...")
-            print("-" * 70)
-            
-            bfs = BFSAlgorithm(self.game_state.board)
-            bfs_moves, bfs_time = bfs.find_minimum_moves()
+            # reject bad input before taking a solved board from the pool
+            self.game_state.validate_new_game(player_name, board_size)
             
-            dijkstra = DijkstraAlgorithm(self.game_state.board)
-            dijkstra_moves, dijkstra_time = dijkstra.find_minimum_moves()
+            entry = self.board_pool.pop(board_size)
+            if entry is not None:
+                print(f"\n📦 USING PREPARED BOARD ({self.board_pool.count(board_size)} left)")
+                try:
+                    board, self.algorithm_results, moves_table = restore_entry(entry)
+                    self.game_state.start_new_game(player_name, board_size, board)
+                except Exception:
+                    self.board_pool.put_back(entry)
+                    raise
+            else:
+                # pool still filling: generate and solve here
+                self.game_state.start_new_game(player_name, board_size)
+                
+                print(f"\n🧮 RUNNING ALGORITHMS...")
+                print("-" * 70)
+                
+                self.algorithm_results, moves_table = solve_round(self.game_state.board)
             
-            self.algorithm_results = {
-                'bfs': {'moves': bfs_moves, 'time': bfs_time},
-                'dijkstra': {'moves': dijkstra_moves, 'time': dijkstra_time}
-            }
+            self.correct_answer = self.algorithm_results['bfs']['moves']
+            expected_rolls = self.algorithm_results['markov']['expected']
+            self.game_state.moves_table = moves_table
             
-            self.correct_answer = bfs_moves
+            # optimal route for the board and result screens, no re-search
+            # (boards saved by older versions have no route stored)
+            bfs_result = self.algorithm_results['bfs']
+            self.game_state.optimal_path = bfs_result.get('path', [])
+            self.game_state.optimal_dice = bfs_result.get('dice', [])
             
             print("-" * 70)
-            print(f"✅ COMPLETE - Minimum: {self.correct_answer}")
+            print(f"✅ COMPLETE - Minimum: {self.correct_answer}, Expected: {expected_rolls:.2f}")
+            if self.game_state.optimal_dice:
+                print(f"🧭 Optimal dice: {self.game_state.optimal_dice}")
             print("="*70)
             
             self.show_answer_choice_screen()
@@ -119,7 +138,8 @@ class SnakeLadderGame:
             self.root,
             self.game_state,
             self.correct_answer,
-            on_choice_callback=self.on_player_choice
+            on_choice_callback=self.on_player_choice,
+            start_position=self.game_state.current_position
         )
         self.current_screen.show()
     
@@ -168,8 +188,7 @@ class SnakeLadderGame:
             player_choice=self.player_choice,
             correct_answer=self.correct_answer,
             is_correct=is_correct,
-            bfs_time=self.algorithm_results['bfs']['time'],
-            dijkstra_time=self.algorithm_results['dijkstra']['time'],
+            algorithm_times=algorithm_times(self.algorithm_results),
             dice_rolls=self.game_state.dice_rolls
         )
         
@@ -185,8 +204,7 @@ class SnakeLadderGame:
                 ladders=self.game_state.board.ladders,
                 player_choice=self.player_choice,
                 correct_answer=self.correct_answer,
-                bfs_time=self.algorithm_results['bfs']['time'],
-                dijkstra_time=self.algorithm_results['dijkstra']['time']
+                algorithm_times=algorithm_times(self.algorithm_results)
             )
             
             if session_id:
@@ -258,7 +276,7 @@ class SnakeLadderGame:
         print("🚀 SNAKE AND LADDER GAME - FINAL VERSION")
         print("="*70)
         print("\n📋 Features:")
-        print("   ✅ BFS & Dijkstra algorithms")
+        print(f"   ✅ Path algorithms: {', '.join(a['label'] for a in PATH_ALGORITHMS.values())}")
         print("   ✅ Firebase Firestore database")
         print("   ✅ Report Generator (15 rounds)")
         print("   ✅ Performance charts (PNG)")
@@ -281,6 +299,7 @@ class SnakeLadderGame:
         print("👋 THANKS FOR PLAYING!")
         print(f"📊 Rounds completed: {self.report_gen.get_round_count()}/15")
         print("="*70 + "\n")
+        self.board_pool.stop()
         self.root.destroy()
 
 
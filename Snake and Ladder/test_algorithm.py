@@ -1,9 +1,21 @@
 import math
+import random
 import time
 import pytest
 
 from bfs_algorithm import BFSAlgorithm
 from dijkstra_algorithm import DijkstraAlgorithm
+import min_moves_table
+import markov_chain
+from markov_chain import MarkovChainSolver
+import game_simulator
+from game_simulator import GameSimulator, calibrate_difficulty, rate_difficulty, sanity_check
+from board_generator import BoardGenerator, generate_boards, get_jump_table, route_dice
+from game_state import GameState
+from answer_choice_screen import AnswerChoiceScreen
+from min_moves_table import MinMovesTable
+from board_pool import BoardPool, make_entry, restore_entry, solve_round
+from algorithm_registry import PATH_ALGORITHMS, algorithm_times, run_path_algorithms
 
 class BoardStub:
     
@@ -119,3 +131,388 @@ def test_performance_small_board_runs_quickly():
     assert elapsed_bfs < 5.0
     assert elapsed_dij < 5.0
     assert bfs_moves == dij_moves
+
+# numpy-backed modules are tested with numpy and with their pure-Python fallback
+
+@pytest.fixture(params=["numpy", "pure_python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+
+    def use(module):
+        # call with the module under test; forces its fallback on the pure_python run
+        if request.param == "pure_python":
+            monkeypatch.setattr(module, "np", None)
+        return request.param
+    return use
+
+# TEST 6: all-positions table agrees with BFS and with itself
+
+@pytest.mark.parametrize("total_cells, snakes, ladders", [
+    (30, {}, {2: 28}),
+    (30, {29: 5}, {}),
+    (100, {17: 7, 54: 34, 62: 19, 98: 79}, {3: 38, 24: 33, 42: 93, 72: 84}),
+])
+def test_min_moves_table_matches_bfs(backend, total_cells, snakes, ladders):
+    backend(min_moves_table)
+    board = BoardStub(total_cells, snakes=snakes, ladders=ladders)
+    table = MinMovesTable(board)
+    moves, table_time = table.find_minimum_moves()
+
+    bfs_moves, _ = BFSAlgorithm(board).find_minimum_moves()
+    assert moves == bfs_moves
+    assert table_time >= 0.0
+
+    # every resting cell is one roll more than its best next cell
+    for cell in table.resting_cells():
+        next_cells = [table.jump[cell + d] for d in range(1, 7) if cell + d <= total_cells]
+        assert table.moves_from(cell) == 1 + min(table.moves_from(c) for c in next_cells)
+
+def test_min_moves_table_unreachable_goal(backend):
+    backend(min_moves_table)
+    # every roll from 1 hits a snake back to 1
+    board = BoardStub(10, snakes={c: 1 for c in range(2, 8)})
+    table = MinMovesTable(board)
+    assert table.find_minimum_moves()[0] == -1
+    assert table.moves_from(9) == 1
+
+# TEST 7: jump table matches the snake and ladder dicts
+
+def test_jump_table_for_stub_board():
+    board = BoardStub(30, snakes={29: 5}, ladders={2: 28})
+    jump = get_jump_table(board)
+    assert len(jump) == 31
+    assert jump[2] == 28 and jump[29] == 5 and jump[10] == 10
+
+def test_generated_board_moves_use_jump_table():
+    board = BoardGenerator(10)
+    for head, tail in board.snakes.items():
+        assert board.jump_table[head] == tail
+    for base, top in board.ladders.items():
+        assert board.jump_table[base] == top
+
+    for start in range(1, board.total_cells):
+        for dice in range(1, 7):
+            result = board.get_next_position(start, dice)
+            landed = start + dice
+            if landed > board.total_cells:
+                assert result['final_pos'] == start
+            elif landed in board.ladders:
+                assert (result['landed_on'], result['final_pos']) == ('ladder', board.ladders[landed])
+            elif landed in board.snakes:
+                assert (result['landed_on'], result['final_pos']) == ('snake', board.snakes[landed])
+            else:
+                assert (result['landed_on'], result['final_pos']) == (None, landed)
+
+# TEST 8: Markov chain expected rolls and game-length distribution
+
+def test_markov_two_cell_board(backend):
+    backend(markov_chain)
+    # from cell 1 only a roll of 1 finishes: 6 rolls expected, geometric length
+    solver = MarkovChainSolver(BoardStub(2))
+    expected, markov_time = solver.find_expected_rolls()
+    assert expected == pytest.approx(6.0)
+    assert markov_time >= 0.0
+
+    probs = solver.length_distribution()
+    assert probs[1] == pytest.approx(1 / 6)
+    assert probs[2] == pytest.approx(5 / 36)
+
+def test_markov_distribution_matches_expected(backend):
+    backend(markov_chain)
+    board = BoardStub(100, snakes={17: 7, 54: 34, 62: 19, 98: 79},
+                      ladders={3: 38, 24: 33, 42: 93, 72: 84})
+    solver = MarkovChainSolver(board)
+    expected, _ = solver.find_expected_rolls()
+
+    probs = solver.length_distribution()
+    assert sum(probs) == pytest.approx(1.0, abs=1e-6)
+    assert sum(t * p for t, p in enumerate(probs)) == pytest.approx(expected, rel=1e-4)
+
+    # nothing can finish faster than the minimum from BFS
+    bfs_moves, _ = BFSAlgorithm(board).find_minimum_moves()
+    assert all(p == 0 for p in probs[:bfs_moves])
+    assert probs[bfs_moves] > 0
+    assert solver.percentile(50) <= solver.percentile(90)
+
+def test_markov_unreachable_goal_is_infinite(backend):
+    backend(markov_chain)
+    board = BoardStub(10, snakes={c: 1 for c in range(2, 8)})
+    solver = MarkovChainSolver(board)
+    assert solver.find_expected_rolls()[0] == float('inf')
+    assert solver.expected_from(9) == pytest.approx(6.0)
+
+# TEST 9: Monte Carlo simulator agrees with BFS and the Markov chain
+
+def test_simulator_matches_exact_answers(backend):
+    board = BoardStub(100, snakes={17: 7, 54: 34, 62: 19, 98: 79},
+                      ladders={3: 38, 24: 33, 42: 93, 72: 84})
+    games = 200000 if backend(game_simulator) == "numpy" else 20000
+    result = GameSimulator(board, seed=7).simulate(games, batch_size=50000)
+
+    assert sum(result['histogram']) + result['unfinished'] == games
+    assert result['games_per_sec'] > 0
+    assert result['percentiles'][50] <= result['percentiles'][95]
+
+    min_moves, _ = BFSAlgorithm(board).find_minimum_moves()
+    expected, _ = MarkovChainSolver(board).find_expected_rolls()
+    check = sanity_check(result, min_moves, expected)
+    assert check['min_ok'] and check['mean_ok']
+
+def test_simulator_counts_unfinished_games(backend):
+    backend(game_simulator)
+    board = BoardStub(10, snakes={c: 1 for c in range(2, 8)})
+    result = GameSimulator(board, seed=1).simulate(100, max_rolls=50)
+    assert result['unfinished'] == 100
+    assert result['mean'] is None
+
+def test_sanity_check_without_finished_games(backend):
+    backend(game_simulator)
+    board = BoardStub(10, snakes={c: 1 for c in range(2, 8)})
+    result = GameSimulator(board, seed=1).simulate(50, max_rolls=20)
+    check = sanity_check(result, -1, float('inf'))
+    assert check['mean_ok'] and check['standard_error'] is None
+    assert not sanity_check(result, 3, 4.5)['mean_ok']
+
+def test_calibrate_difficulty_is_repeatable(backend, capsys):
+    backend(game_simulator)
+    first = calibrate_difficulty(6, boards=4, games_per_board=500, seed=3)
+    second = calibrate_difficulty(6, boards=4, games_per_board=500, seed=3)
+    assert first == second
+    assert first['easy_below'] <= first['hard_above']
+    assert capsys.readouterr().out == ""
+
+def test_rate_difficulty():
+    calibration = {'easy_below': 20, 'hard_above': 30}
+    assert rate_difficulty(15, calibration) == 'easy'
+    assert rate_difficulty(25, calibration) == 'medium'
+    assert rate_difficulty(35, calibration) == 'hard'
+
+# TEST 10: generator fills every snake and ladder and keeps the rules
+
+@pytest.mark.parametrize("board_size", range(6, 13))
+def test_generated_boards_follow_rules(board_size):
+    total = board_size * board_size
+    climb = max(5, board_size)
+    for board in generate_boards(board_size, 200, seed=board_size):
+        assert len(board.ladders) == board_size - 2
+        assert len(board.snakes) == board_size - 2
+
+        cells = list(board.ladders) + list(board.ladders.values()) + \
+            list(board.snakes) + list(board.snakes.values())
+        assert len(set(cells)) == len(cells)
+        assert all(1 < cell < total for cell in cells)
+
+        for base, top in board.ladders.items():
+            assert base <= total - 2 * board_size
+            assert base + climb <= top <= base + 3 * board_size
+        for head, tail in board.snakes.items():
+            assert head >= total // 3
+            assert head - 3 * board_size <= tail <= head - climb
+
+def test_generate_boards_is_repeatable():
+    first = [b.snakes for b in generate_boards(8, 5, seed=3)]
+    second = [b.snakes for b in generate_boards(8, 5, seed=3)]
+    assert first == second
+
+# TEST 11: incremental table updates and target-difficulty boards
+
+def test_set_jump_matches_full_rebuild(backend):
+    backend(min_moves_table)
+    rng = random.Random(5)
+    board = BoardStub(100)
+    table = MinMovesTable(board, verbose=False)
+    table.compute()
+
+    for _ in range(200):
+        cell = rng.randrange(2, 100)
+        if table.jump[cell] != cell:
+            table.set_jump(cell, cell)
+        else:
+            # include the goal: a jump onto it can shorten every cell
+            end = rng.randrange(2, 101)
+            in_use = {c for c in range(1, 101) if table.jump[c] != c} | \
+                {table.jump[c] for c in range(1, 101) if table.jump[c] != c}
+            if end == cell or end in in_use or cell in in_use:
+                continue
+            table.set_jump(cell, end)
+
+        rebuilt = MinMovesTable(BoardStub(100), verbose=False)
+        rebuilt.jump = table.jump[:]
+        assert table.moves == rebuilt.compute()
+
+def test_board_hits_target_moves():
+    for seed in range(5):
+        board = BoardGenerator(10, rng=random.Random(seed), verbose=False, target_moves=(4, 5))
+        assert board.difficulty_met
+        assert 4 <= BFSAlgorithm(board).find_minimum_moves()[0] <= 5
+        assert len(board.snakes) == 8 and len(board.ladders) == 8
+        # the board's own jump table was kept in step with the moves
+        assert list(board.jump_table) == list(get_jump_table(BoardStub(100, board.snakes, board.ladders)))
+
+def test_board_hits_target_expected_rolls():
+    board = BoardGenerator(12, rng=random.Random(2), verbose=False,
+                           target_moves=(5, 6), target_expected=(40, 60))
+    assert board.difficulty_met
+    expected, _ = MarkovChainSolver(board, verbose=False).find_expected_rolls()
+    assert 40 <= expected <= 60
+
+def test_unreachable_target_keeps_a_full_board():
+    # no 6x6 board can be finished in 2 rolls
+    board = BoardGenerator(6, rng=random.Random(1), verbose=False,
+                           target_moves=(2, 2), max_search_steps=200)
+    assert board.difficulty_met is False
+    assert len(board.snakes) == 4 and len(board.ladders) == 4
+
+def test_incomplete_placement_is_flagged_quietly(monkeypatch, capsys):
+    assert BoardGenerator(6, rng=random.Random(1), verbose=False).placement_complete
+
+    # snakes never fit: the board is flagged instead of printing when quiet
+    monkeypatch.setattr(BoardGenerator, "_generate_snakes", lambda self, free_cells: None)
+    board = BoardGenerator(6, rng=random.Random(1), verbose=False)
+    assert board.placement_complete is False
+    assert capsys.readouterr().out == ""
+
+# TEST 12: board pool hands out solved boards and survives a restart
+
+def test_from_layout_rebuilds_the_board():
+    board = BoardGenerator(8, rng=random.Random(4), verbose=False)
+    copy = BoardGenerator.from_layout(8, {str(k): v for k, v in board.snakes.items()}, board.ladders)
+    assert copy.snakes == board.snakes and copy.ladders == board.ladders
+    assert list(copy.jump_table) == list(board.jump_table)
+
+def test_pool_entry_restores_solved_round():
+    board, results, table = restore_entry(make_entry(7))
+    assert results['bfs']['moves'] == BFSAlgorithm(board).find_minimum_moves()[0]
+    assert results['dijkstra']['moves'] == results['bfs']['moves']
+    assert table.moves_from(1) == results['bfs']['moves']
+
+def test_pool_fills_pops_and_persists(tmp_path):
+    path = str(tmp_path / "pool.json")
+    pool = BoardPool(path, target_per_size=2, sizes=[6, 9])
+    assert pool.pop(6) is None
+    assert pool.fill() == 4
+    assert pool.count(6) == 2 and pool.count(9) == 2
+
+    entry = pool.pop(9)
+    assert entry['board_size'] == 9
+    assert pool.missing_size() == 9
+
+    # an entry a round could not use goes back to the front
+    pool.put_back(entry)
+    assert pool.pop(9) is entry
+    pool.put_back(entry)
+    pool.pop(9)
+
+    reloaded = BoardPool(path, target_per_size=2, sizes=[6, 9])
+    assert reloaded.count(6) == 2 and reloaded.count(9) == 1
+    board, _, _ = restore_entry(reloaded.pop(6))
+    assert board.board_size == 6
+
+def test_validate_new_game():
+    GameState.validate_new_game("piyumi", 8)
+    with pytest.raises(ValueError):
+        GameState.validate_new_game("  ", 8)
+    with pytest.raises(ValueError):
+        GameState.validate_new_game("piyumi", 13)
+
+# TEST 13: every registered path algorithm gives the same shortest path
+
+def _check_path(board, moves, path):
+    jump = get_jump_table(board)
+    assert len(path) == moves + 1
+    assert path[0] == 1 and path[-1] == board.total_cells
+    for cell, next_cell in zip(path, path[1:]):
+        assert any(jump[cell + d] == next_cell for d in range(1, 7) if cell + d <= board.total_cells)
+
+@pytest.mark.parametrize("total_cells, snakes, ladders", [
+    (36, {}, {}),
+    (100, {98: 2, 95: 13, 62: 19}, {3: 51, 6: 27, 20: 70, 36: 55, 63: 94}),
+    (64, {40: 5, 55: 30}, {2: 38, 10: 62}),
+])
+def test_registered_algorithms_agree(total_cells, snakes, ladders):
+    board = BoardStub(total_cells, snakes, ladders)
+    expected = BFSAlgorithm(board, verbose=False).find_minimum_moves()[0]
+    results = run_path_algorithms(board, verbose=False)
+    assert set(results) == set(PATH_ALGORITHMS)
+    for result in results.values():
+        assert result['moves'] == expected
+        _check_path(board, result['moves'], result['path'])
+
+def test_registered_algorithms_agree_on_generated_boards():
+    for board in generate_boards(10, 30, seed=11):
+        results = run_path_algorithms(board, verbose=False)
+        assert len({result['moves'] for result in results.values()}) == 1
+        for result in results.values():
+            _check_path(board, result['moves'], result['path'])
+
+def test_registered_algorithms_unreachable_goal():
+    # every cell from 2 to 7 sends the player back to 1
+    board = BoardStub(10, snakes={c: 1 for c in range(2, 8)})
+    for result in run_path_algorithms(board, verbose=False).values():
+        assert result['moves'] == -1 and result['path'] == []
+
+def test_run_path_algorithms_subset():
+    board = BoardStub(36)
+    assert set(run_path_algorithms(board, ['astar', 'reverse_dp'], verbose=False)) == {'astar', 'reverse_dp'}
+    with pytest.raises(ValueError):
+        run_path_algorithms(board, ['nope'], verbose=False)
+
+def test_algorithm_times_follow_the_round():
+    # a round without Dijkstra still reports every algorithm it ran, Markov last
+    algorithm_results, _ = solve_round(BoardStub(36, ladders={2: 30}), verbose=False, names=['astar'])
+    times = algorithm_times(algorithm_results)
+    assert list(times) == ['bfs', 'astar', 'markov']
+    assert times['astar'] == algorithm_results['astar']['time']
+
+# TEST 14: BFS and Dijkstra keep the optimal route and its dice
+
+@pytest.mark.parametrize("algorithm_class", [BFSAlgorithm, DijkstraAlgorithm])
+def test_optimal_route_replays_to_goal(algorithm_class):
+    board = BoardStub(100, {98: 2, 95: 13, 62: 19}, {3: 51, 6: 27, 20: 70, 36: 55, 63: 94})
+    algorithm = algorithm_class(board, verbose=False)
+    moves, _ = algorithm.find_minimum_moves()
+    path, dice = algorithm.find_optimal_route()
+    assert len(path) == len(dice) + 1 == moves + 1
+
+    # rolling the dice sequence from cell 1 walks the path
+    jump = get_jump_table(board)
+    position = 1
+    for step, value in enumerate(dice):
+        position = jump[position + value]
+        assert position == path[step + 1]
+    assert position == 100
+
+def test_route_dice_picks_smallest_roll():
+    # from cell 1 a roll of 2 climbs the ladder to 5 and a roll of 4 lands
+    # on 5 directly; the smaller roll is reported
+    jump = get_jump_table(BoardStub(12, ladders={3: 5}))
+    assert route_dice(jump, [1, 5, 11, 12]) == [2, 6, 1]
+
+def test_compare_with_optimal():
+    state = GameState()
+    state.optimal_path = [1, 5, 11, 12]
+    state.move_history = [{'roll': 1, 'to': 5}, {'roll': 2, 'to': 9},
+                          {'roll': 3, 'to': 11}, {'roll': 4, 'to': 12}]
+    comparison = state.compare_with_optimal()
+    assert comparison['optimal_rolls'] == 3
+    assert comparison['extra_rolls'] == 1
+    assert comparison['left_route_at'] == 2
+    assert comparison['cells_on_route'] == 4
+
+    state.move_history = [{'roll': 1, 'to': 5}, {'roll': 2, 'to': 11}, {'roll': 3, 'to': 12}]
+    assert state.compare_with_optimal()['left_route_at'] is None
+    state.optimal_path = []
+    assert state.compare_with_optimal() is None
+
+def test_answer_choices_follow_start_cell():
+    state = GameState()
+    state.moves_table = MinMovesTable(BoardStub(36, ladders={2: 30}), verbose=False)
+    state.moves_table.compute()
+
+    screen = AnswerChoiceScreen(None, state, None, None, start_position=3)
+    assert screen.correct_answer == state.moves_table.moves_from(3)
+    assert screen.correct_answer in screen.choices
+    assert AnswerChoiceScreen(None, state, 2, None).correct_answer == 2
+    with pytest.raises(ValueError):
+        AnswerChoiceScreen(None, state, 2, None, start_position=3)
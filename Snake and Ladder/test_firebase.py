@@ -47,7 +47,7 @@ def test_save_game_session():
     db.db = mock_db
 
     session_id = db.save_game_session(
-        "Alice", 5, {}, {}, 3, 3, 0.01, 0.02
+        "Alice", 5, {}, {}, 3, 3, {'bfs': 0.01, 'dijkstra': 0.02}
     )
 
     assert session_id == "session_1"
@@ -0,0 +1,85 @@
+from collections import deque
+import time
+
+from board_generator import get_jump_table, trace_path
+
+class ZeroOneBFSAlgorithm:
+
+    def __init__(self, board, verbose=True):
+
+        self.board = board
+        self.total_cells = board.total_cells
+        self.snakes = board.snakes
+        self.ladders = board.ladders
+        self.jump = get_jump_table(board)
+        self.verbose = verbose
+
+    def find_minimum_moves(self):
+
+        moves, _, execution_time = self.find_shortest_path()
+        return moves, execution_time
+
+    def find_shortest_path(self):
+
+        if self.verbose:
+            print("\n🔍 Running 0-1 BFS...")
+        start_time = time.time()
+
+        start = 1
+        target = self.total_cells
+        jump = self.jump
+        infinite = float('inf')
+
+        # Every cell is a node. A dice roll is an edge of weight 1, a snake
+        # or ladder is an edge of weight 0 from its start to its end, so
+        # zero-weight moves go to the front of the deque.
+        distances = [infinite] * (target + 1)
+        parent = [0] * (target + 1)
+        distances[start] = 0
+        parent[start] = start
+        queue = deque([start])
+
+        while queue:
+            cell = queue.popleft()
+            if cell == target:
+                break
+
+            if jump[cell] != cell:
+                final_position = jump[cell]
+                if distances[cell] < distances[final_position]:
+                    distances[final_position] = distances[cell]
+                    parent[final_position] = cell
+                    queue.appendleft(final_position)
+                continue
+
+            new_moves = distances[cell] + 1
+            for dice_value in range(1, 7):
+                next_position = cell + dice_value
+                if next_position > target:
+                    break
+                if new_moves < distances[next_position]:
+                    distances[next_position] = new_moves
+                    parent[next_position] = cell
+                    queue.append(next_position)
+
+        execution_time = time.time() - start_time
+        if distances[target] == infinite:
+            if self.verbose:
+                print(f"❌ 0-1 BFS: No path found")
+            return -1, [], execution_time
+
+        # keep the cells the player rests on, not snake heads/ladder bases
+        path = [cell for cell in trace_path(parent, start, target) if jump[cell] == cell]
+        moves = distances[target]
+        if self.verbose:
+            print(f"✅ 0-1 BFS Found: {moves} moves in {execution_time*1000:.4f}ms")
+        return moves, path, execution_time
+
+    def get_algorithm_info(self):
+
+        return {
+            'name': '0-1 BFS',
+            'description': 'BFS on a deque with free (0-weight) snake and ladder edges',
+            'complexity': 'O(N) where N is number of cells',
+            'guarantees': 'Shortest path'
+        }